@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import tracemalloc
+
+
+def peak_allocated_bytes(func, *args) -> int:
+    """Bytes allocated at peak while running func(*args), after a warm-up call."""
+    func(*args)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import timeit
+
+from ctypes import addressof, byref, c_void_p
+
+import vtable_backend
+
+from bench_com_types import report
+from com_server import S_OK, COMServer
+from iunknown import IUnknown
+
+NUMBER = 100_000
+
+
+class FileOpenDialog(COMServer):
+    _com_interfaces_ = [vtable_backend.bindings().IFileOpenDialog, vtable_backend.bindings().IShellItemFilter]
+
+
+def scanning_query_interface(server: COMServer, riid, ppv: int) -> int:
+    """QueryInterface the way a server without a table answers it: walk the interfaces and their bases on every call."""
+    for index, interface in enumerate(server._com_interfaces_):
+        for klass in interface.__mro__:
+            if klass.__dict__.get("_iid_") == riid:
+                c_void_p.from_address(ppv).value = server._interface_pointers[index]  # noqa: SLF001
+                server.AddRef()
+                return S_OK
+    c_void_p.from_address(ppv).value = None
+    return -2147467262
+
+
+def bench_query_interface(number: int = NUMBER) -> None:
+    bindings = vtable_backend.bindings()
+    server = FileOpenDialog()
+    out = c_void_p()
+    ppv = addressof(out)
+    for label, iid in (("IUnknown", IUnknown._iid_), ("IShellItemFilter", bindings.IShellItemFilter._iid_)):
+        report(f"scanning QI({label}) + Release", timeit.timeit(lambda: scanning_query_interface(server, iid, ppv) or server.Release(), number=number), number)  # noqa: B023
+        report(f"COMServer QI({label}) + Release", timeit.timeit(lambda: server.IUnknown_QueryInterface(None, iid, ppv) or server.Release(), number=number), number)  # noqa: B023
+    missing = bindings.IShellItem._iid_
+    report("scanning QI(IShellItem), E_NOINTERFACE", timeit.timeit(lambda: scanning_query_interface(server, missing, ppv), number=number), number)
+    report("COMServer QI(IShellItem), E_NOINTERFACE", timeit.timeit(lambda: server.IUnknown_QueryInterface(None, missing, ppv), number=number), number)
+
+    # Through the vtable, as a native caller sees it: the foreign call and the callback dominate.
+    unknown = IUnknown.from_address(server.com_pointer())
+    iid = bindings.IFileDialog._iid_
+    report("vtable QI(IFileDialog) + Release", timeit.timeit(lambda: unknown.call("QueryInterface", byref(iid), byref(out)) or unknown.call("Release"), number=number), number)
+    report("vtable AddRef + Release (floor)", timeit.timeit(lambda: unknown.call("AddRef") and unknown.call("Release"), number=number), number)
+
+
+if __name__ == "__main__":
+    bench_query_interface()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import itertools
+import pickle
+import threading
+import time
+import timeit
+import uuid
+import weakref
+
+from ctypes import byref, c_wchar_p
+
+from allocation_testing import peak_allocated_bytes
+from com_types import _GUID_LE_STRUCT, GUID, GUIDInternCache, format_guid, oledll, windll
+from progid import Ole32ProgIDBackend, ProgIDResolver, TableProgIDBackend
+
+NUMBER = 200_000
+SAMPLE_GUID = "{43826D1E-E718-42EE-BC55-A1E261C37BFE}"
+
+
+def report(label: str, seconds: float, number: int = NUMBER) -> None:
+    print(f"{label:<48} {seconds / number * 1e9:>10.1f} ns/op")
+
+
+def string_from_clsid(guid: GUID) -> str:
+    """The old GUID.__str__ implementation, kept here as the baseline."""
+    p = c_wchar_p()
+    windll.ole32.StringFromCLSID(byref(guid), byref(p))
+    result = p.value
+    windll.ole32.CoTaskMemFree(p)
+    return result
+
+
+def bench_str() -> None:
+    guid = GUID(SAMPLE_GUID)
+    data4 = bytes(guid.Data4)
+    report("format_guid(Data1..Data4)", timeit.timeit(lambda: format_guid(guid.Data1, guid.Data2, guid.Data3, data4), number=NUMBER))
+    report("str(GUID) (cached)", timeit.timeit(lambda: str(guid), number=NUMBER))
+    report("repr(GUID) (cached)", timeit.timeit(lambda: repr(guid), number=NUMBER))
+    if windll is None:
+        print("ole32.StringFromCLSID baseline skipped: not on Windows")
+        return
+    report("ole32.StringFromCLSID + CoTaskMemFree", timeit.timeit(lambda: string_from_clsid(guid), number=NUMBER))
+
+
+def bench_construct() -> None:
+    # Interning makes repeated GUID(...) calls hits, so this measures _parse_args, which every construction pays.
+    d1, d2, d3, d4 = GUID.from_string(SAMPLE_GUID)
+    d4_tuple = tuple(d4)
+    raw = tuple(bytes(GUID(SAMPLE_GUID)))
+    report("_parse_args(str)", timeit.timeit(lambda: GUID._parse_args(SAMPLE_GUID), number=NUMBER))
+    report("_parse_args(d1, d2, d3, bytes)", timeit.timeit(lambda: GUID._parse_args(d1, d2, d3, d4), number=NUMBER))
+    report("_parse_args(d1, d2, d3, (8 ints))", timeit.timeit(lambda: GUID._parse_args(d1, d2, d3, d4_tuple), number=NUMBER))
+    report("_parse_args(11 ints)", timeit.timeit(lambda: GUID._parse_args(d1, d2, d3, *d4_tuple), number=NUMBER))
+    report("_parse_args(16 ints)", timeit.timeit(lambda: GUID._parse_args(raw), number=NUMBER))
+    report("GUID(str)", timeit.timeit(lambda: GUID(SAMPLE_GUID), number=NUMBER))
+    report("GUID(d1, d2, d3, bytes)", timeit.timeit(lambda: GUID(d1, d2, d3, d4), number=NUMBER))
+
+
+def bench_bulk(count: int = 50_000, repeat: int = 5) -> None:
+    strings = [f"{{{uuid.uuid4()}}}".upper() for _ in range(count)]
+    report(f"[GUID(s) for s in {count} strings]", timeit.timeit(lambda: [GUID(s) for s in strings], number=repeat), count * repeat)
+    report(f"GUID.parse_many({count} strings)", timeit.timeit(lambda: GUID.parse_many(strings), number=repeat), count * repeat)
+    array = GUID.parse_many(strings)
+    guids = [GUID(s) for s in strings]
+    report(f"[format_guid(...) for {count} GUIDs]", timeit.timeit(lambda: [format_guid(g.Data1, g.Data2, g.Data3, bytes(g.Data4)) for g in guids], number=repeat), count * repeat)
+    report(f"GUID.format_many({count}-element array)", timeit.timeit(lambda: GUID.format_many(array), number=repeat), count * repeat)
+    buffer = bytearray(memoryview(array).cast("B"))
+    report(f"GUID.parse_many(bytearray of {count}) zero-copy", timeit.timeit(lambda: GUID.parse_many(buffer), number=repeat), count * repeat)
+
+
+class SingleLockInternCache:
+    """The old GUID.__new__ interning (one class-wide lock around a WeakValueDictionary), kept here as the baseline."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._instances = weakref.WeakValueDictionary()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._instances:
+                return self._instances[key]
+            instance = factory(key)
+            self._instances[key] = instance
+            return instance
+
+
+def run_threads(cache, keys: list[bytes], threads: int, rounds: int) -> float:
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        start_barrier.wait()
+        for _ in range(rounds):
+            for key in keys:
+                cache.get_or_create(key, GUID.from_buffer_copy)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def bench_intern_contention(threads: int = 8, distinct: int = 2_000, rounds: int = 20) -> None:
+    # Only the keys are kept alive, so the baseline's weak-only table keeps dropping and rebuilding transient GUIDs.
+    keys = [_GUID_LE_STRUCT.pack(*GUID.from_string(f"{{{uuid.uuid4()}}}")) for _ in range(distinct)]
+    operations = threads * distinct * rounds
+    report(f"single lock + WeakValueDictionary, {threads} threads", run_threads(SingleLockInternCache(), keys, threads, rounds), operations)
+    sharded = GUIDInternCache(maxsize=4 * distinct)
+    report(f"GUIDInternCache (16 shards + LRU), {threads} threads", run_threads(sharded, keys, threads, rounds), operations)
+    print(f"GUIDInternCache stats: {sharded.stats()}")
+
+
+def bench_dict_lookup() -> None:
+    interned = GUID(SAMPLE_GUID)
+    fresh = GUID.parse_many([SAMPLE_GUID])[0]  # Equal but not interned, so lookups go through __eq__ as well.
+    table = {GUID(f"{{{uuid.uuid4()}}}"): n for n in range(1_000)}
+    table[interned] = -1
+
+    def lookups(count: int) -> None:
+        for _ in itertools.repeat(None, count):
+            table[interned]
+            table[fresh]
+
+    report("dict[GUID] lookup (interned + equal copy)", timeit.timeit(lambda: lookups(1), number=NUMBER))
+    report("bool(GUID)", timeit.timeit(lambda: bool(interned), number=NUMBER))
+    # The call itself costs a constant few bytes (iterator, frame); a per-lookup allocation would scale with the count.
+    print(f"peak bytes allocated by 1 / 100000 dict lookups: {peak_allocated_bytes(lookups, 1)} / {peak_allocated_bytes(lookups, 100_000)}")
+
+
+def bench_interop(count: int = 10_000, repeat: int = 5) -> None:
+    guids = [GUID(f"{{{uuid.uuid4()}}}") for _ in range(count)]
+    payload = pickle.dumps(guids, protocol=pickle.HIGHEST_PROTOCOL)
+    as_strings = pickle.dumps([str(guid) for guid in guids], protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"pickled size per GUID: {len(payload) / count:.1f} bytes (as strings: {len(as_strings) / count:.1f} bytes)")
+    report(f"pickle.dumps({count} GUIDs)", timeit.timeit(lambda: pickle.dumps(guids, protocol=pickle.HIGHEST_PROTOCOL), number=repeat), count * repeat)
+    report(f"pickle.loads({count} GUIDs)", timeit.timeit(lambda: pickle.loads(payload), number=repeat), count * repeat)  # noqa: S301
+    sample = guids[0]
+    report("GUID.to_uuid()", timeit.timeit(sample.to_uuid, number=NUMBER))
+    report("uuid.UUID(str(GUID))", timeit.timeit(lambda: uuid.UUID(str(sample)), number=NUMBER))
+    as_uuid = sample.to_uuid()
+    report("GUID.from_uuid()", timeit.timeit(lambda: GUID.from_uuid(as_uuid), number=NUMBER))
+    report("GUID.copy()", timeit.timeit(sample.copy, number=NUMBER))
+
+
+def co_create_guid() -> GUID:
+    """The old GUID.create_new implementation, kept here as the baseline."""
+    guid = GUID.from_buffer_copy(bytes(16))
+    oledll.ole32.CoCreateGuid(byref(guid))
+    return guid
+
+
+def bench_create(count: int = 100_000, repeat: int = 5) -> None:
+    report("GUID.create_new()", timeit.timeit(GUID.create_new, number=NUMBER))
+    report(f"GUID.create_many({count})", timeit.timeit(lambda: GUID.create_many(count), number=repeat), count * repeat)
+    if oledll is None:
+        print("ole32.CoCreateGuid baseline skipped: not on Windows")
+        return
+    report("ole32.CoCreateGuid", timeit.timeit(co_create_guid, number=NUMBER))
+
+
+def bench_progid(count: int = 1_000) -> None:
+    table = {f"Bench.Class{n}": GUID(f"{{{uuid.uuid4()}}}") for n in range(count)}
+    progids = list(table)
+    backend = TableProgIDBackend(table)
+    resolver = ProgIDResolver(backend, maxsize=count)
+    report("TableProgIDBackend.clsid_from_progid (uncached)", timeit.timeit(lambda: backend.clsid_from_progid("Bench.Class0"), number=NUMBER))
+    report("ProgIDResolver.clsid (hit)", timeit.timeit(lambda: resolver.clsid("Bench.Class0"), number=NUMBER))
+    clsid = table["Bench.Class0"]
+    report("ProgIDResolver.progid (hit)", timeit.timeit(lambda: resolver.progid(clsid), number=NUMBER))
+    churn = ProgIDResolver(backend, maxsize=count // 2)  # Cycling through twice the capacity: every lookup evicts.
+    report(f"ProgIDResolver.clsid (evicting, {count} progids)", timeit.timeit(lambda: [churn.clsid(progid) for progid in progids], number=20), count * 20)
+    print(f"ProgIDResolver stats: {resolver.stats()}, evicting: {churn.stats()}")
+    if oledll is None:
+        print("ole32.CLSIDFromProgID baseline skipped: not on Windows")
+        return
+    ole32 = Ole32ProgIDBackend()
+    report("ole32.CLSIDFromProgID (uncached)", timeit.timeit(lambda: ole32.clsid_from_progid("Shell.Application"), number=NUMBER // 10), NUMBER // 10)
+
+
+if __name__ == "__main__":
+    bench_str()
+    bench_construct()
+    bench_bulk()
+    bench_intern_contention()
+    bench_dict_lookup()
+    bench_interop()
+    bench_create()
+    bench_progid()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import fnmatch
+import sys
+import time
+import timeit
+
+from bench_com_types import report
+from filter_specs import COMDLG_FILTERSPEC, compile_filters, filter_set
+
+NUMBER = 20_000
+PATHS = 1_000_000
+# The size of windialogs.DEFAULT_FILTERS.
+FILTERS = [COMDLG_FILTERSPEC(f"Type {index} Files", f"*.ext{index};*.alt{index}") for index in range(50)]
+
+
+def rebuild(filters: list[COMDLG_FILTERSPEC]):
+    """What configureFileDialog did on every dialog before FilterSet."""
+    filter_array = (COMDLG_FILTERSPEC * len(filters))()
+    for i, dialogFilter in enumerate(filters):
+        filter_array[i].pszName = dialogFilter.pszName
+        filter_array[i].pszSpec = dialogFilter.pszSpec
+    return filter_array
+
+
+def bench_filter_sets(number: int = NUMBER) -> None:
+    default_filters = filter_set(FILTERS)
+    report("rebuild the 50-entry array per dialog", timeit.timeit(lambda: rebuild(FILTERS), number=number), number)
+    report("filter_set(list of 50 COMDLG_FILTERSPEC)", timeit.timeit(lambda: filter_set(FILTERS), number=number), number)
+    report("filter_set(FilterSet), DEFAULT_FILTERS", timeit.timeit(lambda: filter_set(default_filters), number=number), number)
+
+
+def fnmatch_many(filters: list[COMDLG_FILTERSPEC], paths: list[str]) -> list[str]:
+    """One fnmatch per pattern per path, the way simulated_shell listed folders before FilterMatcher."""
+    patterns = [pattern.lower() for entry in filters for pattern in entry.pszSpec.split(";")]
+    return [path for path in paths if any(fnmatch.fnmatchcase(path.rsplit("/", 1)[-1].lower(), pattern) for pattern in patterns)]
+
+
+def bench_matcher(count: int = PATHS) -> None:
+    filters = [*FILTERS, COMDLG_FILTERSPEC("Makefiles", "Makefile"), COMDLG_FILTERSPEC("Backups", "*~;backup??.*")]
+    paths = [f"/data/dir{index % 100}/file{index}.ext{index % 120}" for index in range(count)]
+    start = time.perf_counter()
+    matcher = compile_filters(filters)
+    report(f"compile {len(matcher.patterns)} patterns", time.perf_counter() - start, 1)
+    sample = paths[:count // 20]
+    start = time.perf_counter()
+    expected = fnmatch_many(filters, sample)
+    report(f"fnmatch per pattern, {len(sample)} paths", time.perf_counter() - start, len(sample))
+    assert matcher.match_many(sample) == expected
+    start = time.perf_counter()
+    matched = matcher.match_many(paths)
+    report(f"match_many, {count} paths ({len(matched)} match)", time.perf_counter() - start, count)
+
+
+if __name__ == "__main__":
+    bench_filter_sets()
+    bench_matcher(int(sys.argv[1]) if len(sys.argv) > 1 else PATHS)
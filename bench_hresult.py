@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import itertools
+import random
+import time
+
+from array import array
+
+from allocation_testing import peak_allocated_bytes
+from hresult import HRESULT, HRESULT_CODES, S_OK, Cancelled, HRESULTError, _format_hresult, _numpy, decode_hresult, decode_hresults
+
+CHECKS = 1_000_000
+E_FAIL = 0x80004005
+
+
+def report(label: str, seconds: float, number: int = CHECKS) -> None:
+    print(f"{label:<48} {seconds / number * 1e9:>10.1f} ns/op  ({seconds:.3f}s total)")
+
+
+def old_raise_for_status(hresult, short_desc: str = "", *, ignore_s_false: bool = False):
+    """The old HRESULT.raise_for_status implementation, kept here as the baseline."""
+    hr = hresult if isinstance(hresult, HRESULT) else HRESULT(hresult)
+    if (hr == 1 and not ignore_s_false) or hr not in (0, 1):
+        raise hr.exception(short_desc)
+
+
+def timed(func, count: int) -> float:
+    started = time.perf_counter()
+    func(count)
+    return time.perf_counter() - started
+
+
+def bench_status_checks(count: int = CHECKS) -> None:
+    check = HRESULT.check
+
+    def old_checks(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            old_raise_for_status(0)
+
+    def fast_checks(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            check(0)
+
+    def inline_checks(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            if 0 != 0:  # noqa: PLR0133  # What a hand-written `if hr: raise` costs.
+                check(0)
+
+    report(f"old raise_for_status(S_OK) x {count}", timed(old_checks, count), count)
+    report(f"HRESULT.check(S_OK) x {count}", timed(fast_checks, count), count)
+    report(f"inline `if hr:` x {count} (floor)", timed(inline_checks, count), count)
+    print(f"peak bytes allocated by 1 / {count} HRESULT.check(S_OK): {peak_allocated_bytes(fast_checks, 1)} / {peak_allocated_bytes(fast_checks, count)}")
+
+
+def bench_comparisons(count: int = CHECKS) -> None:
+    ok, failure = HRESULT(0), HRESULT(E_FAIL)
+
+    def compare(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            ok == 0  # noqa: B015
+            ok != S_OK  # noqa: B015
+            failure == E_FAIL  # noqa: B015
+
+    def compare_ok(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            ok == 0  # noqa: B015
+            ok != S_OK  # noqa: B015
+
+    report(f"HRESULT ==/!= int and HRESULT x {count}", timed(compare, count), count * 3)
+    print(f"peak bytes allocated by 1 / {count} S_OK comparisons: {peak_allocated_bytes(compare_ok, 1)} / {peak_allocated_bytes(compare_ok, count)}")
+
+
+def bench_construct(count: int = CHECKS // 10) -> None:
+    report(f"HRESULT(int) x {count}", timed(lambda n: [HRESULT(E_FAIL) for _ in itertools.repeat(None, n)], count), count)
+
+
+def bench_decode(count: int = CHECKS // 10) -> None:
+    started = time.perf_counter()
+    HRESULT_CODES.lookup(E_FAIL)
+    print(f"code table load on first failure: {(time.perf_counter() - started) * 1e3:.2f} ms")
+    report(f"HRESULT_CODES.lookup(E_FAIL) x {count}", timed(lambda n: [HRESULT_CODES.lookup(E_FAIL) for _ in itertools.repeat(None, n)], count), count)
+    report(f"decode_hresult(E_FAIL), cached x {count}", timed(lambda n: [decode_hresult(E_FAIL) for _ in itertools.repeat(None, n)], count), count)
+    uncached = _format_hresult.__wrapped__
+    report(f"decode_hresult(E_FAIL), uncached x {count}", timed(lambda n: [uncached(E_FAIL) for _ in itertools.repeat(None, n)], count), count)
+
+
+class EagerHRESULTError(OSError):
+    """The old HRESULTError: HRESULT.exception() decoded the code up front, whether or not anyone read it."""
+
+
+def bench_raise_catch(count: int = CHECKS // 10) -> None:
+    cancelled = 0x800704C7
+    eager_decode = _format_hresult.__wrapped__  # The old decode_hresult had no cache either.
+
+    def eager(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            try:
+                raise EagerHRESULTError(cancelled, eager_decode(cancelled), "Failed to show the file dialog!")
+            except OSError as e:
+                if e.errno != cancelled:
+                    raise
+
+    def lazy(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            try:
+                raise HRESULT(cancelled).exception("Failed to show the file dialog!")
+            except Cancelled:
+                pass
+
+    def lazy_direct(n: int) -> None:
+        for _ in itertools.repeat(None, n):
+            try:
+                raise HRESULTError(cancelled, "Failed to show the file dialog!")
+            except Cancelled:
+                pass
+
+    report(f"raise/catch, eagerly decoded x {count}", timed(eager, count), count)
+    report(f"raise/catch HRESULT(hr).exception() x {count}", timed(lazy, count), count)
+    report(f"raise/catch HRESULTError(hr) x {count}", timed(lazy_direct, count), count)
+
+
+def bench_batch_decode(count: int = CHECKS, repeat: int = 3) -> None:
+    population = [0, 1, E_FAIL, 0x800704C7, 0x80070005, 0x80004002, 0x887A0001, 0x80270000]
+    values = array("I", random.choices(population, k=count))
+    sample = values[: count // 10]
+    report(f"decode_hresult() per value x {len(sample)}", timed(lambda n: [decode_hresult(value) for value in sample], len(sample)), len(sample))
+    report(f"decode_hresults({count}), pure Python", timed(lambda n: [decode_hresults(values, use_numpy=False) for _ in range(n)], repeat), count * repeat)
+    if _numpy() is None:
+        print("decode_hresults NumPy path skipped: numpy is not installed")
+        return
+    report(f"decode_hresults({count}), NumPy", timed(lambda n: [decode_hresults(values, use_numpy=True) for _ in range(n)], repeat), count * repeat)
+
+
+if __name__ == "__main__":
+    bench_status_checks()
+    bench_comparisons()
+    bench_construct()
+    bench_decode()
+    bench_raise_catch()
+    bench_batch_decode()
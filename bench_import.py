@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+REPEAT = 5
+
+# Everything browse_files() needs before it can show a dialog: windialogs, and through it comtypes, interfaces and the
+# interface classes windialogs names at import time.
+COLD_START = "import windialogs"
+# interfaces.py used to build every GUID and define every interface and stub class on import. Materializing all of
+# its lazy names first reproduces that, kept here as the baseline.
+EAGER_COLD_START = "import interfaces; [getattr(interfaces, name) for name in dir(interfaces)]; import windialogs"
+
+MODULES = ("comtypes", "interfaces", "windialogs")
+
+
+def cold_start(code: str) -> tuple[float, dict[str, int]]:
+    """Run `code` in a fresh interpreter under `-X importtime`.
+
+    Returns the wall time of `code` in seconds and the cumulative import time in microseconds of each top-level module,
+    as parsed from the `import time: self [us] | cumulative | imported package` lines.
+    """
+    timed = f"import time; _start = time.perf_counter(); {code}; print(time.perf_counter() - _start)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", timed], capture_output=True, text=True, check=False, cwd=Path(__file__).parent
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:"):].split("|") if line.startswith("import time:") else []  # No removeprefix on 3.8.
+        if len(fields) != 3 or not fields[1].strip().isdigit():  # noqa: PLR2004
+            continue
+        name = fields[2]
+        if not name.startswith("  "):  # Top level: nested imports are indented further.
+            cumulative[name.strip()] = int(fields[1])
+    return float(result.stdout.split()[-1]), cumulative
+
+
+def bench_cold_start(repeat: int = REPEAT) -> None:
+    for label, code in (("import windialogs (lazy interfaces)", COLD_START), ("import windialogs (eager baseline)", EAGER_COLD_START)):
+        try:
+            runs = [cold_start(code) for _ in range(repeat)]
+        except RuntimeError as e:
+            print(f"{label:<48} skipped: {e}")
+            continue
+        seconds, cumulative = min(runs, key=lambda run: run[0])
+        modules = ", ".join(f"{module} {cumulative[module] / 1000:.1f} ms" for module in MODULES if module in cumulative)
+        print(f"{label:<48} {seconds * 1000:>10.1f} ms  ({modules})")
+
+
+def bench_interface_bindings(repeat: int = REPEAT) -> None:
+    # Generating the raw bindings for every shell interface spec, against importing them from the on-disk cache.
+    def load(cache_dir: str) -> str:
+        return f"import interface_compiler, interface_specs; interface_compiler.load_interfaces(interface_specs.SHELL_INTERFACES, 'raw', {cache_dir!r})"
+
+    cold: list[float] = []
+    warm: list[float] = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(cold_start(load(cache_dir))[0])
+            warm += [cold_start(load(cache_dir))[0] for _ in range(2)]  # The first of these also finds the bytecode cached.
+    print(f"{'load_interfaces(raw), empty cache':<48} {min(cold) * 1000:>10.1f} ms")
+    print(f"{'load_interfaces(raw), cached':<48} {min(warm) * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_cold_start()
+    bench_interface_bindings()
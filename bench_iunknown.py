@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+import time
+import timeit
+
+from ctypes import POINTER
+
+from bench_com_types import report
+from iunknown import WINFUNCTYPE, AtomicRefCount, IID_IUnknown, IUnknown, LockedRefCount
+from test_iunknown import FakeUnknown
+
+NUMBER = 100_000
+
+
+def old_call(self: IUnknown, method_name: str, *args):
+    """The old COMBase.call (linear _methods_ scan, a new prototype class per call), kept here as the baseline."""
+    for name, types in self._methods_:
+        if name == method_name:
+            func_type = types
+            break
+    else:
+        raise AttributeError(f"Method '{method_name}' not found in class {self.__class__.__name__}")
+    new_cfunctype = WINFUNCTYPE(func_type[0], *([POINTER(type(self)), *func_type[1:]]))
+    func_ptr = getattr(self.lpVtbl.contents, method_name)
+    new_func_ptr = new_cfunctype(func_ptr)
+    return new_func_ptr(self, *args)
+
+
+def bench_call(number: int = NUMBER) -> None:
+    fake = FakeUnknown()
+    unknown = fake.attach(IUnknown)
+    report("old COMBase.call('AddRef')", timeit.timeit(lambda: old_call(unknown, "AddRef"), number=number // 10), number // 10)
+    report("COMBase.call('AddRef') (dispatch table)", timeit.timeit(lambda: unknown.call("AddRef"), number=number), number)
+    report("COMBase.add_ref()", timeit.timeit(unknown.add_ref, number=number), number)
+    report("COMBase.query_interface(IID_IUnknown)", timeit.timeit(lambda: unknown.query_interface(IID_IUnknown), number=number), number)
+    direct = unknown.lpVtbl.contents.AddRef  # pyright: ignore[reportAttributeAccessIssue]
+    report("vtable field called directly (floor)", timeit.timeit(lambda: direct(unknown), number=number), number)
+
+
+def bench_refcount(number: int = NUMBER, thread_counts: tuple[int, ...] = (1, 4, 8)) -> None:
+    """AddRef/Release pairs on one shared count from several threads at once, as a COM server sees from MTA callers."""
+    for refcount_type in (AtomicRefCount, LockedRefCount):
+        for threads_count in thread_counts:
+            refcount = refcount_type(lambda: None)
+            start = threading.Barrier(threads_count + 1)
+
+            def worker(refcount=refcount, start=start):
+                add_ref, release = refcount.add_ref, refcount.release
+                start.wait()
+                for _ in range(number):
+                    add_ref()
+                    release()
+
+            threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            start.wait()
+            began = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - began
+            assert refcount.count == 1, f"{refcount_type.__name__} lost updates: {refcount.count}"
+            report(f"{refcount_type.__name__} AddRef+Release, {threads_count} thread(s)", elapsed, number * threads_count)
+
+
+if __name__ == "__main__":
+    bench_call()
+    bench_refcount()
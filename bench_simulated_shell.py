@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_com_types import report
+from simulated_shell import (
+    CLSID_FileOpenDialog,
+    FOS_ALLOWMULTISELECT,
+    FOS_FILEMUSTEXIST,
+    SFGAO_FILESYSTEM,
+    SFGAO_FOLDER,
+    SIGDN_FILESYSPATH,
+    create_file_dialog,
+    create_shell_item,
+    select_all,
+)
+
+ITEMS = 100_000
+
+
+def make_folder(root: str, count: int) -> str:
+    folder = os.path.join(root, f"selection{count}")
+    os.mkdir(folder)
+    for index in range(count):
+        open(os.path.join(folder, f"file{index:06}.txt"), "x").close()  # noqa: SIM115
+    return folder
+
+
+def open_dialog(folder: str):
+    dialog = create_file_dialog(CLSID_FileOpenDialog, "IFileOpenDialog", select_all)
+    shell_folder = create_shell_item(folder)
+    dialog.SetFolder(shell_folder)  # pyright: ignore[reportAttributeAccessIssue]
+    shell_folder.Release()
+    dialog.SetOptions(FOS_FILEMUSTEXIST | FOS_ALLOWMULTISELECT)  # pyright: ignore[reportAttributeAccessIssue]
+    return dialog
+
+
+def results(dialog) -> list[str]:
+    """The calls windialogs.getFileOpenDialogResults makes per item, without its prints."""
+    paths: list[str] = []
+    array = dialog.GetResults()
+    for index in range(array.GetCount()):
+        item = array.GetItemAt(index)
+        with item.GetDisplayName(SIGDN_FILESYSPATH) as path:
+            paths.append(str(path))
+        item.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
+        item.GetParent().Release()
+        item.Release()
+    array.Release()
+    return paths
+
+
+def measure(label: str, run, count: int):
+    """Time `run`, then run it again under tracemalloc (which slows it down several times) for its peak memory."""
+    start = time.perf_counter()
+    value = run()
+    report(label, time.perf_counter() - start, count)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{'':<48} {peak / count:>10.1f} B/item peak ({peak / 2**20:.1f} MiB)")
+    return value
+
+
+def bench_pipeline(count: int = ITEMS) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        folder = make_folder(root, count)
+        dialog = open_dialog(folder)
+        measure(f"Show(): list and select {count} items", lambda: dialog.Show(None), count)  # pyright: ignore[reportAttributeAccessIssue]
+        paths = measure(f"results: {count} items through the raw calls", lambda: results(dialog), count)
+        assert len(paths) == count
+
+        try:
+            import windialogs
+        except ImportError as e:
+            print(f"{'windialogs.getFileOpenDialogResults':<48} skipped: {e}")
+        else:
+            windialogs.set_dialog_backend("simulated")
+
+            def quiet_results() -> list[str]:
+                with contextlib.redirect_stdout(io.StringIO()):  # It prints every item; measure() prints the timings.
+                    return windialogs.getFileOpenDialogResults(None, dialog)  # pyright: ignore[reportArgumentType]
+
+            paths = measure("windialogs.getFileOpenDialogResults", quiet_results, count)
+            assert len(paths) == count
+        dialog.Release()
+
+
+if __name__ == "__main__":
+    bench_pipeline(int(sys.argv[1]) if len(sys.argv) > 1 else ITEMS)
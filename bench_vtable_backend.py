@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import timeit
+
+from ctypes import POINTER, byref, c_uint, c_void_p, cast
+
+from bench_com_types import report
+from test_vtable_backend import fake, fake_item
+
+NUMBER = 100_000
+SIGDN_FILESYSPATH = 0x80058000
+
+
+def fake_selection(count: int = 8):
+    """A fake IShellItemArray of `count` fake IShellItems, plus the fakes to keep alive."""
+    items = [fake_item(f"C:\\Users\\user\\file{i}.txt") for i in range(count)]
+
+    def get_count(this, pcount):  # noqa: ARG001
+        pcount[0] = len(items)
+        return 0
+
+    def get_item_at(this, index, ppsi):  # noqa: ARG001
+        unknown, item = items[index]
+        unknown.refcount += 1
+        c_void_p.from_address(ppsi).value = item.address
+        return 0
+
+    keep_alive, array = fake("IShellItemArray", GetCount=get_count, GetItemAt=get_item_at)
+    return array, (keep_alive, items)
+
+
+def bench_backends(number: int = NUMBER) -> None:
+    array, keep_alive = fake_selection()
+    item = array.GetItemAt(0)  # pyright: ignore[reportAttributeAccessIssue]
+
+    count = c_uint()
+    com = array._com
+    report("COMBase.call('GetCount') (floor)", timeit.timeit(lambda: com.call("GetCount", byref(count)), number=number), number)
+    report("raw IShellItemArray.GetCount()", timeit.timeit(array.GetCount, number=number), number)  # pyright: ignore[reportAttributeAccessIssue]
+    report("raw IShellItemArray.GetItemAt(0).Release()", timeit.timeit(lambda: array.GetItemAt(0).Release(), number=number), number)  # pyright: ignore[reportAttributeAccessIssue]
+    report("raw IShellItem.GetDisplayName()", timeit.timeit(lambda: item.GetDisplayName(SIGDN_FILESYSPATH), number=number), number)
+
+    try:
+        from interfaces import IShellItem, IShellItemArray  # noqa: PLC0415  # Needs comtypes.
+    except ImportError as e:
+        print(f"{'comtypes backend':<48} skipped: {e}")
+        return
+    # The same fake objects through comtypes pointers. comtypes releases the pointers it returns when they are
+    # collected, so GetItemAt needs no explicit Release here.
+    comtypes_array = cast(array.address, POINTER(IShellItemArray))
+    comtypes_item = cast(item.address, POINTER(IShellItem))
+    report("comtypes IShellItemArray.GetCount()", timeit.timeit(comtypes_array.GetCount, number=number), number)
+    report("comtypes IShellItemArray.GetItemAt(0)", timeit.timeit(lambda: comtypes_array.GetItemAt(0), number=number), number)
+    report("comtypes IShellItem.GetDisplayName()", timeit.timeit(lambda: comtypes_item.GetDisplayName(SIGDN_FILESYSPATH), number=number), number)
+    del keep_alive
+
+
+if __name__ == "__main__":
+    bench_backends()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+
+from typing import Any
+
+
+class COMCallStats:
+    """Per-call-site counters for checked COM calls (see com_helpers.HandleCOMCall), keyed by call_site() labels.
+
+    For each call site it keeps the number of calls, the number of failures per HRESULT and the last error. Opt-in:
+    nothing is collected until a collector is installed with set_com_call_stats(). Recording a call takes the
+    collector lock and bumps a counter in a preallocated slot, so the success path allocates nothing after the first
+    call from a given site. Failures are rare and may allocate. The table has one slot per label, so callers must pass
+    stable labels ("SetFolder"), not descriptions carrying arguments ("SetFolder(<path>)"), or it grows
+    without bound.
+    """
+
+    class _Site:
+        __slots__ = ("calls", "failures", "last_error")
+
+        def __init__(self):
+            self.calls: int = 0
+            self.failures: dict[int, int] = {}
+            self.last_error: tuple[int, str, str] | None = None
+
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self._sites: dict[str, COMCallStats._Site] = {}
+
+    def _site(self, label: str) -> COMCallStats._Site:
+        site = self._sites.get(label)
+        if site is None:
+            site = self._sites.setdefault(label, self._Site())  # Atomic: racing threads end up sharing one slot.
+        return site
+
+    def record_call(self, label: str) -> None:
+        site = self._site(label)
+        with self._lock:
+            site.calls += 1
+
+    def record_failure(self, label: str, hresult: int, error: BaseException) -> None:
+        hresult &= 0xFFFFFFFF
+        site = self._site(label)
+        description = getattr(error, "short_desc", None) or str(error)
+        with self._lock:
+            site.failures[hresult] = site.failures.get(hresult, 0) + 1
+            site.last_error = (hresult, type(error).__name__, description)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sites.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """A point-in-time copy suitable for export, e.g.
+        {"SetFolder": {"calls": 3, "failures": {"0x80070005": 1}, "failure_count": 1,
+                       "last_error": {"hresult": "0x80070005", "type": "AccessDenied", "description": "..."}}}
+        """
+        with self._lock:
+            sites = [(label, site.calls, dict(site.failures), site.last_error) for label, site in self._sites.items()]
+        snapshot: dict[str, dict[str, Any]] = {}
+        for label, calls, failures, last_error in sites:
+            snapshot[label] = {
+                "calls": calls,
+                "failures": {f"0x{hresult:08X}": count for hresult, count in sorted(failures.items())},
+                "failure_count": sum(failures.values()),
+                "last_error": None if last_error is None else {"hresult": f"0x{last_error[0]:08X}", "type": last_error[1], "description": last_error[2]},
+            }
+        return snapshot
+
+
+def call_site(action_desc: str) -> str:
+    """The stable label of a HandleCOMCall description: the method name without its arguments.
+
+    "SetFolder(<path>)" -> "SetFolder"; a description without arguments ("Show") is its own label, returned as is.
+    """
+    paren = action_desc.find("(")
+    return action_desc if paren < 0 else action_desc[:paren].rstrip()
+
+
+_com_call_stats: COMCallStats | None = None
+
+
+def get_com_call_stats() -> COMCallStats | None:
+    """The installed collector, or None when collection is disabled (the default)."""
+    return _com_call_stats
+
+
+def set_com_call_stats(stats: COMCallStats | None) -> COMCallStats | None:
+    """Install `stats` as the collector used by HandleCOMCall (None disables collection). Returns the previous one."""
+    global _com_call_stats  # noqa: PLW0603
+    previous, _com_call_stats = _com_call_stats, stats
+    return previous
@@ -3,14 +3,21 @@ from __future__ import annotations
 import sys
 
 from contextlib import contextmanager
-from ctypes import POINTER, PyDLL, byref, c_uint, c_void_p, py_object, windll
+from ctypes import POINTER, PyDLL, byref, c_uint, c_void_p, py_object
 from ctypes.wintypes import BOOL, WIN32_FIND_DATAW
 from os import fspath
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generator, Generic, Sequence, TypeVar
 
+import com_call_stats
+
 from com_types import GUID
-from hresult import HRESULT, S_FALSE, S_OK
-from interfaces import IUnknown
+from guid_registry import describe_guid
+from hresult import HRESULT, S_FALSE, S_OK, HRESULTError
+
+try:
+    from ctypes import windll
+except ImportError:  # Not on Windows: HandleCOMCall still works, the CoInitialize contexts do not.
+    windll = None
 
 if TYPE_CHECKING:
     from ctypes import _CArgObject, _CData, _Pointer
@@ -38,7 +45,7 @@ class COMInitializeContext(Generic[T]):
         if hr == S_FALSE:
             print("COM library already initialized.", file=sys.stderr)
         elif hr != S_OK:
-            HRESULT(hr).raise_for_status(hr, "CoInitialize failed!")
+            HRESULT.check(hr, "CoInitialize failed!")
         self._should_uninitialize = True
         return None
 
@@ -75,7 +82,7 @@ class COMCreateInstanceContext(Generic[T]):
                 raise OSError("Incorrect interface definition")
             hr = windll.ole32.CoCreateInstance(byref(self.clsid), None, 1, byref(iid), byref(p))
             if hr != S_OK:
-                raise HRESULT(hr).exception(f"CoCreateInstance failed on clsid '{self.clsid}', with interface '{iid}'!")
+                raise HRESULT(hr).exception(f"CoCreateInstance failed on clsid '{describe_guid(self.clsid)}', with interface '{describe_guid(iid)}'!")
             return p.contents
         return None
 
@@ -91,21 +98,35 @@ class COMCreateInstanceContext(Generic[T]):
 
 
 @contextmanager
-def HandleCOMCall(action_desc: str = "Unspecified COM function") -> Generator[Callable[..., None], Any, None]:
+def HandleCOMCall(action_desc: str = "Unspecified COM function", label: str | None = None) -> Generator[Callable[..., None], Any, None]:
+    """Check the HRESULT of one COM call. `label` is its stable call-statistics label; without one it is derived
+    from `action_desc` (com_call_stats.call_site), and only while statistics are being collected."""
     print(f"Attempt to call COM func {action_desc}")
     try:
         from comtypes import COMError  # pyright: ignore[reportMissingTypeStubs, reportMissingModuleSource]
     except ImportError:
         COMError = OSError
     future_error_msg = f"An error has occurred in win32 COM function '{action_desc}'"
+    stats = com_call_stats._com_call_stats  # noqa: SLF001  # None unless collection was enabled with set_com_call_stats().
+    site: str | None = None
+    if stats is not None:
+        site = label or com_call_stats.call_site(action_desc)
+        stats.record_call(site)
     try:
         # Yield back a callable function that will raise if hr is nonzero.
-        yield lambda hr: HRESULT(hr).raise_for_status(hr, future_error_msg)
+        yield lambda hr: HRESULT.check(hr, future_error_msg)
+    except HRESULTError as e:
+        if stats is not None and site is not None:
+            stats.record_failure(site, e.hresult, e)
+        raise  # Already carries the code and this call's description.
     except (COMError, OSError) as e:
         errcode = getattr(e, "winerror", getattr(e, "hresult", None))
         if errcode is None:
             raise
-        raise HRESULT(errcode).exception(future_error_msg)  # noqa: B904  # pyright: ignore[reportAttributeAccessIssue]
+        error = HRESULT(errcode).exception(future_error_msg)
+        if stats is not None and site is not None:
+            stats.record_failure(site, error.hresult, error)
+        raise error  # noqa: B904  # pyright: ignore[reportAttributeAccessIssue]
 
 
 def comtypes_get_refcount(ptr):
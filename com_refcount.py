@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import atexit
+import sys
+import threading
+import traceback
+
+from collections import OrderedDict
+from typing import IO, TYPE_CHECKING, Any, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from traceback import StackSummary
+
+
+class Survivor(NamedTuple):
+    """An interface pointer the process still holds references on."""
+
+    address: int
+    interface: str
+    references: int  # Acquired (out-parameters, CoCreateInstance, ...) plus AddRef minus Release, as seen by the tracker.
+    refcount: int | None  # The object's own count, as last returned by AddRef/Release; None if neither was called.
+    stack: StackSummary  # Where the process first acquired it.
+
+
+class OverRelease(NamedTuple):
+    """A Release of a pointer the process had already released all of its references on."""
+
+    address: int
+    interface: str
+    stack: StackSummary
+
+
+class RefcountTracker:
+    """Counts the COM references the process holds, per interface pointer, to find leaks and double releases.
+
+    Opt-in: nothing is tracked until a tracker is installed with set_refcount_tracker(). The hooks then report every
+    reference the process gains or drops:
+      - acquired(): a reference obtained without AddRef, i.e. an interface pointer returned through an out-parameter or
+        by CoCreateInstance/SHCreateItemFromParsingName,
+      - added() / released(): AddRef / Release, with the count the object returned.
+    The first acquisition of a pointer records its creation stack, reported for survivors. A pointer first seen being
+    AddRef'd is taken to have been borrowed, and one first seen being released to have been acquired unseen, so
+    pointers from code paths without hooks do not show up as leaks.
+    """
+
+    class _Entry:
+        __slots__ = ("interface", "references", "refcount", "stack")
+
+        def __init__(self, interface: str, references: int, stack: StackSummary):
+            self.interface: str = interface
+            self.references: int = references
+            self.refcount: int | None = None
+            self.stack: StackSummary = stack
+
+    def __init__(self, stack_depth: int = 12, released_history: int = 4096):
+        self.stack_depth: int = stack_depth
+        self._lock: threading.Lock = threading.Lock()
+        self._live: dict[int, RefcountTracker._Entry] = {}
+        # Pointers whose references were all released, to tell a double release from a pointer acquired unseen.
+        self._released: OrderedDict[int, str] = OrderedDict()
+        self._released_history: int = released_history
+        self.over_releases: list[OverRelease] = []
+
+    def _stack(self) -> StackSummary:
+        stack = traceback.extract_stack(limit=self.stack_depth + 4)
+        return traceback.StackSummary.from_list([frame for frame in stack if frame.filename != __file__][-self.stack_depth :])
+
+    def acquired(self, address: int, interface: str) -> None:
+        self._gained(address, interface, None)
+
+    def added(self, address: int, interface: str, refcount: int) -> None:
+        self._gained(address, interface, refcount)
+
+    def _gained(self, address: int, interface: str, refcount: int | None) -> None:
+        if not address:
+            return
+        with self._lock:
+            if self._count(self._live.get(address), refcount):
+                return
+        stack = self._stack()  # Outside the lock: this is the expensive part.
+        with self._lock:
+            self._released.pop(address, None)
+            self._count(self._live.setdefault(address, self._Entry(interface, 0, stack)), refcount)
+
+    @staticmethod
+    def _count(entry: RefcountTracker._Entry | None, refcount: int | None) -> bool:
+        if entry is None:
+            return False
+        entry.references += 1
+        if refcount is not None:
+            entry.refcount = refcount
+        return True
+
+    def released(self, address: int, interface: str, refcount: int) -> None:
+        if not address:
+            return
+        with self._lock:
+            entry = self._live.get(address)
+            if entry is not None:
+                entry.references -= 1
+                entry.refcount = refcount
+                if entry.references > 0:
+                    return
+                del self._live[address]
+            elif address not in self._released:
+                pass  # Acquired where no hook saw it: this drops that one reference.
+            else:
+                self.over_releases.append(OverRelease(address, interface, self._stack()))
+                return
+            self._released[address] = interface
+            self._released.move_to_end(address)
+            if len(self._released) > self._released_history:
+                self._released.popitem(last=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._live.clear()
+            self._released.clear()
+            self.over_releases.clear()
+
+    def survivors(self) -> list[Survivor]:
+        with self._lock:
+            return [Survivor(address, entry.interface, entry.references, entry.refcount, entry.stack) for address, entry in self._live.items()]
+
+    def census(self) -> dict[str, dict[str, int]]:
+        """Outstanding objects and references per interface, e.g. {"IShellItem": {"objects": 2, "references": 3}}."""
+        census: dict[str, dict[str, int]] = {}
+        for survivor in self.survivors():
+            counts = census.setdefault(survivor.interface, {"objects": 0, "references": 0})
+            counts["objects"] += 1
+            counts["references"] += survivor.references
+        return dict(sorted(census.items()))
+
+    def report(self, file: IO[str] | None = None) -> None:
+        """Print the census, then each survivor's creation stack and each over-release."""
+        file = sys.stderr if file is None else file
+        survivors = self.survivors()
+        print(f"COM reference census: {len(survivors)} live interface pointer(s), {len(self.over_releases)} over-release(s)", file=file)
+        for interface, counts in self.census().items():
+            print(f"  {interface:<32} {counts['objects']:>6} object(s) {counts['references']:>6} reference(s)", file=file)
+        for survivor in survivors:
+            refcount = "?" if survivor.refcount is None else survivor.refcount
+            print(f"\n{survivor.interface} at {survivor.address:#x}: {survivor.references} reference(s) held, refcount {refcount}, acquired at:", file=file)
+            print("".join(survivor.stack.format()), end="", file=file)
+        for over_release in self.over_releases:
+            print(f"\n{over_release.interface} at {over_release.address:#x} released after all references were released, at:", file=file)
+            print("".join(over_release.stack.format()), end="", file=file)
+
+
+_refcount_tracker: RefcountTracker | None = None
+_report_at_exit: bool = False
+
+
+def get_refcount_tracker() -> RefcountTracker | None:
+    """The installed tracker, or None when tracking is disabled (the default)."""
+    return _refcount_tracker
+
+
+def set_refcount_tracker(tracker: RefcountTracker | None, *, report_at_exit: bool = False) -> RefcountTracker | None:
+    """Install `tracker` (None disables tracking), returning the previous one.
+
+    Installing a tracker also instruments comtypes.IUnknown, the base of every interface in interfaces.py, if comtypes
+    is available. With `report_at_exit`, the tracker installed when the interpreter exits prints its report to stderr.
+    """
+    global _refcount_tracker, _report_at_exit  # noqa: PLW0603
+    if tracker is not None:
+        instrument_comtypes()
+    if report_at_exit and not _report_at_exit:
+        _report_at_exit = True
+        atexit.register(_report_on_exit)
+    previous, _refcount_tracker = _refcount_tracker, tracker
+    return previous
+
+
+def _report_on_exit() -> None:
+    if _refcount_tracker is not None:
+        _refcount_tracker.report()
+
+
+def _pointer_address(pointer: Any) -> int:
+    return pointer.value or 0
+
+
+def _interface_name(pointer: Any) -> str:
+    return getattr(pointer, "__com_interface__", type(pointer)).__name__
+
+
+def instrument(base: type) -> None:
+    """Report AddRef, Release and out-parameter results of `base` and its subclasses to the installed tracker.
+
+    `base` is a comtypes-style interface: its pointers are c_void_p instances with a `__com_interface__`, and ctypes
+    hands out-parameter results to __ctypes_from_outparam__. Instrumenting a class twice has no further effect.
+    """
+    if base.__dict__.get("_refcount_instrumented_"):
+        return
+    add_ref: Callable[[Any], int] = base.AddRef  # pyright: ignore[reportAttributeAccessIssue]
+    release: Callable[[Any], int] = base.Release  # pyright: ignore[reportAttributeAccessIssue]
+    from_outparam: Callable[[Any], Any] | None = base.__dict__.get("__ctypes_from_outparam__")
+
+    def AddRef(self) -> int:  # noqa: N802
+        refcount = add_ref(self)
+        tracker = _refcount_tracker
+        if tracker is not None:
+            tracker.added(_pointer_address(self), _interface_name(self), refcount)
+        return refcount
+
+    def Release(self) -> int:  # noqa: N802
+        address = _pointer_address(self)  # Before the call: comtypes may clear the pointer.
+        refcount = release(self)
+        tracker = _refcount_tracker
+        if tracker is not None:
+            tracker.released(address, _interface_name(self), refcount)
+        return refcount
+
+    def __ctypes_from_outparam__(self):  # noqa: N807
+        result = from_outparam(self) if from_outparam is not None else super(base, self).__ctypes_from_outparam__()  # pyright: ignore[reportAttributeAccessIssue]
+        tracker = _refcount_tracker
+        if tracker is not None:
+            tracker.acquired(_pointer_address(self), _interface_name(self))
+        return result
+
+    base.AddRef = AddRef  # pyright: ignore[reportAttributeAccessIssue]
+    base.Release = Release  # pyright: ignore[reportAttributeAccessIssue]
+    base.__ctypes_from_outparam__ = __ctypes_from_outparam__  # pyright: ignore[reportAttributeAccessIssue]
+    base._refcount_instrumented_ = True  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def instrument_comtypes() -> bool:
+    """Instrument comtypes.IUnknown. False if comtypes is not available."""
+    try:
+        import comtypes  # pyright: ignore[reportMissingTypeStubs]
+    except ImportError:
+        return False
+    instrument(comtypes.IUnknown)
+    return True
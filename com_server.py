@@ -0,0 +1,217 @@
+"""COM servers implemented in Python, with a QueryInterface that is a single dict lookup.
+
+A COMServer subclass lists the interfaces it implements in `_com_interfaces_`. When the class is created,
+__init_subclass__ walks each interface and its bases (IFileOpenDialog -> IFileDialog -> IModalWindow -> IUnknown) once
+and stores `_qi_table_`: the 16 raw bytes of every IID it answers to -> the index of the interface pointer to hand out.
+QueryInterface then looks the IID's bytes up and writes the pointer: nothing is scanned, and nothing is allocated
+beyond the key of an IID that arrives as a raw pointer.
+
+Interface pointers come from one of two places:
+  - raw-vtable interfaces (COMBase subclasses, e.g. vtable_backend.bindings()): the server builds them itself. Each
+    interface gets one vtable per process, whose slots forward to the server's Python methods by name; each instance
+    only allocates one lpVtbl slot per interface. This works on any platform, so native callers (and the raw backend)
+    can drive a Python server outside Windows too.
+  - comtypes interfaces: comtypes.COMObject builds them (`_com_pointers_`); list it after COMServer in the bases.
+    Native callers then AddRef/Release through comtypes' own IUnknown, so that count is the one that matters: such a
+    server is not pinned here, AddRef/Release forward to COMObject, and COMObject keeps it alive while it is referenced.
+    COMObject's vtables call IUnknown_QueryInterface(this, riid, ppv), which COMServer overrides with the table lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+import traceback
+
+from ctypes import Array, Structure, addressof, c_void_p, cast, sizeof, string_at
+from typing import Any, Callable, ClassVar, Sequence
+
+from com_types import GUID
+from hresult import HRESULT, HRESULTError
+from iunknown import COMBase, IID_IUnknown, RefCounted
+
+# Signed, the way a vtable slot returns them.
+S_OK = 0
+E_NOTIMPL = -2147467263  # 0x80004001
+E_NOINTERFACE = -2147467262  # 0x80004002
+E_POINTER = -2147467261  # 0x80004003
+E_FAIL = -2147467259  # 0x80004005
+
+_SLOT_SIZE: int = sizeof(c_void_p)
+
+# Interface pointer -> the server it belongs to, for the vtable thunks. Entries live as long as the server does.
+_servers: dict[int, COMServer] = {}
+# Raw-vtable interface -> (its vtable, the callbacks the vtable points to, kept alive with it).
+_vtables: dict[type[COMBase], tuple[Array[c_void_p], list[Any]]] = {}
+_vtables_lock = threading.Lock()
+
+
+def _signed(hresult: int) -> int:
+    hresult &= 0xFFFFFFFF
+    return hresult - 0x100000000 if hresult & 0x80000000 else hresult
+
+
+def _thunk(name: str, returns_hresult: bool) -> Callable[..., Any]:
+    """The Python side of a vtable slot: finds the server from `this` and calls its method `name`.
+
+    QueryInterface calls IUnknown_QueryInterface(this, riid, ppv), as comtypes.COMObject's vtables do.
+    """
+    if name == "QueryInterface":
+        def forward_query_interface(this: int, riid, ppv):
+            try:
+                return _servers[this].IUnknown_QueryInterface(this, riid, ppv)
+            except Exception:  # noqa: BLE001  # Must not unwind into native code.
+                traceback.print_exc()
+                return E_FAIL
+
+        return forward_query_interface
+    if not returns_hresult:  # AddRef / Release: plain ULONG results, nothing to translate.
+        def forward(this: int, *args):
+            return getattr(_servers[this], name)(*args)
+
+        return forward
+
+    def forward_hresult(this: int, *args):
+        method = getattr(_servers[this], name, None)
+        if method is None:
+            return E_NOTIMPL
+        try:
+            result = method(*args)
+        except HRESULTError as e:
+            return _signed(e.hresult)
+        except Exception:  # noqa: BLE001  # Must not unwind into native code; ctypes would report S_OK.
+            traceback.print_exc()
+            return E_FAIL
+        return S_OK if result is None else _signed(int(result))
+
+    return forward_hresult
+
+
+def vtable(interface: type[COMBase]) -> Array[c_void_p]:
+    """The process-wide vtable of Python thunks for a raw-vtable interface, built on first use."""
+    entry = _vtables.get(interface)
+    if entry is None:
+        with _vtables_lock:
+            entry = _vtables.get(interface)
+            if entry is None:
+                methods = sorted(interface._dispatch_.items(), key=lambda item: item[1].slot)
+                callbacks = [method.prototype(_thunk(name, method.prototype._restype_ is HRESULT)) for name, method in methods]  # pyright: ignore[reportAttributeAccessIssue]
+                table = (c_void_p * len(callbacks))(*[cast(callback, c_void_p).value for callback in callbacks])
+                entry = _vtables[interface] = (table, callbacks)
+    return entry[0]
+
+
+def find_server(address: int | None) -> COMServer | None:
+    """The Python server `address` is an interface pointer of, None for objects implemented elsewhere."""
+    return _servers.get(address) if address else None
+
+
+def interface_ids(interface: type) -> list[GUID]:
+    """The IIDs `interface` answers to: its own, then its bases' up to IUnknown."""
+    return [klass.__dict__["_iid_"] for klass in interface.__mro__ if "_iid_" in klass.__dict__]
+
+
+class COMServer(RefCounted):
+    """Base for COM objects implemented in Python: reference counting plus table-driven QueryInterface.
+
+        class FileOpenDialog(COMServer):
+            _com_interfaces_ = [bindings.IFileOpenDialog, bindings.IShellItemFilter]
+
+            def Show(self, hwndParent):
+                ...
+
+    The first interface listed is the object's identity: QueryInterface(IID_IUnknown) always returns its pointer.
+    Methods are called with the vtable arguments (without `this`); those returning HRESULT may return None for S_OK,
+    or raise HRESULTError to fail with its code. Unimplemented methods answer E_NOTIMPL.
+    """
+
+    _com_interfaces_: ClassVar[Sequence[type]] = ()
+    _qi_table_: ClassVar[dict[bytes, int]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        table: dict[bytes, int] = {}
+        for index, interface in enumerate(cls._com_interfaces_):
+            for iid in interface_ids(interface):
+                table.setdefault(bytes(iid), index)  # Shared bases (IUnknown, ...) resolve to the first interface.
+            if issubclass(interface, COMBase):
+                vtable(interface)
+        cls._qi_table_ = table
+        cls._pinned_ = all(issubclass(interface, COMBase) for interface in cls._com_interfaces_)
+
+    def __init__(self, *args, **kwargs):
+        self._interface_pointers: tuple[int, ...] = self._create_interface_pointers()  # First: may raise TypeError.
+        super().__init__(*args, **kwargs)
+        if self._pinned_:  # Only our own vtables' thunks look servers up.
+            for address in self._interface_pointers:
+                _servers[address] = self
+
+    def _create_interface_pointers(self) -> tuple[int, ...]:
+        interfaces = self._com_interfaces_
+        if all(issubclass(interface, COMBase) for interface in interfaces):
+            # One lpVtbl slot per interface: the address of slot i is the interface pointer of interface i.
+            self._lpvtbls = (c_void_p * len(interfaces))(*[cast(vtable(interface), c_void_p).value for interface in interfaces])
+            base = addressof(self._lpvtbls)
+            return tuple(base + index * _SLOT_SIZE for index in range(len(interfaces)))
+        com_pointers = getattr(self, "_com_pointers_", None)
+        if com_pointers is None:
+            raise TypeError(f"{type(self).__name__}: comtypes interfaces need comtypes.COMObject after COMServer in the bases")
+        return tuple(cast(com_pointers[interface._iid_], c_void_p).value for interface in interfaces)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _last_release(self) -> None:
+        try:
+            super()._last_release()
+        finally:
+            for address in self._interface_pointers:
+                _servers.pop(address, None)
+
+    def AddRef(self) -> int:  # noqa: N802
+        if self._pinned_:
+            return super().AddRef()
+        return self.IUnknown_AddRef(None)  # pyright: ignore[reportAttributeAccessIssue]  # comtypes.COMObject's count.
+
+    def Release(self) -> int:  # noqa: N802
+        if self._pinned_:
+            return super().Release()
+        return self.IUnknown_Release(None)  # pyright: ignore[reportAttributeAccessIssue]
+
+    def _final_release_(self) -> None:
+        """comtypes.COMObject's hook for its last Release."""
+        self.final_release()
+
+    def IUnknown_QueryInterface(self, this: Any, riid: GUID | Any, ppv: Any) -> int:  # noqa: N802, ARG002
+        """IUnknown::QueryInterface, as the vtables call it (comtypes.COMObject's too). `riid` is a GUID or a pointer to
+        one, `ppv` the address of the void* to fill or a pointer to it."""
+        if not ppv:
+            return E_POINTER
+        if not isinstance(ppv, int):
+            ppv = cast(ppv, c_void_p).value
+        index = self._qi_table_.get(bytes(riid) if isinstance(riid, Structure) else string_at(riid, 16))  # GUIDs cache their bytes.
+        if index is None:
+            c_void_p.from_address(ppv).value = None
+            return E_NOINTERFACE
+        c_void_p.from_address(ppv).value = self._interface_pointers[index]
+        self.AddRef()
+        return S_OK
+
+    def QueryInterface(self, interface: type | str) -> Any:  # noqa: N802
+        """comtypes.COMObject.QueryInterface(interface): `interface` on this object, with a reference the caller must
+        Release. comtypes servers return COMObject's POINTER(interface), raw-vtable ones a vtable_backend.RawInterface."""
+        if not self._pinned_:
+            return super().QueryInterface(interface)  # pyright: ignore[reportAttributeAccessIssue]
+        import vtable_backend  # noqa: PLC0415  # It compiles the raw bindings, which comtypes servers never need.
+        return vtable_backend.raw_interfaces()["IUnknown"].from_address(self.com_pointer()).QueryInterface(interface)
+
+    def query_interface(self, interface_id: GUID) -> int:
+        """The interface pointer for `interface_id`, with a reference the caller must Release. Raises NoInterface."""
+        index = self._qi_table_.get(bytes(interface_id))
+        if index is None:
+            raise HRESULT(E_NOINTERFACE).exception(f"{type(self).__name__} does not implement {interface_id}")
+        self.AddRef()
+        return self._interface_pointers[index]
+
+    def com_pointer(self, interface_id: GUID = IID_IUnknown) -> int:
+        """The interface pointer for `interface_id`, without adding a reference. Raises NoInterface."""
+        index = self._qi_table_.get(bytes(interface_id))
+        if index is None:
+            raise HRESULT(E_NOINTERFACE).exception(f"{type(self).__name__} does not implement {interface_id}")
+        return self._interface_pointers[index]
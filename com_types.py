@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import os
+import struct
 import threading
+import uuid
 import weakref
 
+from collections import OrderedDict
 from contextlib import suppress
-from ctypes import POINTER, Structure, byref, c_int, c_uint, c_wchar_p, oledll, windll
-from ctypes.wintypes import BYTE, DWORD, WORD
-from typing import TYPE_CHECKING, Sequence
+from ctypes import POINTER, Array, Structure, c_int, c_ubyte, c_uint, c_uint16, c_uint32
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, Sequence
 
 if TYPE_CHECKING:
-    from ctypes import Array, _CData, _Pointer as PointerType
+    from ctypes import _CData, _Pointer as PointerType
+
+    import numpy  # pyright: ignore[reportMissingImports]
 
     from comtypes import CoClass  # pyright: ignore[reportMissingTypeStubs]
     from comtypes.GUID import GUID as COMTYPE_GUID  # pyright: ignore[reportMissingTypeStubs, reportMissingImports]
@@ -17,6 +22,11 @@ if TYPE_CHECKING:
 if not TYPE_CHECKING:
     PointerType = POINTER(c_uint).__class__
 
+try:
+    from ctypes import oledll, windll
+except ImportError:  # Not on Windows: ole32 is unavailable, the pure-python paths below still work.
+    oledll = windll = None
+
 
 class FDE_SHAREVIOLATION_RESPONSE(c_int):  # noqa: N801
     FDESVR_DEFAULT = 0x00000000
@@ -26,40 +36,179 @@ class FDE_SHAREVIOLATION_RESPONSE(c_int):  # noqa: N801
 
 FDE_OVERWRITE_RESPONSE = FDE_SHAREVIOLATION_RESPONSE
 
+# Data1, Data2, Data3, Data4: little-endian as laid out in memory, big-endian as written in the string form.
+_GUID_LE_STRUCT = struct.Struct("<IHH8s")
+_GUID_BE_STRUCT = struct.Struct(">IHH8s")
+_GUID_HEAD_STRUCT = struct.Struct("<IHH")
+_NULL_DATA4 = bytes(8)
+_NULL_RAW = bytes(16)
+_GUID_SIZE = 16
+
+class GUIDInternCache:
+    """Interns GUID instances by their 16 raw bytes.
+
+    Three tiers are consulted in order:
+      - pinned: strong references that are never evicted (the IID_/CLSID_ constants), read without any lock.
+      - recent: a size-bounded LRU of strong references, so transient GUIDs are not dropped and rebuilt over and over.
+      - alive: weak references to every GUID handed out, so an instance that is still referenced elsewhere stays unique
+        even after it fell out of the LRU.
+    The recent/alive tiers are striped over `shards` locks by key hash. Lookups that hit never block: the dict reads are
+    atomic under the GIL and the LRU position is only refreshed when the shard lock happens to be free.
+    Hit/miss counters are updated without locking and may undercount slightly under contention.
+    """
+
+    class _Shard:
+        __slots__ = ("alive", "evictions", "hits", "lock", "maxsize", "misses", "recent")
+
+        def __init__(self, maxsize: int):
+            self.lock: threading.Lock = threading.Lock()
+            self.recent: OrderedDict[bytes, GUID] = OrderedDict()
+            self.alive: weakref.WeakValueDictionary[bytes, GUID] = weakref.WeakValueDictionary()
+            self.maxsize: int = maxsize
+            self.hits: int = 0
+            self.misses: int = 0
+            self.evictions: int = 0
+
+    def __init__(self, maxsize: int = 4096, shards: int = 16):
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError(f"shards must be a positive power of two, got {shards}")
+        self._pinned: dict[bytes, GUID] = {}
+        self._pinned_hits: int = 0
+        self._mask: int = shards - 1
+        self._shards: tuple[GUIDInternCache._Shard, ...] = tuple(self._Shard(max(1, maxsize // shards)) for _ in range(shards))
+
+    def get(self, key: bytes) -> GUID | None:
+        pinned = self._pinned.get(key)
+        if pinned is not None:
+            self._pinned_hits += 1
+            return pinned
+        shard = self._shards[hash(key) & self._mask]
+        instance = shard.recent.get(key)
+        if instance is None:
+            instance = shard.alive.get(key)
+            if instance is None:
+                return None
+        shard.hits += 1
+        if shard.lock.acquire(blocking=False):
+            try:
+                if key in shard.recent:
+                    shard.recent.move_to_end(key)
+                else:
+                    self._remember(shard, key, instance)
+            finally:
+                shard.lock.release()
+        return instance
+
+    def get_or_create(self, key: bytes, factory: Callable[[bytes], GUID]) -> GUID:
+        instance = self.get(key)
+        if instance is not None:
+            return instance
+        shard = self._shards[hash(key) & self._mask]
+        with shard.lock:
+            instance = shard.recent.get(key)  # Another thread may have won the race.
+            if instance is None:
+                instance = shard.alive.get(key)
+            if instance is None:
+                shard.misses += 1
+                instance = factory(key)
+                shard.alive[key] = instance
+            self._remember(shard, key, instance)
+        return instance
+
+    @staticmethod
+    def _remember(shard: GUIDInternCache._Shard, key: bytes, instance: GUID) -> None:
+        """Insert/refresh `key` in the shard's LRU. Caller holds the shard lock."""
+        shard.recent[key] = instance
+        shard.recent.move_to_end(key)
+        if len(shard.recent) > shard.maxsize:
+            shard.recent.popitem(last=False)
+            shard.evictions += 1
+
+    def pin(self, *guids: GUID) -> None:
+        """Keep `guids` interned forever. Pinned lookups take no lock."""
+        for guid in guids:
+            key = bytes(guid)
+            shard = self._shards[hash(key) & self._mask]
+            with shard.lock:
+                # Pin the instance already handed out (if any) so identity is preserved.
+                interned = shard.recent.pop(key, None)
+                if interned is None:
+                    interned = shard.alive.get(key, guid)
+                shard.alive[key] = interned
+            self._pinned[key] = interned
+
+    def clear(self) -> None:
+        """Drop the LRU tier and reset the counters. Pinned entries and live instances stay interned."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.recent.clear()
+                shard.hits = shard.misses = shard.evictions = 0
+        self._pinned_hits = 0
+
+    def stats(self) -> dict[str, int | float]:
+        hits = sum(shard.hits for shard in self._shards)
+        misses = sum(shard.misses for shard in self._shards)
+        lookups = self._pinned_hits + hits + misses
+        return {
+            "pinned": len(self._pinned),
+            "pinned_hits": self._pinned_hits,
+            "hits": hits,
+            "misses": misses,
+            "evictions": sum(shard.evictions for shard in self._shards),
+            "recent": sum(len(shard.recent) for shard in self._shards),
+            "alive": sum(len(shard.alive) for shard in self._shards),
+            "hit_rate": (self._pinned_hits + hits) / lookups if lookups else 0.0,
+        }
+
+
 try:
     from comtypes import GUID as COMTYPE_GUID  # pyright: ignore[reportMissingTypeStubs, reportAttributeAccessIssue]
     inherit = (COMTYPE_GUID,)
 except ImportError:
     inherit = (Structure,)
 class GUID(*inherit):
-    _instances = weakref.WeakValueDictionary()  # Class-level dictionary to hold GUID instances
-    _fields_: Sequence[ tuple[str, type[_CData]] | tuple[str, type[_CData], int] ] = [
-        ("Data1", DWORD),
-        ("Data2", WORD),
-        ("Data3", WORD),
-        ("Data4", BYTE * 8),
-    ]
-    _lock: threading.Lock = threading.Lock()
-    Data1: DWORD | int
-    Data2: WORD | int
-    Data3: WORD | int
-    Data4: Array[BYTE] | bytes
+    _interned: ClassVar[GUIDInternCache] = GUIDInternCache()
+    if inherit[0] is Structure:
+        # comtypes.GUID already declares these; redeclaring them there would append a second copy, doubling the struct size.
+        # Fixed-width types keep sizeof(GUID) == 16 on every platform (DWORD is 8 bytes outside of Windows).
+        _fields_: Sequence[ tuple[str, type[_CData]] | tuple[str, type[_CData], int] ] = [
+            ("Data1", c_uint32),
+            ("Data2", c_uint16),
+            ("Data3", c_uint16),
+            ("Data4", c_ubyte * 8),
+        ]
+    Data1: int
+    Data2: int
+    Data3: int
+    Data4: Array[c_ubyte] | bytes
 
     @classmethod
     def NULL(cls) -> Self:
-        null_guid: Self = Structure.__new__(cls)
-        null_guid.Data1 = DWORD(0)
-        null_guid.Data2 = WORD(0)
-        null_guid.Data3 = WORD(0)
-        null_guid.Data4 = (BYTE * 8)(*())
-        return null_guid
+        """The interned, pinned all-zero GUID (also available as the module-level GUID_NULL). Never write into it."""
+        return cls.from_raw(_NULL_RAW)
+
+    @classmethod
+    def _from_key(cls, key: bytes) -> Self:
+        """Build an instance from its 16 raw bytes and seed the cached key. Used as the intern cache factory."""
+        # from_buffer_copy fills the structure memory directly and does not re-enter __new__/__init__.
+        instance = cls.from_buffer_copy(key)
+        instance.__dict__["_key"] = key
+        return instance
 
     @classmethod
     def create_new(cls) -> Self:
-        """Create a brand new guid (randomly)."""
-        guid = super().__new__(cls)
-        oledll.ole32.CoCreateGuid(byref(guid))
-        return guid
+        """Create a brand new guid (randomly), an RFC 4122 version 4 GUID like ole32.CoCreateGuid makes. Works on any platform.
+
+        The result is not interned: a fresh random GUID is, by construction, not shared with anything yet.
+        """
+        return cls.from_buffer_copy(_random_guid_bytes(1))
+
+    @classmethod
+    def create_many(cls, count: int) -> Array[Self]:
+        """Create `count` random version 4 GUIDs in one contiguous (GUID * count) array, from a single os.urandom read."""
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        return (cls * count).from_buffer(_random_guid_bytes(count))
 
     def __new__(
         cls,
@@ -73,31 +222,26 @@ class GUID(*inherit):
         d4: tuple[int, int, int, int, int, int, int, int] | int | bytes | None = None,
         *args,
     ) -> Self:
+        if d1 is None and d2 is None and d3 is None and d4 is None and not args:
+            # A fresh, zeroed, uncached struct: GUID() is what callers pass byref() as an out-parameter. GUID.NULL() is
+            # the shared all-zero value.
+            return super().__new__(cls)
         # Our class level singleton pattern fixes the following occasional error using ole32.StringFromCLSID:
         # Fatal Python error: bad ID: Allocated using API 'n', verified using API 'o'
         try:
             d1, d2, d3, d4 = cls._parse_args(d1, d2, d3, d4, *args)
         except Exception as e:
             raise OSError("Failed to construct a GUID") from e
-        identifier = (d1, d2, d3, d4)
+        return cls._interned.get_or_create(_GUID_LE_STRUCT.pack(d1, d2, d3, d4), cls._from_key)
 
-        with cls._lock:
-            if identifier in cls._instances:
-                return cls._instances[identifier]
-
-            instance = super().__new__(cls)
-            cls._instances[identifier] = instance
-            if cls.__base__ is Structure:
-                super(cls, instance).__init__()
-            else:
-                super(cls, instance).__init__(cls.to_string(identifier))
-
-            instance.Data1 = DWORD(d1)
-            instance.Data2 = WORD(d2)
-            instance.Data3 = WORD(d3)
-            instance.Data4 = (BYTE * 8)(*d4)
+    @classmethod
+    def pin(cls, *guids: GUID) -> None:
+        """Intern `guids` permanently, e.g. module-level IID_/CLSID_ constants. See GUIDInternCache."""
+        cls._interned.pin(*guids)
 
-        return instance
+    @classmethod
+    def intern_stats(cls) -> dict[str, int | float]:
+        return cls._interned.stats()
 
     def __init__(
         self,
@@ -116,17 +260,15 @@ class GUID(*inherit):
     def __repr__(self):
         return f'GUID("{self!s}")'
 
-    def __str__(self):  # sourcery skip: remove-unreachable-code
-        # return f"{{{self.Data1:08X}-{self.Data2:04X}-{self.Data3:04X}-{self.Data4[0]:02X}{self.Data4[1]:02X}-{self.Data4[2]:02X}{self.Data4[3]:02X}{self.Data4[4]:02X}{self.Data4[5]:02X}{self.Data4[6]:02X}{self.Data4[7]:02X}}}"
-        # Comment out above line to use ole32.StringFromCLSID directly.
-        p = c_wchar_p()
-        windll.ole32.StringFromCLSID(byref(self), byref(p))
-        result = p.value
-        windll.ole32.CoTaskMemFree(p)
+    def __str__(self):
+        # Formatted in-process, see `format_guid`, and cached on interned instances only (see __bytes__).
+        # The previous ole32.StringFromCLSID + CoTaskMemFree round trip cost two foreign calls and an allocation per call.
+        result = self.__dict__.get("_str")
         if result is None:
-            d4_hex = "".join(f"{byte:02X}" for byte in self.Data4)
-            result = f"{{{self.Data1:08X}-{self.Data2:04X}-{self.Data3:04X}-{d4_hex[:4]}-{d4_hex[4:]}}}"
-        return result and result.strip() or str(self.NULL())
+            result = format_guid(self.Data1, self.Data2, self.Data3, bytes(self.Data4))
+            if "_key" in self.__dict__:
+                self.__dict__["_str"] = result
+        return result
 
     @classmethod
     def guid_ducktypes(cls) -> tuple[type[COMTYPE_GUID], type[Self]] | tuple[type[COMTYPE_GUID], type[GUID], type[Self]]:
@@ -139,10 +281,22 @@ class GUID(*inherit):
             from comtypes.GUID import GUID as COMTYPE_GUID  # pyright: ignore[reportMissingTypeStubs, reportMissingImports]
         return (GUID, cls) if COMTYPE_GUID is None else (cls, GUID, COMTYPE_GUID)  # pyright: ignore[reportReturnType]
 
+    # Equality, hashing and truthiness all run off the 16 raw bytes. Interned GUIDs carry them from __new__: they are
+    # shared values nothing writes into, and bytes caches its own hash, so dict lookups keyed by them allocate nothing.
+    # Any other instance (GUID(), from_buffer, array elements) may be an out-parameter the callee fills in after it was
+    # first hashed or formatted, so its bytes are read from the structure memory on every call.
+    def __bytes__(self) -> bytes:
+        key = self.__dict__.get("_key")
+        return memoryview(self).tobytes() if key is None else key
+
     def __bool__(self):
-        return self != self.NULL()
+        return self.__bytes__() != _NULL_RAW
 
     def __eq__(self, other):
+        if other is self:
+            return True
+        if isinstance(other, GUID):
+            return self.__bytes__() == other.__bytes__()
         return (
             self.Data1 == getattr(other, "Data1", None)
             and self.Data2 == getattr(other, "Data2", None)
@@ -150,20 +304,38 @@ class GUID(*inherit):
             and bytes(self.Data4) == bytes(getattr(other, "Data4", b""))
         )
 
-    def __bytes__(self) -> bytes:
-        return (
-            self.Data1.to_bytes(4, byteorder="little")
-            + self.Data2.to_bytes(2, byteorder="little")
-            + self.Data3.to_bytes(2, byteorder="little")
-            + self.Data4
-        )
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
     def __hash__(self):
         # We make GUID instances hashable, although ctypes.Structure instances are technically supposed to be mutable.
-        return hash(bytes(self))
+        return hash(self.__bytes__())
 
     def copy(self) -> Self:
-        return self.__class__(str(self))
+        return self.__class__.from_raw(bytes(self))
+
+    @classmethod
+    def from_raw(cls, raw: bytes | bytearray | memoryview) -> Self:
+        """Get the interned GUID for its 16 raw bytes (memory order, i.e. uuid.UUID.bytes_le). No formatting or parsing."""
+        key = bytes(raw)
+        if len(key) != _GUID_SIZE:
+            raise ValueError(f"A GUID is {_GUID_SIZE} bytes, got {len(key)}")
+        return cls._interned.get_or_create(key, cls._from_key)
+
+    def to_memoryview(self) -> memoryview:
+        """Zero-copy view of the 16 bytes of this structure, for hashing, comparing or writing out."""
+        return memoryview(self).cast("B")
+
+    def to_uuid(self) -> uuid.UUID:
+        return uuid.UUID(bytes_le=bytes(self))
+
+    @classmethod
+    def from_uuid(cls, value: uuid.UUID) -> Self:
+        return cls.from_raw(value.bytes_le)
+
+    def __reduce__(self):
+        # Pickles to the raw 16 bytes; unpickling goes back through the intern cache.
+        return (self.__class__.from_raw, (bytes(self),))
 
     @classmethod
     def from_progid(cls, progid_or_guid: str | CoClass | GUID) -> GUID:
@@ -175,17 +347,16 @@ class GUID(*inherit):
             raise TypeError(f"Cannot construct GUID from {progid_or_guid!r}")
         if progid_or_guid.startswith("{"):
             return cls(progid_or_guid)
-        inst = cls()
-        oledll.ole32.CLSIDFromProgID(str(progid_or_guid), byref(inst))
-        return inst
+        from progid import get_progid_resolver  # Local import: progid depends on this module.
+
+        clsid = get_progid_resolver().clsid(progid_or_guid)
+        return clsid if type(clsid) is cls else cls.from_raw(bytes(clsid))
 
     def as_progid(self) -> str | None:
-        """Convert a GUID into a progid(human readable alternative to GUIDs)."""
-        progid = c_wchar_p()
-        oledll.ole32.ProgIDFromCLSID(byref(self), byref(progid))
-        result = progid.value
-        oledll.ole32.CoTaskMemFree(progid)
-        return result
+        """Convert a GUID into a progid(human readable alternative to GUIDs). Lookups are cached, see progid.ProgIDResolver."""
+        from progid import get_progid_resolver
+
+        return get_progid_resolver().progid(self)
 
     @classmethod
     def _parse_args(
@@ -199,53 +370,177 @@ class GUID(*inherit):
         d3: int | None = None,
         d4: tuple[int, int, int, int, int, int, int, int] | int | bytes | None = None,
         *args,
-    ) -> tuple[int, int, int, bytes]:  # sourcery skip: low-code-quality
+    ) -> tuple[int, int, int, bytes]:
+        """Normalize every accepted constructor form into (Data1, Data2, Data3, Data4).
+
+        Numeric forms are packed directly, no intermediate string is ever built:
+            GUID(d1, d2, d3, b"8 bytes") / GUID(d1, d2, d3, (b0, ..., b7))
+            GUID(d1, d2, d3, b0, ..., b7)  (the 11-int form)
+            GUID(b0, ..., b15)  (the 16 raw bytes in memory order, i.e. tuple(bytes(guid)))
+        """
         # Null GUID
         if not d1 and not d2 and not d3 and not d4 and not args:
-            return 0, 0, 0, b""
+            return 0, 0, 0, _NULL_DATA4
 
         if d2 is None and d3 is None and d4 is None and not args:
             if isinstance(d1, str):
                 return cls.from_string(d1)
-            if isinstance(d1, tuple):
-                all_byte_ints = len(d1) == 16  # noqa: PLR2004
-                altern_format = len(d1) == 11  # noqa: PLR2004
-                if all_byte_ints or altern_format:
-                    return cls._parse_args(*d1)
-
-        if isinstance(d1, int) and isinstance(d2, int) and isinstance(d3, int):
-            if isinstance(d4, bytes):
-                d4 = d4[:8]
-                guid_str = f"{{{d1:08X}-{d2:04X}-{d3:04X}-{d4[0]:02X}{d4[1]:02X}-{d4[2]:02X}{d4[3]:02X}{d4[4]:02X}{d4[5]:02X}{d4[6]:02X}{d4[7]:02X}}}"
-                return cls.from_string(guid_str)
-            if isinstance(d4, tuple) and len(d4) == 8:
-                guid_str = f"{{{d1:08X}-{d2:04X}-{d3:04X}-{d4[0]:02X}{d4[1]:02X}-{d4[2]:02X}{d4[3]:02X}-{d4[4]:02X}{d4[5]:02X}{d4[6]:02X}{d4[7]:02X}}}"
-                return cls.from_string(guid_str)
+            if isinstance(d1, tuple) and len(d1) in (11, 16):
+                return cls._parse_args(*d1)
+            raise ValueError(f"Incorrect arguments passed to GUID({d1!r})")
 
         if args or isinstance(d4, int):
-            all_byte_ints = len(args) == 12  # noqa: PLR2004
-            altern_format = len(args) == 7  # noqa: PLR2004
-            if not all_byte_ints and not altern_format:
+            if len(args) == 12:  # noqa: PLR2004
+                return cls.from_bytes_le(bytes((d1, d2, d3, d4, *args)))
+            if len(args) != 7:  # noqa: PLR2004
                 raise ValueError(f"Incorrect arguments passed to GUID({d1}, {d2}, {d3}, {d4}, *{args})")
-            if all_byte_ints:
-                gd = (d1, d2, d3, d4, *args)
-                guid_str = f"{{{gd[0]:08X}-{gd[1]:04X}-{gd[2]:04X}-{gd[3]:02X}{gd[4]:02X}-{gd[5]:02X}{gd[6]:02X}{gd[7]:02X}-{gd[8]:02X}{gd[9]:02X}{gd[10]:02X}{gd[11]:02X}}}"
-            else:
-                guid_str = f"{{{d1:08X}-{d2:04X}-{d3:04X}-{d4:02X}{args[0]:02X}-{args[1]:02X}{args[2]:02X}{args[3]:02X}{args[4]:02X}{args[5]:02X}{args[6]:02X}}}"
-            return cls.from_string(guid_str)
-        raise ValueError(f"Incorrect arguments passed to GUID({d1}, {d2}, {d3}, {d4}, *{args})")
+            d4 = bytes((d4, *args))
+        elif isinstance(d4, tuple):
+            d4 = bytes(d4)
+        if not isinstance(d1, int) or not isinstance(d2, int) or not isinstance(d3, int) or not isinstance(d4, bytes) or len(d4) < 8:  # noqa: PLR2004
+            raise ValueError(f"Incorrect arguments passed to GUID({d1}, {d2}, {d3}, {d4}, *{args})")
+        # Range-check Data1..Data3 the same way the structure fields would see them.
+        _GUID_HEAD_STRUCT.pack(d1, d2, d3)
+        return d1, d2, d3, d4[:8]
+
+    @staticmethod
+    def from_bytes_le(raw: bytes) -> tuple[int, int, int, bytes]:
+        """Unpack the 16 raw bytes of a GUID structure (little-endian Data1..Data3) into its fields."""
+        return _GUID_LE_STRUCT.unpack(raw)
 
     @staticmethod
     def from_string(guid_string: str) -> tuple[int, int, int, bytes]:
-        hex_values = guid_string.strip("{}").split("-")
-        data1 = int(hex_values[0], 16)
-        data2 = int(hex_values[1], 16)
-        data3 = int(hex_values[2], 16)
-        data4 = bytes.fromhex(hex_values[3] + hex_values[4])
-        return data1, data2, data3, data4
+        """Strictly parse '{XXXXXXXX-XXXX-XXXX-XXXX-XXXXXXXXXXXX}' (braces optional) into the GUID fields.
+
+        Raises:
+            ValueError: the string is not exactly a canonical GUID.
+        """
+        s = guid_string
+        if len(s) == 38 and s[0] == "{" and s[37] == "}":  # noqa: PLR2004
+            s = s[1:37]
+        if len(s) != 36 or s[8] != "-" or s[13] != "-" or s[18] != "-" or s[23] != "-":  # noqa: PLR2004
+            raise ValueError(f"Invalid GUID string: {guid_string!r}")
+        try:
+            raw = bytes.fromhex(s[:8] + s[9:13] + s[14:18] + s[19:23] + s[24:])
+        except ValueError:
+            raise ValueError(f"Invalid GUID string: {guid_string!r}") from None
+        if len(raw) != 16:  # noqa: PLR2004  # bytes.fromhex skips whitespace, so a short result means the string had some.
+            raise ValueError(f"Invalid GUID string: {guid_string!r}")
+        return _GUID_BE_STRUCT.unpack(raw)
 
     @staticmethod
     def to_string(guid_tuple: tuple[int, int, int, bytes]) -> str:
-        data1, data2, data3, data4 = guid_tuple
-        hex4 = data4.hex()
-        return f"{{{data1:08x}-{data2:04x}-{data3:04x}-{hex4[:4]}-{hex4[4:]}}}"
+        return format_guid(*guid_tuple)
+
+    @classmethod
+    def parse_many(cls, items: Iterable[str | bytes] | bytes | bytearray | memoryview) -> Array[Self]:
+        """Parse many GUIDs into one contiguous (GUID * n) array, without creating (or interning) a GUID object per entry.
+
+        `items` is either an iterable of canonical GUID strings / 16-byte raw GUIDs, or a single buffer of n * 16 raw bytes.
+        A writable buffer (bytearray, writable memoryview) is exposed zero-copy through from_buffer, so the returned array
+        shares its memory; a read-only buffer such as bytes is copied once.
+        """
+        if isinstance(items, (bytes, bytearray, memoryview)):
+            count, remainder = divmod(len(items) if not isinstance(items, memoryview) else items.nbytes, _GUID_SIZE)
+            if remainder:
+                raise ValueError(f"GUID buffer length must be a multiple of {_GUID_SIZE}, got {count * _GUID_SIZE + remainder} bytes")
+            array_type = cls * count
+            if isinstance(items, bytes) or (isinstance(items, memoryview) and items.readonly):
+                return array_type.from_buffer_copy(items)
+            return array_type.from_buffer(items)
+
+        # Every entry is reduced to 32 hex digits in string (big-endian) order, then the whole batch is decoded by a single
+        # bytes.fromhex call and swapped back into memory order in one pass.
+        hex_parts: list[str] = []
+        for item in items:
+            if isinstance(item, str):
+                s = item[1:37] if len(item) == 38 and item[0] == "{" and item[37] == "}" else item  # noqa: PLR2004
+                if len(s) != 36 or s[8] != "-" or s[13] != "-" or s[18] != "-" or s[23] != "-":  # noqa: PLR2004
+                    raise ValueError(f"Invalid GUID string: {item!r}")
+                hex_parts.append(s[:8] + s[9:13] + s[14:18] + s[19:23] + s[24:])
+            elif isinstance(item, (bytes, bytearray)) and len(item) == _GUID_SIZE:
+                hex_parts.append(_swap_guid_byte_order(item).hex())
+            else:
+                raise TypeError(f"Cannot parse a GUID from {item!r}")
+
+        try:
+            raw = bytes.fromhex("".join(hex_parts))
+        except ValueError:
+            raw = b""
+        if len(raw) != len(hex_parts) * _GUID_SIZE:
+            for hex_part in hex_parts:  # Slow path, only to name the offending entry.
+                cls.from_string(f"{hex_part[:8]}-{hex_part[8:12]}-{hex_part[12:16]}-{hex_part[16:20]}-{hex_part[20:]}")
+        buffer = _swap_guid_byte_order(raw)
+        return (cls * len(hex_parts)).from_buffer(buffer)
+
+    @staticmethod
+    def format_many(guids: Array[GUID] | Iterable[GUID] | bytes | bytearray | memoryview) -> list[str]:
+        """Render many GUIDs in their canonical string form with a single hex conversion over the whole buffer."""
+        if isinstance(guids, (bytes, bytearray, memoryview)):
+            raw = bytes(guids)
+        elif isinstance(guids, Array):
+            raw = bytes(memoryview(guids).cast("B"))
+        else:
+            raw = b"".join([bytes(guid) for guid in guids])
+        if len(raw) % _GUID_SIZE:
+            raise ValueError(f"GUID buffer length must be a multiple of {_GUID_SIZE}, got {len(raw)} bytes")
+        hexed = _swap_guid_byte_order(raw).hex().upper()
+        return [
+            f"{{{hexed[i : i + 8]}-{hexed[i + 8 : i + 12]}-{hexed[i + 12 : i + 16]}-{hexed[i + 16 : i + 20]}-{hexed[i + 20 : i + 32]}}}"
+            for i in range(0, len(hexed), 32)
+        ]
+
+    @staticmethod
+    def as_numpy(guids: Array[GUID] | bytes | bytearray | memoryview) -> numpy.ndarray:
+        """View a GUID array/buffer as a NumPy structured array (zero-copy) for vectorized sort, dedupe and search.
+
+        Requires the optional NumPy dependency. Use `.view("V16")` on the result to compare whole GUIDs at once.
+        """
+        import numpy as np  # pyright: ignore[reportMissingImports]
+
+        dtype = np.dtype([("Data1", "<u4"), ("Data2", "<u2"), ("Data3", "<u2"), ("Data4", "u1", (8,))])
+        return np.frombuffer(guids, dtype=dtype)
+
+
+GUID_NULL: GUID = GUID.NULL()
+GUID.pin(GUID_NULL)
+
+
+# RFC 4122 bits, in memory order: the version nibble is the high nibble of Data3 (byte 7, little-endian),
+# the variant is the top two bits of Data4[0] (byte 8).
+_VERSION4_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+def _random_guid_bytes(count: int) -> bytearray:
+    """`count` random version 4 GUIDs as raw bytes. The version/variant bits are applied with two translate() calls over the whole batch."""
+    raw = bytearray(os.urandom(count * _GUID_SIZE))
+    raw[7::16] = raw[7::16].translate(_VERSION4_TABLE)
+    raw[8::16] = raw[8::16].translate(_VARIANT_TABLE)
+    return raw
+
+
+def _swap_guid_byte_order(raw: bytes) -> bytearray:
+    """Swap Data1..Data3 of every 16-byte GUID in `raw` between memory (little-endian) and string (big-endian) order.
+
+    The swap is its own inverse and runs as 8 extended-slice copies over the whole buffer, regardless of the GUID count.
+    """
+    out = bytearray(raw)
+    out[0::16] = raw[3::16]
+    out[1::16] = raw[2::16]
+    out[2::16] = raw[1::16]
+    out[3::16] = raw[0::16]
+    out[4::16] = raw[5::16]
+    out[5::16] = raw[4::16]
+    out[6::16] = raw[7::16]
+    out[7::16] = raw[6::16]
+    return out
+
+
+def format_guid(data1: int, data2: int, data3: int, data4: bytes) -> str:
+    """Format the GUID fields in the canonical registry form, e.g. '{00000000-0000-0000-C000-000000000046}'.
+
+    Produces the same output as ole32.StringFromCLSID without leaving the interpreter, so it also works on non-Windows platforms.
+    """
+    hex4 = data4.hex().upper()
+    return f"{{{data1:08X}-{data2:04X}-{data3:04X}-{hex4[:4]}-{hex4[4:16]}}}"
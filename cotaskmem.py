@@ -0,0 +1,214 @@
+"""Owned CoTaskMemAlloc'd wide strings: the LPWSTR results of GetDisplayName, GetFileName and friends.
+
+The callee allocates these and the caller must CoTaskMemFree them exactly once. CoTaskMemString takes that ownership:
+it measures the string once, decodes it at most once, and frees the buffer when closed (with-statement, close(), or
+when the last reference goes away), never twice. Callers that only hash or compare paths can use view() and skip the
+decode altogether.
+
+Frees go through a TaskAllocator: ole32 on Windows, a TrackingTaskAllocator elsewhere, which fake vtables allocate
+their results from and which tests use to count leaks and double frees. Callees implemented in Python (simulated_shell)
+allocate the strings they return from the same allocator.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from ctypes import CDLL, CFUNCTYPE, addressof, byref, c_char, c_size_t, c_void_p, c_wchar, c_wchar_p, create_unicode_buffer, memmove, sizeof, string_at, wstring_at
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
+
+try:
+    from ctypes import WINFUNCTYPE, windll
+except ImportError:  # Not on Windows: wcslen from the C library, no ole32.
+    windll = None
+    _wcslen = CFUNCTYPE(c_size_t, c_void_p)(("wcslen", CDLL(None)))
+else:
+    _wcslen = WINFUNCTYPE(c_size_t, c_void_p)(("lstrlenW", windll.kernel32))
+
+WCHAR_SIZE: int = sizeof(c_wchar)  # 2 on Windows (UTF-16), 4 elsewhere (UTF-32).
+
+
+class TaskAllocator:
+    """Allocates and frees CoTaskMem memory. Subclass and pass to set_task_allocator() to plug in another allocator."""
+
+    def alloc_string(self, text: str) -> int:
+        """A NUL-terminated copy of `text`, as the callee of an LPWSTR out-parameter returns it."""
+        raise NotImplementedError
+
+    def free(self, address: int) -> None:
+        raise NotImplementedError
+
+
+class Ole32TaskAllocator(TaskAllocator):
+    """ole32.CoTaskMemAlloc/CoTaskMemFree. Windows only."""
+
+    def __init__(self):
+        if windll is None:
+            raise OSError("ole32 is not available on this platform, cannot free CoTaskMem allocations")
+        self._alloc = WINFUNCTYPE(c_void_p, c_size_t)(("CoTaskMemAlloc", windll.ole32))
+        self._free = WINFUNCTYPE(None, c_void_p)(("CoTaskMemFree", windll.ole32))
+
+    def alloc_string(self, text: str) -> int:
+        buffer = create_unicode_buffer(text)
+        address = self._alloc(sizeof(buffer))
+        if not address:
+            raise MemoryError(f"CoTaskMemAlloc of {sizeof(buffer)} bytes failed")
+        memmove(address, buffer, sizeof(buffer))
+        return address
+
+    def free(self, address: int) -> None:
+        self._free(address)
+
+
+class TrackingTaskAllocator(TaskAllocator):
+    """Python-owned allocations, for fake vtables and tests on platforms without ole32.
+
+    `live` maps the address of every allocation not yet freed to its buffer; `allocations` and `frees` count calls.
+    Freeing an address that is not live (a double free, or memory from elsewhere) raises ValueError.
+    """
+
+    def __init__(self):
+        self.live: dict[int, object] = {}
+        self.allocations: int = 0
+        self.frees: int = 0
+        self._lock = threading.Lock()
+
+    def alloc_string(self, text: str) -> int:
+        buffer = create_unicode_buffer(text)
+        address = addressof(buffer)
+        with self._lock:
+            self.live[address] = buffer
+            self.allocations += 1
+        return address
+
+    def free(self, address: int) -> None:
+        with self._lock:
+            if self.live.pop(address, None) is None:
+                raise ValueError(f"CoTaskMemFree of {address:#x}, which is not allocated")
+            self.frees += 1
+
+
+_allocator: TaskAllocator | None = None
+_allocator_lock = threading.Lock()
+_close_lock = threading.Lock()
+
+
+def get_task_allocator() -> TaskAllocator:
+    """The allocator new CoTaskMemStrings free with, created on first use."""
+    global _allocator  # noqa: PLW0603
+    if _allocator is None:
+        with _allocator_lock:
+            if _allocator is None:
+                _allocator = TrackingTaskAllocator() if windll is None else Ole32TaskAllocator()
+    return _allocator
+
+
+def set_task_allocator(allocator: TaskAllocator | None) -> None:
+    """Replace the allocator (None restores the default). Strings already taken keep the allocator they were made with."""
+    global _allocator  # noqa: PLW0603
+    with _allocator_lock:
+        _allocator = allocator
+
+
+class CoTaskMemString:
+    """An owned LPWSTR: measured once, decoded at most once, freed exactly once.
+
+        with CoTaskMemString.take(address) as name:
+            path = str(name)  # or os.fspath(name), name.view(), name.tobytes()
+
+    The buffer stays allocated until close(), which views also do not outlive: they are released along with it.
+    """
+
+    __slots__ = ("_address", "_allocator", "_length", "_text", "_views")
+
+    def __init__(self, address: int, allocator: TaskAllocator | None = None):
+        self._address: int = 0  # Set last: __del__ must not free what __init__ failed to take.
+        if not address:
+            raise ValueError("CoTaskMemString of a NULL pointer")
+        self._allocator: TaskAllocator = allocator or get_task_allocator()
+        self._length: int = _wcslen(address)
+        self._text: str | None = None
+        self._views: list[memoryview] = []
+        self._address = address
+
+    @classmethod
+    def take(cls, pointer: int | c_void_p | c_wchar_p | None, allocator: TaskAllocator | None = None) -> Self | None:
+        """Take ownership of the string `pointer` (an address, or an LPWSTR out-parameter) points to; None for NULL."""
+        address = c_void_p.from_buffer(pointer).value if isinstance(pointer, (c_void_p, c_wchar_p)) else pointer
+        return cls(address, allocator) if address else None
+
+    def __len__(self) -> int:
+        """The length in wchar_t units, without the NUL terminator."""
+        return self._length
+
+    @property
+    def closed(self) -> bool:
+        return not self._address
+
+    @property
+    def value(self) -> str:
+        """The string, decoded on first access only."""
+        if self._text is None:
+            self._text = wstring_at(self._checked_address(), self._length)
+        return self._text
+
+    def view(self) -> memoryview:
+        """The raw wchar_t bytes (UTF-16-LE on Windows), read-only and without copying. Released by close()."""
+        view = memoryview((c_char * (self._length * WCHAR_SIZE)).from_address(self._checked_address())).cast("B").toreadonly()
+        self._views.append(view)
+        return view
+
+    def tobytes(self) -> bytes:
+        """A copy of the raw wchar_t bytes, which outlives close()."""
+        return string_at(self._checked_address(), self._length * WCHAR_SIZE)
+
+    def close(self) -> None:
+        """Free the buffer. Later calls do nothing; the decoded value stays available."""
+        with _close_lock:
+            address, self._address = self._address, 0
+        if not address:
+            return
+        try:
+            for view in self._views:
+                view.release()  # BufferError if something still exports from a view; the buffer is freed regardless.
+        finally:
+            self._views.clear()
+            self._allocator.free(address)
+
+    def _checked_address(self) -> int:
+        if not self._address:
+            raise ValueError("CoTaskMemString is closed")
+        return self._address
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __fspath__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"CoTaskMemString({self.value!r})" if self._text is not None or self._address else "CoTaskMemString(<closed>)"
+
+
+def comtypes_display_name(shell_item: Any, sigdn: int) -> CoTaskMemString | None:
+    """IShellItem::GetDisplayName on a comtypes IShellItem pointer as an owned string, None if the shell returned NULL.
+
+    The comtypes wrapper returns a str copy and drops the pointer, leaking the buffer: this calls the raw method instead.
+    """
+    pointer = c_wchar_p()
+    shell_item._IShellItem__com_GetDisplayName(sigdn, byref(pointer))  # noqa: SLF001
+    return CoTaskMemString.take(pointer)
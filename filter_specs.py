@@ -0,0 +1,255 @@
+"""File type filters for IFileDialog::SetFileTypes, built once per distinct filter list.
+
+SetFileTypes reads an array of COMDLG_FILTERSPEC: pairs of wide-string pointers. A FilterSet is that array built once:
+the strings are converted when the set is created and the array (which owns the converted buffers) lives exactly as
+long as the set does, so a dialog holding the set can hand `address` to SetFileTypes without copying anything.
+
+filter_set() interns sets by content, the (name, spec) tuples, the way GUIDs are interned by their bytes:
+  - recent: a size-bounded LRU of strong references, so a filter list rebuilt by every call is converted only once.
+  - alive: weak references to every set handed out, so a set a dialog still holds stays unique after it fell out of
+    the LRU.
+Passing a FilterSet back to filter_set() costs nothing: windialogs.DEFAULT_FILTERS is one, so repeated browse_files()
+calls with the default filters do no filter work at all.
+
+The specs themselves ("*.png;*.jpg", "Makefile") can be evaluated in Python too: FilterSet.matcher() compiles them,
+once per set, into a FilterMatcher that tests a name with a few hash lookups instead of one fnmatch per pattern. It is
+what simulated_shell lists folders with and what interfaces.ShellItemFilter answers IncludeItem with.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import weakref
+
+from collections import OrderedDict
+from ctypes import Structure, addressof
+from ctypes.wintypes import LPCWSTR
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence, Tuple, Union, overload
+
+if TYPE_CHECKING:
+    from ctypes import Array, _CData
+
+
+class COMDLG_FILTERSPEC(Structure):  # noqa: N801
+    _fields_: Sequence[tuple[str, type[_CData]] | tuple[str, type[_CData], int]] = [
+        ("pszName", LPCWSTR),
+        ("pszSpec", LPCWSTR)
+    ]
+
+
+FilterKey = Tuple[Tuple[str, str], ...]
+Filters = Union["FilterSet", Iterable[Union[COMDLG_FILTERSPEC, Tuple[str, str]]]]
+
+
+class FilterMatcher:
+    """Tests file names against filter specs the way the shell does: case-insensitively, `*` and `?` as wildcards.
+
+    Compiling sorts the patterns of every spec (split on ";") into:
+      - extensions: "*.png", "*.build.xml" -> a set of the suffixes after a dot. A name is looked up once per dot from
+        its right end, up to the most dots any of these suffixes has.
+      - names: "Makefile", "pom.xml" -> a set of exact names.
+      - everything else ("data??.csv", "*~") -> a single regular expression alternating all of them.
+    "*" and "*.*" match every name.
+    """
+
+    __slots__ = ("_depth", "_regex", "everything", "extensions", "names", "patterns")
+
+    def __init__(self, specs: Iterable[str]):
+        self.patterns: tuple[str, ...] = tuple(
+            dict.fromkeys(pattern.strip().lower() for spec in specs for pattern in spec.split(";") if pattern.strip())
+        )
+        self.everything: bool = "*" in self.patterns or "*.*" in self.patterns
+        self.extensions: frozenset[str] = frozenset(
+            pattern[2:] for pattern in self.patterns if pattern.startswith("*.") and not _has_wildcards(pattern[2:])
+        )
+        self.names: frozenset[str] = frozenset(pattern for pattern in self.patterns if not _has_wildcards(pattern))
+        rest = [
+            pattern for pattern in self.patterns
+            if _has_wildcards(pattern) and not (pattern.startswith("*.") and pattern[2:] in self.extensions)
+        ]
+        self._depth: int = max((extension.count(".") + 1 for extension in self.extensions), default=0)
+        self._regex: Callable[[str], re.Match[str] | None] | None = (
+            re.compile("|".join(_translate(pattern) for pattern in rest), re.DOTALL).fullmatch if rest else None
+        )
+
+    def match(self, name: str) -> bool:
+        """Whether the file name `name` (no directory part) matches any of the patterns."""
+        if self.everything:
+            return True
+        name = name.lower()
+        if name in self.names:
+            return True
+        end = len(name)
+        for _ in range(self._depth):
+            end = name.rfind(".", 0, end)
+            if end < 0:
+                break
+            if name[end + 1:] in self.extensions:
+                return True
+        return self._regex is not None and self._regex(name) is not None
+
+    __call__ = match
+
+    def match_many(self, paths: Iterable[str]) -> list[str]:
+        """The `paths` whose file name matches, in order: one pass over the paths, whatever the number of patterns."""
+        if self.everything:
+            return list(paths)
+        names, extensions, depth, regex = self.names, self.extensions, self._depth, self._regex
+        separator, altseparator = os.sep, os.altsep
+        matched: list[str] = []
+        append = matched.append
+        for path in paths:
+            start = path.rfind(separator)
+            if altseparator is not None:
+                start = max(start, path.rfind(altseparator))
+            name = path[start + 1:].lower()
+            found = name in names
+            end = len(name)
+            for _ in range(0 if found else depth):
+                end = name.rfind(".", 0, end)
+                if end < 0:
+                    break
+                if name[end + 1:] in extensions:
+                    found = True
+                    break
+            if found or (regex is not None and regex(name) is not None):
+                append(path)
+        return matched
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({';'.join(self.patterns)!r})"
+
+
+def _has_wildcards(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern
+
+
+def _translate(pattern: str) -> str:
+    """A shell filter pattern as a regular expression: `*` is any run of characters, `?` any one, nothing else special."""
+    return "".join(".*" if char == "*" else "." if char == "?" else re.escape(char) for char in pattern)
+
+
+class FilterSet(Sequence[Tuple[str, str]]):
+    """An immutable filter list and the COMDLG_FILTERSPEC array SetFileTypes reads. Get them from filter_set().
+
+    Indexing and iterating yield the (name, spec) tuples. Interned sets are shared by every caller, so the array is
+    only reachable as `address` and `count`, for SetFileTypes to read.
+    """
+
+    __slots__ = ("__weakref__", "_array", "_matchers", "key")
+
+    def __init__(self, key: FilterKey):
+        self.key: FilterKey = key
+        self._matchers: dict[int | None, FilterMatcher] = {}
+        self._array: Array[COMDLG_FILTERSPEC] = (COMDLG_FILTERSPEC * len(key))()
+        for entry, (name, spec) in zip(self._array, key):
+            entry.pszName = name  # The array keeps the converted buffers (its _objects).
+            entry.pszSpec = spec
+
+    @property
+    def count(self) -> int:
+        """cFileTypes."""
+        return len(self.key)
+
+    @property
+    def address(self) -> int | None:
+        """rgFilterSpec: the address of the first COMDLG_FILTERSPEC, None for an empty set."""
+        return addressof(self._array) if self.key else None
+
+    def matcher(self, file_type_index: int | None = None) -> FilterMatcher:
+        """The compiled specs of every file type, or only of `file_type_index` (1-based, as in SetFileTypeIndex)."""
+        matcher = self._matchers.get(file_type_index)
+        if matcher is None:
+            if file_type_index is None:
+                specs = [spec for _, spec in self.key]
+            elif 1 <= file_type_index <= len(self.key):
+                specs = [self.key[file_type_index - 1][1]]
+            else:
+                raise IndexError(f"file type index {file_type_index} out of range 1..{len(self.key)}")
+            matcher = self._matchers.setdefault(file_type_index, FilterMatcher(specs))
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[str, str]: ...
+    @overload
+    def __getitem__(self, index: slice) -> FilterKey: ...
+    def __getitem__(self, index: int | slice) -> tuple[str, str] | FilterKey:
+        return self.key[index]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self.key)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.key)!r})"
+
+
+def filter_key(filters: Filters) -> FilterKey:
+    """The (name, spec) tuples of `filters`, which may mix COMDLG_FILTERSPEC entries and plain tuples."""
+    if isinstance(filters, FilterSet):
+        return filters.key
+    return tuple(
+        (entry.pszName or "", entry.pszSpec or "") if isinstance(entry, COMDLG_FILTERSPEC) else (entry[0], entry[1])
+        for entry in filters
+    )
+
+
+class FilterSetCache:
+    """Interns FilterSets by their key: a size-bounded LRU of strong references over weak references to every set."""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize: int = maxsize
+        self._lock: threading.Lock = threading.Lock()
+        self._recent: OrderedDict[FilterKey, FilterSet] = OrderedDict()
+        self._alive: weakref.WeakValueDictionary[FilterKey, FilterSet] = weakref.WeakValueDictionary()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, filters: Filters) -> FilterSet:
+        if isinstance(filters, FilterSet):
+            return filters
+        key = filter_key(filters)
+        with self._lock:
+            instance = self._recent.get(key)
+            if instance is None:
+                instance = self._alive.get(key)
+            if instance is None:
+                self.misses += 1
+                instance = self._alive[key] = FilterSet(key)
+            else:
+                self.hits += 1
+            self._recent[key] = instance
+            self._recent.move_to_end(key)
+            if len(self._recent) > self.maxsize:
+                self._recent.popitem(last=False)
+        return instance
+
+    def clear(self) -> None:
+        """Drop the LRU tier and reset the counters. Sets still referenced elsewhere stay interned."""
+        with self._lock:
+            self._recent.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "recent": len(self._recent), "alive": len(self._alive)}
+
+
+_cache: FilterSetCache = FilterSetCache()
+
+
+def filter_set(filters: Filters) -> FilterSet:
+    """The interned FilterSet with the same (name, spec) entries as `filters`, built on first use."""
+    return _cache.get(filters)
+
+
+def filter_set_cache() -> FilterSetCache:
+    return _cache
+
+
+def compile_filters(filters: Filters) -> FilterMatcher:
+    """The matcher for every spec of `filters`, compiled once per interned FilterSet."""
+    return filter_set(filters).matcher()
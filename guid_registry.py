@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import ast
+import importlib.util
+import sys
+import threading
+import warnings
+
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+from com_types import GUID
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
+
+
+class GUIDSymbol(NamedTuple):
+    name: str
+    module: str
+    lineno: int
+
+
+class GUIDSymbolRegistry:
+    """Reverse index from a GUID to the IID_*/CLSID_* constant that defines it, for trace and error output.
+
+    The index is built on the first lookup by parsing the source of `modules` (the modules are not imported, so this
+    neither pays for nor requires their comtypes interface definitions). While building, it reports through warnings:
+      - redefinitions: the same name bound more than once in a module, the later binding silently shadowing the earlier.
+      - collisions: one GUID bound to several different names.
+    Lookups are a single dict access on the GUID's raw bytes.
+    """
+
+    PREFIXES: tuple[str, ...] = ("IID_", "CLSID_")
+
+    def __init__(self, modules: Sequence[str] = ("interfaces",)):
+        self.modules: tuple[str, ...] = tuple(modules)
+        self._index: dict[bytes, GUIDSymbol] | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self.redefinitions: list[tuple[GUIDSymbol, GUIDSymbol]] = []
+        self.collisions: list[tuple[GUIDSymbol, GUIDSymbol]] = []
+
+    def lookup(self, guid: GUID | str) -> GUIDSymbol | None:
+        index = self._index
+        if index is None:
+            index = self._build()
+        return index.get(self._key(guid))
+
+    def name_of(self, guid: GUID | str) -> str | None:
+        symbol = self.lookup(guid)
+        return None if symbol is None else symbol.name
+
+    def describe(self, guid: GUID | str) -> str:
+        """'IID_IShellItem {43826D1E-...}' for known GUIDs, the plain string form otherwise."""
+        if not isinstance(guid, GUID):
+            guid = GUID(str(guid))
+        symbol = self.lookup(guid)
+        return str(guid) if symbol is None else f"{symbol.name} {guid}"
+
+    def rebuild(self) -> Self:
+        with self._lock:
+            self._index = None
+        self._build()
+        return self
+
+    @staticmethod
+    def _key(guid: GUID | str) -> bytes:
+        if isinstance(guid, GUID):
+            return bytes(guid)
+        return bytes(GUID(str(guid)))
+
+    def _build(self) -> dict[bytes, GUIDSymbol]:
+        with self._lock:
+            if self._index is not None:  # Another thread built it while we waited.
+                return self._index
+            index: dict[bytes, GUIDSymbol] = {}
+            redefinitions: list[tuple[GUIDSymbol, GUIDSymbol]] = []
+            collisions: list[tuple[GUIDSymbol, GUIDSymbol]] = []
+            by_name: dict[str, tuple[bytes, GUIDSymbol]] = {}
+            for module in self.modules:
+                for symbol, key in self._scan(module):
+                    previous = by_name.get(symbol.name)
+                    if previous is not None:
+                        redefinitions.append((previous[1], symbol))
+                        if previous[0] != key and index.get(previous[0]) == previous[1]:
+                            del index[previous[0]]  # The live binding is the later one.
+                    by_name[symbol.name] = (key, symbol)
+                    existing = index.get(key)
+                    if existing is None:
+                        index[key] = symbol
+                    elif existing.name != symbol.name:
+                        collisions.append((existing, symbol))
+            self.redefinitions = redefinitions
+            self.collisions = collisions
+            self._index = index
+        for first, second in redefinitions:
+            warnings.warn(f"{second.name} redefined at {second.module}:{second.lineno}, shadowing the definition at line {first.lineno}", RuntimeWarning, stacklevel=2)
+        for first, second in collisions:
+            warnings.warn(f"{second.name} ({second.module}:{second.lineno}) has the same GUID as {first.name} ({first.module}:{first.lineno})", RuntimeWarning, stacklevel=2)
+        return index
+
+    @classmethod
+    def _scan(cls, module: str) -> list[tuple[GUIDSymbol, bytes]]:
+        """Find module-level `PREFIX_Name = GUID("{...}")` assignments, `"PREFIX_Name": "{...}"` entries of module-level
+        dict literals (constants bound lazily from a table, see interfaces.__getattr__) and `("PREFIX_Name", "{...}")`
+        pairs of module-level list literals (the definitions such a table shadows, see interfaces._SHADOWED_GUIDS), in
+        source order."""
+        loaded = sys.modules.get(module)
+        path = getattr(loaded, "__file__", None)
+        if path is None:
+            spec = importlib.util.find_spec(module)
+            path = None if spec is None else spec.origin
+        if path is None:
+            raise ModuleNotFoundError(f"Cannot locate the source of module '{module}'")
+        with open(path, encoding="utf-8") as source:  # noqa: PTH123
+            tree = ast.parse(source.read(), path)
+
+        found: list[tuple[GUIDSymbol, bytes]] = []
+        for node in tree.body:
+            if isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Dict):
+                found.extend(cls._scan_table(node.value.keys, node.value.values, module))
+                continue
+            if isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.List):
+                pairs = [element.elts for element in node.value.elts if isinstance(element, ast.Tuple) and len(element.elts) == 2]  # noqa: PLR2004
+                found.extend(cls._scan_table([key for key, _ in pairs], [value for _, value in pairs], module))
+                continue
+            if not isinstance(node, ast.Assign) or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+                continue
+            name = node.targets[0].id
+            call = node.value
+            if (
+                not name.startswith(cls.PREFIXES)
+                or not isinstance(call, ast.Call)
+                or not isinstance(call.func, ast.Name)
+                or call.func.id != "GUID"
+                or len(call.args) != 1
+                or not isinstance(call.args[0], ast.Constant)
+                or not isinstance(call.args[0].value, str)
+            ):
+                continue
+            found.append((GUIDSymbol(name, module, node.lineno), bytes(GUID(call.args[0].value))))
+        return found
+
+    @classmethod
+    def _scan_table(cls, keys: Sequence[ast.expr | None], values: Sequence[ast.expr], module: str) -> list[tuple[GUIDSymbol, bytes]]:
+        found: list[tuple[GUIDSymbol, bytes]] = []
+        for key, value in zip(keys, values):
+            if (
+                isinstance(key, ast.Constant)
+                and isinstance(key.value, str)
+                and key.value.startswith(cls.PREFIXES)
+                and isinstance(value, ast.Constant)
+                and isinstance(value.value, str)
+            ):
+                found.append((GUIDSymbol(key.value, module, key.lineno), bytes(GUID(value.value))))
+        return found
+
+
+GUID_SYMBOLS = GUIDSymbolRegistry()
+
+
+def guid_name(guid: GUID | str) -> str | None:
+    """The IID_*/CLSID_* constant name for `guid`, or None."""
+    return GUID_SYMBOLS.name_of(guid)
+
+
+def describe_guid(guid: GUID | str) -> str:
+    """`guid` prefixed with its IID_*/CLSID_* constant name when it has one, for logs and error messages."""
+    return GUID_SYMBOLS.describe(guid)
@@ -1,17 +1,67 @@
 from __future__ import annotations
 
-from ctypes import HRESULT as ctypesHRESULT, c_long  # noqa: N811
-from typing import TYPE_CHECKING, ClassVar, Literal, cast
+import importlib
+import sys
+import threading
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from ctypes import _SimpleCData, c_long
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, Iterable, Literal, NamedTuple, Sequence
+
+try:
+    from ctypes import FormatError
+except ImportError:  # Not on Windows: messages come from hresult_codes.py only.
+    FormatError = None
+
+try:
+    from ctypes import HRESULT as ctypesHRESULT  # noqa: N811
+except ImportError:  # Not on Windows. Same layout as the Windows type: a signed 32-bit LONG.
+
+    class ctypesHRESULT(_SimpleCData):  # noqa: N801
+        _type_ = "i"
 
 if TYPE_CHECKING:
+    import numpy  # pyright: ignore[reportMissingImports]
+
     from typing_extensions import Literal, Self  # pyright: ignore[reportMissingModuleSource]
 
 
 class HRESULTError(OSError):
-    ...
+    """A failed HRESULT. Only the code and the caller's description are stored, the decoded text is built by str().
+
+    Constructing one picks the most specific cached subclass (see error_class_for): a per-code class for well-known
+    codes (Cancelled, NoInterface, E_FAIL, ...), otherwise a per-facility class (Win32Error, RpcError, ...), so callers
+    can match by type instead of comparing codes after catching:
+        except Cancelled: ...
+    """
+
+    facility: ClassVar[int | None] = None
+    code: ClassVar[int | None] = None
+
+    def __new__(cls, hresult: int, short_desc: str = "") -> Self:
+        # OSError stores errno/strerror here (not in __init__) since __new__ is overridden.
+        if cls is HRESULTError:
+            cls = error_class_for(hresult)  # noqa: PLW0642
+        return super().__new__(cls, hresult & 0xFFFFFFFF, short_desc)
+
+    @property
+    def hresult(self) -> int:
+        return self.errno
+
+    @property
+    def short_desc(self) -> str:
+        return self.strerror
+
+    def __str__(self) -> str:
+        decoded = decode_hresult(self.errno)
+        return f"{self.strerror}\n{decoded}" if self.strerror else decoded
 
 
 class HRESULT(ctypesHRESULT):
+    # As defined in winerror.h; HRESULT_FACILITY() masks with 0x1FFF, which is what lets the DirectX facilities exceed 11 bits.
     FACILITY_CODES: ClassVar[dict[int, str]] = {
         0: "FACILITY_NULL",
         1: "FACILITY_RPC",
@@ -39,102 +89,61 @@ class HRESULT(ctypesHRESULT):
         25: "FACILITY_HTTP",
         26: "FACILITY_USERMODE_COMMONLOG",
         27: "FACILITY_WER",
-        28: "FACILITY_USERMODE_FILTER_MANAGER",
-        29: "FACILITY_BACKGROUNDCOPY",
-        30: "FACILITY_CONFIGURATION",
-        31: "FACILITY_STATE_MANAGEMENT",
-        32: "FACILITY_METADIRECTORY",
-        33: "FACILITY_SYSTEM_INTEGRITY",
-        34: "FACILITY_VIRTUALIZATION",
-        35: "FACILITY_VOLMGR",
-        36: "FACILITY_BCD",
-        37: "FACILITY_USERMODE_VHD",
-        38: "FACILITY_USERMODE_HYPERVISOR",
-        39: "FACILITY_USERMODE_VM",
-        40: "FACILITY_USERMODE_VOLSNAP",
-        41: "FACILITY_USERMODE_STORLIB",
-        42: "FACILITY_USERMODE_LICENSING",
-        43: "FACILITY_USERMODE_SMB",
-        44: "FACILITY_USERMODE_VSS",
-        45: "FACILITY_USERMODE_FILE_REPLICATION",
-        46: "FACILITY_USERMODE_NDIS",
-        47: "FACILITY_USERMODE_TPM",
-        48: "FACILITY_USERMODE_NT",
-        49: "FACILITY_USERMODE_USB",
-        50: "FACILITY_USERMODE_NTOS",
-        51: "FACILITY_USERMODE_COMPLUS",
-        52: "FACILITY_USERMODE_NET",
-        53: "FACILITY_USERMODE_CONFIGURATION_MANAGER",
-        54: "FACILITY_USERMODE_COM",
-        55: "FACILITY_USERMODE_DIRECTORY_SERVICE",
-        56: "FACILITY_USERMODE_CMI",
-        57: "FACILITY_USERMODE_LSA",
-        58: "FACILITY_USERMODE_RPC",
-        59: "FACILITY_USERMODE_IPSECVPN",
-        60: "FACILITY_USERMODE_NETWORK_POLICY",
-        61: "FACILITY_USERMODE_DNS_SERVER",
-        62: "FACILITY_USERMODE_DNS_SERVER_ADMIN",
-        63: "FACILITY_USERMODE_DNS_SERVER_CONFIGURATION",
-        64: "FACILITY_USERMODE_DNS_SERVER_TUNING",
-        65: "FACILITY_USERMODE_DNS_SERVER_ZONE",
-        66: "FACILITY_USERMODE_DNS_SERVER_FORWARDER",
-        67: "FACILITY_USERMODE_DNS_SERVER_REPLICATION",
-        68: "FACILITY_USERMODE_DNS_SERVER_NDNC",
-        69: "FACILITY_USERMODE_DNS_SERVER_FORWARDS",
-        70: "FACILITY_USERMODE_DNS_SERVER_DS",
-        71: "FACILITY_USERMODE_DNS_SERVER_ROOT_HINTS",
-        72: "FACILITY_USERMODE_DNS_SERVER_ZONE_SOURCE",
-        73: "FACILITY_USERMODE_DNS_SERVER_DATABASE",
-        74: "FACILITY_USERMODE_DNS_SERVER_PROTOCOL",
-        75: "FACILITY_USERMODE_DNS_SERVER_SERVICED",
-        76: "FACILITY_USERMODE_DNS_SERVER_SOCKETS",
-        77: "FACILITY_USERMODE_DNS_SERVER_SERVER_ADMIN",
-        78: "FACILITY_USERMODE_DNS_SERVER_SOAP",
-        79: "FACILITY_USERMODE_DNS_SERVER_ISAPI",
-        80: "FACILITY_USERMODE_DNS_SERVER_WEB",
-        81: "FACILITY_USERMODE_DNS_SERVER_SERVER",
-        82: "FACILITY_USERMODE_DNS_SERVER_ADMIN_R2",
-        83: "FACILITY_USERMODE_DNS_SERVER_ISAPI_FILTER",
-        84: "FACILITY_USERMODE_DNS_SERVER_NDNC2",
-        85: "FACILITY_USERMODE_DNS_SERVER_EVENTLOG",
-        86: "FACILITY_USERMODE_DNS_SERVER_ADMIN2",
-        87: "FACILITY_USERMODE_DNS_SERVER_ZONE2",
-        88: "FACILITY_USERMODE_DNS_SERVER_NDNC3",
-        89: "FACILITY_USERMODE_DNS_SERVER_SOCKETS2",
-        90: "FACILITY_USERMODE_DNS_SERVER_ADMIN3",
-        91: "FACILITY_USERMODE_DNS_SERVER_WEB2",
-        92: "FACILITY_USERMODE_DNS_SERVER_ADMIN4",
-        93: "FACILITY_USERMODE_DNS_SERVER_SERVER3",
-        94: "FACILITY_USERMODE_DNS_SERVER_SOCKETS3",
-        95: "FACILITY_USERMODE_DNS_SERVER_ADMIN5",
-        96: "FACILITY_USERMODE_DNS_SERVER_SERVER4",
-        97: "FACILITY_USERMODE_DNS_SERVER_ADMIN6",
-        98: "FACILITY_USERMODE_DNS_SERVER_SOCKETS4",
-        99: "FACILITY_USERMODE_DNS_SERVER_WEB3",
+        31: "FACILITY_USERMODE_FILTER_MANAGER",
+        32: "FACILITY_BACKGROUNDCOPY",
+        33: "FACILITY_CONFIGURATION",
+        34: "FACILITY_STATE_MANAGEMENT",
+        35: "FACILITY_METADIRECTORY",
+        36: "FACILITY_WINDOWSUPDATE",
+        37: "FACILITY_DIRECTORYSERVICE",
+        38: "FACILITY_GRAPHICS",
+        39: "FACILITY_SHELL",
+        40: "FACILITY_TPM_SERVICES",
+        41: "FACILITY_TPM_SOFTWARE",
+        42: "FACILITY_UI",
+        43: "FACILITY_XAML",
+        44: "FACILITY_ACTION_QUEUE",
+        48: "FACILITY_PLA",
+        49: "FACILITY_FVE",
+        50: "FACILITY_FWP",
+        51: "FACILITY_WINRM",
+        52: "FACILITY_NDIS",
+        53: "FACILITY_USERMODE_HYPERVISOR",
+        54: "FACILITY_CMI",
+        55: "FACILITY_USERMODE_VIRTUALIZATION",
+        56: "FACILITY_USERMODE_VOLMGR",
+        57: "FACILITY_BCD",
+        58: "FACILITY_USERMODE_VHD",
+        60: "FACILITY_SDIAG",
+        61: "FACILITY_WEBSERVICES",
+        80: "FACILITY_WINDOWS_DEFENDER",
+        81: "FACILITY_OPC",
+        82: "FACILITY_XPS",
+        83: "FACILITY_RAS",
+        84: "FACILITY_MBN",
+        109: "FACILITY_VISUALCPP",
+        176: "FACILITY_DEBUGGERS",
+        2169: "FACILITY_DIRECT3D10",
+        2170: "FACILITY_DXGI",
+        2200: "FACILITY_WINCODEC_DWRITE_DWM",
+        2201: "FACILITY_DIRECT2D",
     }
 
     def __new__(
         cls, value: HRESULT | ctypesHRESULT | int | c_long | None = None
     ) -> Self:
-        if value is None:
-            converted_value = 0
-        elif isinstance(value, int):
-            converted_value = value
-        elif isinstance(getattr(value, "value", None), int):
-            converted_value = value.value
-        else:
-            raise TypeError(f"Invalid type for HRESULT: {type(value)}")
-        instance = c_long(converted_value)
-        instance.__class__ = cls
-        return cast(cls, instance)
+        # Only allocates the zeroed buffer; __init__ validates and stores the value.
+        return ctypesHRESULT.__new__(cls)
 
     def __init__(self, value: HRESULT | ctypesHRESULT | int | c_long | None = None):
-        if value is None:
-            self.value = 0
+        if value.__class__ is int:
+            ctypesHRESULT.__init__(self, value)
+        elif value is None:
+            pass  # Already 0 (S_OK).
         elif isinstance(value, int):
-            self.value = value
+            ctypesHRESULT.__init__(self, int(value))
         elif isinstance(getattr(value, "value", None), int):
-            self.value = value.value
+            ctypesHRESULT.__init__(self, value.value)
         else:
             raise TypeError(f"Invalid type for HRESULT: {type(value)}")
 
@@ -153,20 +162,8 @@ class HRESULT(ctypesHRESULT):
             return value & 0xFFFFFFFF
         return value
 
-    def decode(self):
-        severity: int = (self >> 31) & 1
-        facility: int = (self >> 16) & 0x1FFF
-        code: int = self & 0xFFFF
-
-        severity_str: Literal["Success", "Failure"] = "Success" if severity == 0 else "Failure"
-        facility_str: str = HRESULT.FACILITY_CODES.get(facility, "Unknown Facility")
-
-        return (
-            f"HRESULT: 0x{self:08X}\n"
-            f"Severity: {severity_str}\n"
-            f"Facility: {facility_str} ({facility})\n"
-            f"Code: 0x{code:04X} ({code})"
-        )
+    def decode(self) -> str:
+        return decode_hresult(self)
 
     def __str__(self):
         return str(self.to_hresult(self.value))
@@ -177,18 +174,26 @@ class HRESULT(ctypesHRESULT):
     def __eq__(
         self, other: int | ctypesHRESULT
     ) -> bool:  # sourcery skip: assign-if-exp, reintroduce-else
-        if not isinstance(other, int) and (not hasattr(other, "value") or not isinstance(other.value, int)):
-            return NotImplemented
-        other_int = self.to_hresult(other.value if isinstance(other, (HRESULT, ctypesHRESULT, c_long)) else other)
-        return self.value == other_int
+        # Compared as signed 32-bit values, so 0x80004005 and -2147467259 both match E_FAIL.
+        # The common `hr == S_OK`/`hr == 0` case is one int comparison and allocates nothing.
+        if other.__class__ is not int:
+            other = _signed_operand(other)
+            if other is None:
+                return NotImplemented
+        elif other > 0x7FFFFFFF:
+            other -= 0x100000000
+        return self.value == other
 
     def __ne__(
         self, other: HRESULT | ctypesHRESULT | int | c_long
     ) -> bool:  # sourcery skip: assign-if-exp, reintroduce-else
-        if not isinstance(other, int) and (not hasattr(other, "value") or not isinstance(other.value, int)):
-            return NotImplemented
-        other_int = self.to_hresult(other.value if isinstance(other, (HRESULT, ctypesHRESULT, c_long)) else other)
-        return self.value != other_int
+        if other.__class__ is not int:
+            other = _signed_operand(other)
+            if other is None:
+                return NotImplemented
+        elif other > 0x7FFFFFFF:
+            other -= 0x100000000
+        return self.value != other
 
     def __int__(self) -> int:
         return self.to_hresult(self.value)
@@ -357,19 +362,118 @@ class HRESULT(ctypesHRESULT):
         return format(self.to_hresult(self.value), format_spec)
 
     def exception(self, short_desc: str = "") -> HRESULTError:
-        return HRESULTError(self.to_hresult(self.value), decode_hresult(self), short_desc or "")
+        return HRESULTError(self.value, short_desc or "")
 
     @classmethod
-    def raise_for_status(cls, hresult: HRESULT | ctypesHRESULT | Self | int, short_desc: str = "", *, ignore_s_false: bool = False):
-        hr: Self = hresult if isinstance(hresult, cls) else cls(hresult)
-        if (hr == 1 and not ignore_s_false) or hr not in (0, 1):
-            raise hr.exception(short_desc)
+    def raise_for_status(cls, hresult: HRESULT | ctypesHRESULT | Self | int | None, short_desc: str = "", *, ignore_s_false: bool = False):
+        cls.check(hresult, short_desc, ignore_s_false=ignore_s_false)
 
+    @classmethod
+    def check(cls, hresult: HRESULT | ctypesHRESULT | int | None, short_desc: str = "", *, ignore_s_false: bool = False) -> int:
+        """Raise unless `hresult` is S_OK (or S_FALSE with `ignore_s_false`), otherwise return it as a signed int.
+
+        Meant for raw int results straight from a COM call: on success no HRESULT is constructed and nothing is allocated.
+        None counts as S_OK, like HRESULT(None): comtypes wrappers strip the HRESULT and return None when the call succeeds.
+        """
+        if hresult.__class__ is not int:
+            if hresult is None:
+                return 0
+            value = _signed_operand(hresult)
+            if value is None:
+                raise TypeError(f"Invalid type for HRESULT: {type(hresult)}")
+            hresult = value
+        if hresult == 0 or (hresult == 1 and ignore_s_false):
+            return hresult
+        raise cls(hresult).exception(short_desc)
+
+
+
+def _signed_operand(value: object) -> int | None:
+    """`value` (an int, HRESULT or ctypes integer) as a signed 32-bit int, None for anything else."""
+    if not isinstance(value, int):
+        value = getattr(value, "value", None)
+        if not isinstance(value, int):
+            return None
+    return value - 0x100000000 if value > 0x7FFFFFFF else int(value)
+
+
+class HRESULTCodeTable:
+    """Maps well-known HRESULT values to their winerror.h name and message.
+
+    The rows live in hresult_codes.py, which is imported on the first lookup only (i.e. on the first failed call), so
+    importing this module costs nothing. They are compiled into a sorted array of codes plus parallel name/message
+    tuples and searched with bisect. Works everywhere; on Windows, codes missing from the table fall back to
+    FormatMessageW (through ctypes.FormatError) for the message.
+    """
+
+    def __init__(self, module: str = "hresult_codes"):
+        self.module: str = module
+        self._codes: array[int] | None = None
+        self._names: tuple[str, ...] = ()
+        self._messages: tuple[str, ...] = ()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._codes is not None
+
+    def _load(self) -> array[int]:
+        with self._lock:
+            if self._codes is None:
+                rows = sorted(importlib.import_module(self.module).HRESULT_CODES)
+                self._names = tuple(row[1] for row in rows)
+                self._messages = tuple(row[2] for row in rows)
+                self._codes = array("I", (row[0] for row in rows))
+            return self._codes
+
+    def _index(self, hresult: int) -> int | None:
+        codes = self._codes
+        if codes is None:
+            codes = self._load()
+        hresult &= 0xFFFFFFFF
+        index = bisect_left(codes, hresult)
+        return index if index < len(codes) and codes[index] == hresult else None
+
+    def lookup(self, hresult: HRESULT | int) -> tuple[str, str] | None:
+        """(name, message) for `hresult`, or None if it is not a well-known code."""
+        index = self._index(hresult.value if isinstance(hresult, HRESULT) else hresult)
+        return None if index is None else (self._names[index], self._messages[index])
+
+    def name(self, hresult: HRESULT | int) -> str | None:
+        entry = self.lookup(hresult)
+        return None if entry is None else entry[0]
+
+    def message(self, hresult: HRESULT | int) -> str | None:
+        entry = self.lookup(hresult)
+        if entry is not None:
+            return entry[1]
+        if FormatError is None:
+            return None
+        message = FormatError(hresult_to_winerror(int(hresult) & 0xFFFFFFFF)).strip()
+        return None if not message or message.startswith("<no description>") else message
+
+
+HRESULT_CODES = HRESULTCodeTable()
+
+
+def hresult_name(hresult: HRESULT | int) -> str | None:
+    """The winerror.h name of `hresult` ('E_NOINTERFACE', 'ERROR_CANCELLED', ...), or None."""
+    return HRESULT_CODES.name(hresult)
+
+
+def hresult_message(hresult: HRESULT | int) -> str | None:
+    """The system message for `hresult`, or None."""
+    return HRESULT_CODES.message(hresult)
 
 
 def decode_hresult(hresult: HRESULT | int) -> str:
     if isinstance(hresult, HRESULT):
         hresult = hresult.value
+    return _format_hresult(hresult & 0xFFFFFFFF)
+
+
+@lru_cache(maxsize=256)
+def _format_hresult(hresult: int) -> str:
     severity: int = (hresult >> 31) & 1
     facility: int = (hresult >> 16) & 0x1FFF
     code: int = hresult & 0xFFFF
@@ -377,12 +481,195 @@ def decode_hresult(hresult: HRESULT | int) -> str:
     severity_str: Literal["Success", "Failure"] = "Success" if severity == 0 else "Failure"
     facility_str = HRESULT.FACILITY_CODES.get(facility, "Unknown Facility")
 
-    return (
-        f"HRESULT: 0x{HRESULT.to_hresult(hresult):08X}\n"
+    decoded = (
+        f"HRESULT: 0x{hresult:08X}\n"
         f"Severity: {severity_str}\n"
         f"Facility: {facility_str} ({facility})\n"
         f"Code: 0x{code:04X} ({code})"
     )
+    name, message = hresult_name(hresult), hresult_message(hresult)
+    if name is not None:
+        decoded += f"\nName: {name}"
+    if message is not None:
+        decoded += f"\nMessage: {message}"
+    return decoded
+
+
+_FACILITY_ERRORS: dict[int, type[HRESULTError]] = {}
+_CODE_ERRORS: dict[int, type[HRESULTError]] = {}
+_ERROR_CLASSES_LOCK = threading.Lock()
+
+
+def facility_error_class(facility: int) -> type[HRESULTError]:
+    """The HRESULTError subclass for `facility`, e.g. Win32Error for FACILITY_WIN32. Created once, then cached."""
+    cls = _FACILITY_ERRORS.get(facility)
+    if cls is None:
+        with _ERROR_CLASSES_LOCK:
+            cls = _FACILITY_ERRORS.get(facility)
+            if cls is None:
+                cls = type(_facility_class_name(facility), (HRESULTError,), {"facility": facility, "__module__": __name__})
+                _FACILITY_ERRORS[facility] = cls
+    return cls
+
+
+def _facility_class_name(facility: int) -> str:
+    name = HRESULT.FACILITY_CODES.get(facility)
+    if name is None:
+        words = f"FACILITY{facility}"
+    else:  # str.removeprefix needs Python 3.9.
+        words = name[len("FACILITY_"):] if name.startswith("FACILITY_") else name
+    return f"{words.title().replace('_', '')}Error"
+
+
+def error_class_for(hresult: HRESULT | int) -> type[HRESULTError]:
+    """The most specific HRESULTError subclass for `hresult`.
+
+    Well-known codes (those in hresult_codes.py) get their own class named after the winerror.h symbol, derived from the
+    facility class; a few common ones have friendlier names (Cancelled, NoInterface, ...). Other codes share their
+    facility's class. Classes are created on first use and cached.
+    """
+    hresult = (hresult.value if isinstance(hresult, HRESULT) else hresult) & 0xFFFFFFFF
+    cls = _CODE_ERRORS.get(hresult)
+    if cls is not None:
+        return cls
+    name = hresult_name(hresult)
+    if name is None:
+        return facility_error_class((hresult >> 16) & 0x1FFF)
+    return _define_code_error(hresult, name)
+
+
+def _define_code_error(hresult: int, name: str) -> type[HRESULTError]:
+    base = facility_error_class((hresult >> 16) & 0x1FFF)
+    with _ERROR_CLASSES_LOCK:
+        cls = _CODE_ERRORS.get(hresult)
+        if cls is None:
+            cls = type(name, (base,), {"code": hresult, "__module__": __name__})
+            _CODE_ERRORS[hresult] = cls
+    return cls
+
+
+def __getattr__(name: str) -> type[HRESULTError]:
+    """Resolve generated error classes (hresult.E_FAIL, hresult.ShellError, ...) by name, which is what pickle does.
+
+    Only names shaped like one are looked up, a winerror.h symbol (E_FAIL) or a facility class (ShellError): anything
+    else, e.g. a hasattr() probe from an introspection tool, fails at once without loading the code table.
+    """
+    if name.endswith("Error") and name[:1].isupper():
+        for facility in HRESULT.FACILITY_CODES:
+            if _facility_class_name(facility) == name:
+                return facility_error_class(facility)
+    elif "_" in name and name.isupper() and not name.startswith("_"):
+        for cls in _CODE_ERRORS.values():
+            if cls.__name__ == name:
+                return cls
+        HRESULT_CODES.lookup(0)  # Make sure the table is loaded before searching it.
+        if name in HRESULT_CODES._names:  # noqa: SLF001
+            return error_class_for(HRESULT_CODES._codes[HRESULT_CODES._names.index(name)])  # pyright: ignore[reportOptionalSubscript]  # noqa: SLF001
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class HRESULTColumns(NamedTuple):
+    """Decoded columns for a batch of HRESULTs, see decode_hresults.
+
+    The columns are array.array('B'/'H') from the pure-Python path or numpy uint8/uint16 arrays from the NumPy path.
+    """
+
+    severity: Sequence[int]
+    facility: Sequence[int]
+    code: Sequence[int]
+    facility_histogram: dict[str, int]
+
+
+_SEVERITY_FROM_TOP_BYTE = bytes(byte >> 7 for byte in range(256))
+_FACILITY_FROM_TOP_BYTE = bytes(byte & 0x1F for byte in range(256))
+
+
+def decode_hresults(
+    hresults: array[int] | bytes | bytearray | memoryview | numpy.ndarray | Iterable[int],
+    *,
+    use_numpy: bool | None = None,
+) -> HRESULTColumns:
+    """Decode many HRESULTs at once into severity, facility and code columns plus a facility name histogram.
+
+    `hresults` may be an array('i')/array('I'), a bytes-like buffer of native 32-bit values, a NumPy integer array or
+    any iterable of ints (signed or unsigned). NumPy is used when it is installed (`use_numpy=None`), forced with True or
+    skipped with False. Without it, the columns are still computed in C: the buffer is split into its bytes with strided
+    slices and the severity/facility bits are masked with bytes.translate, nothing loops per value in Python.
+    """
+    if use_numpy is None:
+        use_numpy = _numpy() is not None
+    if use_numpy:
+        return _decode_hresults_numpy(hresults)
+    raw = _hresult_bytes(hresults)
+    top = raw[3::4]
+    severity = array("B", top.translate(_SEVERITY_FROM_TOP_BYTE))
+    facility_bytes = bytearray(len(raw) // 2)
+    facility_bytes[0::2] = raw[2::4]
+    facility_bytes[1::2] = top.translate(_FACILITY_FROM_TOP_BYTE)
+    code_bytes = bytearray(len(raw) // 2)
+    code_bytes[0::2] = raw[0::4]
+    code_bytes[1::2] = raw[1::4]
+    facility, code = array("H"), array("H")
+    facility.frombytes(facility_bytes)
+    code.frombytes(code_bytes)
+    if sys.byteorder != "little":
+        facility.byteswap()
+        code.byteswap()
+    return HRESULTColumns(severity, facility, code, _facility_histogram(Counter(facility).items()))
+
+
+def _hresult_bytes(hresults: array[int] | bytes | bytearray | memoryview | Iterable[int]) -> bytes:
+    """The values as little-endian unsigned 32-bit ints, in one bytes object."""
+    if isinstance(hresults, array) and hresults.itemsize != 4:
+        hresults = array("I", [value & 0xFFFFFFFF for value in hresults])
+    if isinstance(hresults, (bytes, bytearray, memoryview, array)):
+        raw = memoryview(hresults).cast("B")
+        if len(raw) % 4:
+            raise ValueError(f"HRESULT buffer size must be a multiple of 4 bytes, got {len(raw)}")
+        if sys.byteorder == "little":
+            return raw.tobytes()
+        swapped = array("I", raw.tobytes())
+        swapped.byteswap()
+        return swapped.tobytes()
+    return _hresult_bytes(array("I", [value & 0xFFFFFFFF for value in hresults]))
+
+
+def _decode_hresults_numpy(hresults: numpy.ndarray | array[int] | bytes | bytearray | memoryview | Iterable[int]) -> HRESULTColumns:
+    np = _numpy()
+    if np is None:
+        raise ImportError("decode_hresults(use_numpy=True) requires numpy")
+    if isinstance(hresults, (bytes, bytearray, memoryview)):
+        values = np.frombuffer(hresults, dtype=np.uint32)
+    else:
+        values = np.asarray(hresults if isinstance(hresults, (np.ndarray, array)) else list(hresults))
+        if values.dtype.kind not in "iu":
+            raise TypeError(f"Expected integer HRESULTs, got dtype {values.dtype}")
+        values = values.view(np.uint32) if values.dtype.itemsize == 4 else (values.astype(np.int64) & 0xFFFFFFFF).astype(np.uint32)
+    facility = ((values >> 16) & 0x1FFF).astype(np.uint16)
+    counts = np.bincount(facility)
+    present = np.flatnonzero(counts)
+    return HRESULTColumns(
+        (values >> 31).astype(np.uint8),
+        facility,
+        (values & 0xFFFF).astype(np.uint16),
+        _facility_histogram(zip(present.tolist(), counts[present].tolist())),
+    )
+
+
+def _facility_histogram(counts: Iterable[tuple[int, int]]) -> dict[str, int]:
+    histogram: dict[str, int] = {}
+    for facility, count in sorted(counts, key=lambda item: -item[1]):
+        name = HRESULT.FACILITY_CODES.get(facility, f"Unknown Facility ({facility})")
+        histogram[name] = count
+    return histogram
+
+
+def _numpy():
+    try:
+        import numpy as np  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return np
 
 
 def print_hresult(hresult: HRESULT | int) -> None:
@@ -401,6 +688,22 @@ def winerror_to_hresult(winerror: int) -> int:
 S_OK = HRESULT(0)
 S_FALSE = HRESULT(1)
 
+NullError = facility_error_class(0)
+RpcError = facility_error_class(1)
+DispatchError = facility_error_class(2)
+StorageError = facility_error_class(3)
+ItfError = facility_error_class(4)
+Win32Error = facility_error_class(7)
+
+NoInterface = _define_code_error(0x80004002, "NoInterface")
+Unexpected = _define_code_error(0x8000FFFF, "Unexpected")
+ClassNotRegistered = _define_code_error(0x80040154, "ClassNotRegistered")
+NotInitialized = _define_code_error(0x800401F0, "NotInitialized")
+AccessDenied = _define_code_error(0x80070005, "AccessDenied")
+InvalidArgument = _define_code_error(0x80070057, "InvalidArgument")
+ElementNotFound = _define_code_error(0x80070490, "ElementNotFound")
+Cancelled = _define_code_error(0x800704C7, "Cancelled")
+
 
 if __name__ == "__main__":
     # Example usage:
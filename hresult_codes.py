@@ -0,0 +1,107 @@
+"""Well-known HRESULT values with their winerror.h names and system messages.
+
+Rows are (unsigned HRESULT, name, message). Win32 errors are listed in their HRESULT_FROM_WIN32 form (0x8007xxxx).
+Where winerror.h defines several names for one value, the COM name is used (E_ACCESSDENIED over ERROR_ACCESS_DENIED).
+hresult.py imports this module on the first failed call only and compiles it into sorted arrays; see HRESULTCodeTable.
+"""
+
+from __future__ import annotations
+
+HRESULT_CODES: tuple[tuple[int, str, str], ...] = (
+    (0x00000000, "S_OK", "The operation completed successfully."),
+    (0x00000001, "S_FALSE", "The operation completed successfully but returned false."),
+    (0x8000000A, "E_PENDING", "The data necessary to complete this operation is not yet available."),
+    (0x8000000B, "E_BOUNDS", "The operation attempted to access data outside the valid range."),
+    (0x8000000C, "E_CHANGED_STATE", "A concurrent or interleaved operation changed the state of the object, invalidating this operation."),
+    (0x8000000E, "E_ILLEGAL_METHOD_CALL", "A method was called at an unexpected time."),
+    (0x80004001, "E_NOTIMPL", "Not implemented."),
+    (0x80004002, "E_NOINTERFACE", "No such interface supported."),
+    (0x80004003, "E_POINTER", "Invalid pointer."),
+    (0x80004004, "E_ABORT", "Operation aborted."),
+    (0x80004005, "E_FAIL", "Unspecified error."),
+    (0x8000FFFF, "E_UNEXPECTED", "Catastrophic failure."),
+    (0x80010001, "RPC_E_CALL_REJECTED", "Call was rejected by callee."),
+    (0x80010105, "RPC_E_SERVERFAULT", "The server threw an exception."),
+    (0x80010106, "RPC_E_CHANGED_MODE", "Cannot change thread mode after it is set."),
+    (0x80010108, "RPC_E_DISCONNECTED", "The object invoked has disconnected from its clients."),
+    (0x8001010A, "RPC_E_SERVERCALL_RETRYLATER", "The message filter indicated that the application is busy."),
+    (0x8001010E, "RPC_E_WRONG_THREAD", "The application called an interface that was marshalled for a different thread."),
+    (0x80010119, "RPC_E_TOO_LATE", "Security must be initialized before any interfaces are marshalled or unmarshalled. It cannot be changed once initialized."),
+    (0x80020001, "DISP_E_UNKNOWNINTERFACE", "Unknown interface."),
+    (0x80020003, "DISP_E_MEMBERNOTFOUND", "Member not found."),
+    (0x80020004, "DISP_E_PARAMNOTFOUND", "Parameter not found."),
+    (0x80020005, "DISP_E_TYPEMISMATCH", "Type mismatch."),
+    (0x80020006, "DISP_E_UNKNOWNNAME", "Unknown name."),
+    (0x80020009, "DISP_E_EXCEPTION", "Exception occurred."),
+    (0x8002000B, "DISP_E_BADINDEX", "Invalid index."),
+    (0x8002000E, "DISP_E_BADPARAMCOUNT", "Invalid number of parameters."),
+    (0x8002801D, "TYPE_E_LIBNOTREGISTERED", "Library not registered."),
+    (0x8002802B, "TYPE_E_ELEMENTNOTFOUND", "Element not found."),
+    (0x80030001, "STG_E_INVALIDFUNCTION", "Unable to perform requested operation."),
+    (0x80030002, "STG_E_FILENOTFOUND", "The file could not be found."),
+    (0x80030003, "STG_E_PATHNOTFOUND", "The path could not be found."),
+    (0x80030005, "STG_E_ACCESSDENIED", "Access denied."),
+    (0x80030020, "STG_E_SHAREVIOLATION", "A share violation has occurred."),
+    (0x80030021, "STG_E_LOCKVIOLATION", "A lock violation has occurred."),
+    (0x80030050, "STG_E_FILEALREADYEXISTS", "The file already exists."),
+    (0x80030070, "STG_E_MEDIUMFULL", "There is insufficient disk space to complete operation."),
+    (0x80040110, "CLASS_E_NOAGGREGATION", "Class does not support aggregation (or class object is remote)."),
+    (0x80040111, "CLASS_E_CLASSNOTAVAILABLE", "ClassFactory cannot supply requested class."),
+    (0x80040154, "REGDB_E_CLASSNOTREG", "Class not registered."),
+    (0x80040155, "REGDB_E_IIDNOTREG", "Interface not registered."),
+    (0x800401F0, "CO_E_NOTINITIALIZED", "CoInitialize has not been called."),
+    (0x800401F1, "CO_E_ALREADYINITIALIZED", "CoInitialize has already been called."),
+    (0x800401F3, "CO_E_CLASSSTRING", "Invalid class string."),
+    (0x800401F5, "CO_E_APPNOTFOUND", "Application not found."),
+    (0x800401F8, "CO_E_DLLNOTFOUND", "DLL for class not found."),
+    (0x80040200, "CONNECT_E_NOCONNECTION", "There is no connection for this connection ID."),
+    (0x80040201, "CONNECT_E_ADVISELIMIT", "Need to unadvise first."),
+    (0x80040202, "CONNECT_E_CANNOTCONNECT", "Cannot establish the connection."),
+    (0x80070001, "ERROR_INVALID_FUNCTION", "Incorrect function."),
+    (0x80070002, "ERROR_FILE_NOT_FOUND", "The system cannot find the file specified."),
+    (0x80070003, "ERROR_PATH_NOT_FOUND", "The system cannot find the path specified."),
+    (0x80070004, "ERROR_TOO_MANY_OPEN_FILES", "The system cannot open the file."),
+    (0x80070005, "E_ACCESSDENIED", "Access is denied."),
+    (0x80070006, "E_HANDLE", "The handle is invalid."),
+    (0x80070008, "ERROR_NOT_ENOUGH_MEMORY", "Not enough memory resources are available to process this command."),
+    (0x8007000B, "ERROR_BAD_FORMAT", "An attempt was made to load a program with an incorrect format."),
+    (0x8007000D, "ERROR_INVALID_DATA", "The data is invalid."),
+    (0x8007000E, "E_OUTOFMEMORY", "Not enough memory resources are available to complete this operation."),
+    (0x8007000F, "ERROR_INVALID_DRIVE", "The system cannot find the drive specified."),
+    (0x80070013, "ERROR_WRITE_PROTECT", "The media is write protected."),
+    (0x80070015, "ERROR_NOT_READY", "The device is not ready."),
+    (0x80070020, "ERROR_SHARING_VIOLATION", "The process cannot access the file because it is being used by another process."),
+    (0x80070021, "ERROR_LOCK_VIOLATION", "The process cannot access the file because another process has locked a portion of the file."),
+    (0x80070026, "ERROR_HANDLE_EOF", "Reached the end of the file."),
+    (0x80070032, "ERROR_NOT_SUPPORTED", "The request is not supported."),
+    (0x80070035, "ERROR_BAD_NETPATH", "The network path was not found."),
+    (0x80070050, "ERROR_FILE_EXISTS", "The file exists."),
+    (0x80070057, "E_INVALIDARG", "The parameter is incorrect."),
+    (0x8007006D, "ERROR_BROKEN_PIPE", "The pipe has been ended."),
+    (0x80070070, "ERROR_DISK_FULL", "There is not enough space on the disk."),
+    (0x8007007A, "ERROR_INSUFFICIENT_BUFFER", "The data area passed to a system call is too small."),
+    (0x8007007B, "ERROR_INVALID_NAME", "The filename, directory name, or volume label syntax is incorrect."),
+    (0x8007007E, "ERROR_MOD_NOT_FOUND", "The specified module could not be found."),
+    (0x8007007F, "ERROR_PROC_NOT_FOUND", "The specified procedure could not be found."),
+    (0x80070091, "ERROR_DIR_NOT_EMPTY", "The directory is not empty."),
+    (0x800700A1, "ERROR_BAD_PATHNAME", "The specified path is invalid."),
+    (0x800700B7, "ERROR_ALREADY_EXISTS", "Cannot create a file when that file already exists."),
+    (0x800700CE, "ERROR_FILENAME_EXCED_RANGE", "The filename or extension is too long."),
+    (0x800700EA, "ERROR_MORE_DATA", "More data is available."),
+    (0x80070103, "ERROR_NO_MORE_ITEMS", "No more data is available."),
+    (0x8007010B, "ERROR_DIRECTORY", "The directory name is invalid."),
+    (0x800702E4, "ERROR_ELEVATION_REQUIRED", "The requested operation requires elevation."),
+    (0x800703E3, "ERROR_OPERATION_ABORTED", "The I/O operation has been aborted because of either a thread exit or an application request."),
+    (0x800703E6, "ERROR_NOACCESS", "Invalid access to memory location."),
+    (0x800703EC, "ERROR_INVALID_FLAGS", "Invalid flags."),
+    (0x80070490, "ERROR_NOT_FOUND", "Element not found."),
+    (0x800704C7, "ERROR_CANCELLED", "The operation was canceled by the user."),
+    (0x800704CF, "ERROR_NETWORK_UNREACHABLE", "The network location cannot be reached."),
+    (0x800704D5, "ERROR_RETRY", "The operation could not be completed. A retry should be performed."),
+    (0x80070522, "ERROR_PRIVILEGE_NOT_HELD", "A required privilege is not held by the client."),
+    (0x80070578, "ERROR_INVALID_WINDOW_HANDLE", "Invalid window handle."),
+    (0x80070585, "ERROR_INVALID_INDEX", "Invalid index."),
+    (0x800705B4, "ERROR_TIMEOUT", "This operation returned because the timeout period expired."),
+    (0x8007139F, "ERROR_INVALID_STATE", "The group or resource is not in the correct state to perform the requested operation."),
+    (0x80080005, "CO_E_SERVER_EXEC_FAILURE", "Server execution failed."),
+)
@@ -0,0 +1,204 @@
+"""Compile declarative COM interface specs into binding modules, cached on disk.
+
+An InterfaceSpec states an interface once: its name, IID, parent and methods in vtable order, with in/out parameters.
+compile_interfaces() generates the source of a binding module for one backend:
+  - "raw": iunknown.COMBase interfaces plus their vtable Structures, as interfaces_large_backup.py writes by hand.
+The comtypes interfaces stay hand-written in interfaces.py; test_interface_compiler checks the specs against them.
+load_interfaces() writes the generated module to a cache directory under a hash of the specs, backend and compiler
+version, and imports it from there. Later starts skip validation and code generation and load the module's bytecode.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+from com_types import GUID
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+COMPILER_VERSION = 1  # Part of the cache key: bump it whenever the generated code changes.
+BACKENDS: tuple[str, ...] = ("raw",)
+DEFAULT_CACHE_DIR: Path = Path(os.environ.get("PYIFILEDIALOG_BINDINGS_CACHE", Path(__file__).with_name("__pycache__") / "interface_bindings"))
+
+# The names a spec type expression may use besides the interfaces being compiled; generated modules import all of them.
+TYPE_NAMES: frozenset[str] = frozenset({"POINTER", "GUID", "HRESULT", "BOOL", "DWORD", "HWND", "LPCWSTR", "LPWSTR", "ULONG", "c_int", "c_uint", "c_ulong", "c_void_p", "c_wchar_p"})
+ROOT_INTERFACE = "IUnknown"
+
+
+class Param(NamedTuple):
+    direction: str  # "in" or "out".
+    type: str  # A ctypes type expression over TYPE_NAMES and interface names, e.g. "POINTER(POINTER(IShellItem))".
+    name: str
+
+
+class Method(NamedTuple):
+    name: str
+    params: tuple[Param, ...] = ()
+    restype: str = "HRESULT"
+
+
+class InterfaceSpec(NamedTuple):
+    name: str
+    iid: str
+    parent: str  # ROOT_INTERFACE or the name of another spec compiled alongside.
+    methods: tuple[Method, ...]
+
+
+def method(name: str, *params: tuple[str, str, str], restype: str = "HRESULT") -> Method:
+    """Compact Method constructor: method("GetDisplayName", ("in", "c_ulong", "sigdnName"), ("out", "POINTER(LPWSTR)", "ppszName"))."""
+    return Method(name, tuple(Param(*param) for param in params), restype)
+
+
+def spec_hash(specs: Sequence[InterfaceSpec], backend: str) -> str:
+    return hashlib.sha256(repr((COMPILER_VERSION, backend, tuple(specs))).encode()).hexdigest()[:16]
+
+
+def type_names(expression: str) -> set[str]:
+    """The names a spec type expression uses: type_names("POINTER(POINTER(IShellItem))") == {"POINTER", "IShellItem"}."""
+    import ast  # Only needed to compile specs: loading cached bindings does not pay for it.
+
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid type expression {expression!r}") from e
+    names: set[str] = set()
+    for node in ast.walk(tree.body):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif not isinstance(node, (ast.Call, ast.Load)):
+            raise ValueError(f"Type expression {expression!r} may only use names and calls")
+    return names
+
+
+def ordered(specs: Sequence[InterfaceSpec]) -> list[InterfaceSpec]:
+    """Validate `specs` and return them parents first (otherwise in the given order)."""
+    by_name: dict[str, InterfaceSpec] = {}
+    for spec in specs:
+        if spec.name in by_name or spec.name == ROOT_INTERFACE:
+            raise ValueError(f"Interface {spec.name} is defined more than once")
+        by_name[spec.name] = spec
+    interfaces = {ROOT_INTERFACE, *by_name}
+    for spec in specs:
+        try:
+            GUID(spec.iid)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Interface {spec.name} has a malformed IID {spec.iid!r}") from e
+        if spec.parent not in interfaces:
+            raise ValueError(f"Interface {spec.name} derives from unknown interface {spec.parent}")
+        for entry in spec.methods:
+            for expression in (entry.restype, *(param.type for param in entry.params)):
+                unknown = type_names(expression) - TYPE_NAMES - interfaces
+                if unknown:
+                    raise ValueError(f"{spec.name}.{entry.name}: unknown names {sorted(unknown)} in {expression!r}")
+            for param in entry.params:
+                if param.direction not in ("in", "out"):
+                    raise ValueError(f"{spec.name}.{entry.name}: parameter {param.name} must be 'in' or 'out', not {param.direction!r}")
+
+    result: list[InterfaceSpec] = []
+    done: set[str] = {ROOT_INTERFACE}
+    for spec in specs:
+        chain: list[InterfaceSpec] = []
+        name = spec.name
+        while name not in done:
+            if by_name[name] in chain:
+                raise ValueError(f"Interface {spec.name} has a cyclic parent chain")
+            chain.append(by_name[name])
+            name = by_name[name].parent
+        for pending in reversed(chain):
+            done.add(pending.name)
+            result.append(pending)
+    return result
+
+
+def _header(backend: str, specs: list[InterfaceSpec], key: str) -> list[str]:
+    lines = [
+        f"# Generated by interface_compiler ({backend} backend, spec hash {key}). Do not edit: change the specs instead.",
+        "from ctypes import POINTER, c_int, c_uint, c_ulong, c_void_p, c_wchar_p",
+        "from ctypes.wintypes import BOOL, DWORD, HWND, LPCWSTR, LPWSTR, ULONG",
+        "",
+    ]
+    lines += ["from com_types import GUID", "from hresult import HRESULT", "from iunknown import LPVOID, WINFUNCTYPE, IUnknown, IUnknownVTable"]
+    exported = [spec.name for spec in specs] + [f"{spec.name}VTable" for spec in specs]
+    lines += ["", f"__all__ = {exported!r}", "", ""]
+    return lines
+
+
+def _compile_raw(specs: list[InterfaceSpec]) -> list[str]:
+    # COMBase compiles _methods_ when the class is created, before later interfaces exist, so interface pointers of any
+    # depth are passed as LPVOID (they take byref() of any interface pointer, as IUnknown.QueryInterface does).
+    interfaces = {ROOT_INTERFACE, *(spec.name for spec in specs)}
+
+    def raw_type(expression: str) -> str:
+        return "LPVOID" if type_names(expression) & interfaces else expression
+
+    lines: list[str] = []
+    for spec in specs:
+        argtypes = [[raw_type(param.type) for param in entry.params] for entry in spec.methods]
+        lines += [f"class {spec.name}({spec.parent}):", f'    _iid_ = GUID("{spec.iid}")', "    _methods_ = ["]
+        lines += [f'        ("{entry.name}", ({", ".join([entry.restype, *types]) if types else f"{entry.restype},"})),' for entry, types in zip(spec.methods, argtypes)]
+        lines += ["    ]", "", ""]
+        lines += [f"class {spec.name}VTable({spec.parent}VTable):", "    _fields_ = ["]
+        lines += [f'        ("{entry.name}", WINFUNCTYPE({", ".join([entry.restype, "LPVOID", *types])})),' for entry, types in zip(spec.methods, argtypes)]
+        lines += ["    ]", "", ""]
+    return lines
+
+
+def compile_interfaces(specs: Sequence[InterfaceSpec], backend: str = "raw") -> str:
+    """The source of a module defining `specs` for `backend` (one of BACKENDS)."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    interfaces = ordered(specs)
+    lines = _header(backend, interfaces, spec_hash(specs, backend)) + _compile_raw(interfaces)
+    while lines[-1] == "":
+        lines.pop()
+    return "\n".join(lines) + "\n"
+
+
+_load_lock = threading.Lock()
+
+
+def load_interfaces(specs: Sequence[InterfaceSpec], backend: str = "raw", cache_dir: str | os.PathLike | None = None) -> ModuleType:
+    """Import the bindings generated for `specs`, compiling them into `cache_dir` first unless already cached there.
+
+    The module is registered in sys.modules as `_interfaces_<backend>_<spec hash>`, so each distinct set of specs is
+    loaded once per process. If the cache directory is not writable, the generated source is executed without caching.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    module_name = f"_interfaces_{backend}_{spec_hash(specs, backend)}"
+    with _load_lock:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        path: Path | None = Path(DEFAULT_CACHE_DIR if cache_dir is None else cache_dir, f"{module_name}.py")
+        source: str | None = None
+        if not path.is_file():  # pyright: ignore[reportOptionalMemberAccess]
+            source = compile_interfaces(specs, backend)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                partial.write_text(source, encoding="utf-8")
+                partial.replace(path)  # Atomic: concurrent processes never import a half-written module.
+            except OSError:
+                path = None
+        import_spec = importlib.util.spec_from_file_location(module_name, path) if path is not None else importlib.util.spec_from_loader(module_name, loader=None)
+        assert import_spec is not None
+        module = importlib.util.module_from_spec(import_spec)
+        sys.modules[module_name] = module
+        try:
+            if import_spec.loader is not None:
+                import_spec.loader.exec_module(module)
+            else:
+                exec(compile(source or "", f"<{module_name}>", "exec"), module.__dict__)  # noqa: S102
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        return module
@@ -0,0 +1,146 @@
+"""The shell and file dialog COM interfaces as InterfaceSpecs: the single source for both generated backends.
+
+Methods are listed in vtable order, after the parent's. See interface_compiler for the spec format and the backends.
+"""
+
+from __future__ import annotations
+
+from interface_compiler import InterfaceSpec, method
+
+SHELL_INTERFACES: tuple[InterfaceSpec, ...] = (
+    InterfaceSpec("IModalWindow", "{B4DB1657-70D7-485E-8E3E-6FCB5A5C1802}", "IUnknown", (
+        method("Show", ("in", "HWND", "hwndParent")),
+    )),
+    InterfaceSpec("IShellItem", "{43826D1E-E718-42EE-BC55-A1E261C37BFE}", "IUnknown", (
+        method("BindToHandler", ("in", "POINTER(IUnknown)", "pbc"), ("in", "POINTER(GUID)", "bhid"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetParent", ("out", "POINTER(POINTER(IUnknown))", "ppsi")),
+        method("GetDisplayName", ("in", "c_ulong", "sigdnName"), ("out", "POINTER(LPWSTR)", "ppszName")),
+        method("GetAttributes", ("in", "c_ulong", "sfgaoMask"), ("out", "POINTER(c_ulong)", "psfgaoAttribs")),
+        method("Compare", ("in", "POINTER(IUnknown)", "psi"), ("in", "c_ulong", "hint"), ("out", "POINTER(c_int)", "piOrder")),
+    )),
+    InterfaceSpec("IContextMenu", "{000214e4-0000-0000-c000-000000000046}", "IUnknown", (
+        method("QueryContextMenu", ("in", "c_void_p", "hmenu"), ("in", "c_uint", "indexMenu"), ("in", "c_uint", "idCmdFirst"), ("in", "c_uint", "idCmdLast"), ("in", "c_uint", "uFlags")),
+        method("InvokeCommand", ("in", "c_void_p", "pici")),
+        method("GetCommandString", ("in", "c_uint", "idCmd"), ("in", "c_uint", "uType"), ("in", "c_void_p", "pReserved"), ("out", "c_wchar_p", "pszName"), ("in", "c_uint", "cchMax")),
+    )),
+    InterfaceSpec("IShellFolder", "{000214E6-0000-0000-C000-000000000046}", "IUnknown", (
+        method("ParseDisplayName", ("in", "HWND", "hwnd"), ("in", "POINTER(IUnknown)", "pbc"), ("in", "LPCWSTR", "pszDisplayName"), ("out", "POINTER(ULONG)", "pchEaten"), ("out", "POINTER(c_void_p)", "ppidl"), ("in", "POINTER(ULONG)", "pdwAttributes")),
+        method("EnumObjects", ("in", "HWND", "hwnd"), ("in", "c_ulong", "grfFlags"), ("out", "POINTER(POINTER(IUnknown))", "ppenumIDList")),
+        method("BindToObject", ("in", "c_void_p", "pidl"), ("in", "POINTER(IUnknown)", "pbc"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("BindToStorage", ("in", "c_void_p", "pidl"), ("in", "POINTER(IUnknown)", "pbc"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("CompareIDs", ("in", "c_void_p", "lParam"), ("in", "c_void_p", "pidl1"), ("in", "c_void_p", "pidl2")),
+        method("CreateViewObject", ("in", "HWND", "hwndOwner"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetAttributesOf", ("in", "c_uint", "cidl"), ("in", "POINTER(c_void_p)", "apidl"), ("out", "POINTER(c_ulong)", "rgfInOut")),
+        method("GetUIObjectOf", ("in", "HWND", "hwndOwner"), ("in", "c_uint", "cidl"), ("in", "POINTER(c_void_p)", "apidl"), ("in", "POINTER(GUID)", "riid"), ("in", "POINTER(c_uint)", "rgfReserved"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetDisplayNameOf", ("in", "c_void_p", "pidl"), ("in", "c_ulong", "uFlags"), ("out", "POINTER(c_wchar_p)", "pName")),
+        method("SetNameOf", ("in", "HWND", "hwnd"), ("in", "c_void_p", "pidl"), ("in", "LPCWSTR", "pszName"), ("in", "c_ulong", "uFlags"), ("out", "POINTER(c_void_p)", "ppidlOut")),
+    )),
+    InterfaceSpec("IShellItemArray", "{B63EA76D-1F85-456F-A19C-48159EFA858B}", "IUnknown", (
+        method("BindToHandler", ("in", "POINTER(IUnknown)", "pbc"), ("in", "POINTER(GUID)", "bhid"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetPropertyStore", ("in", "c_ulong", "flags"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetPropertyDescriptionList", ("in", "POINTER(GUID)", "keyType"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(c_void_p)", "ppv")),
+        method("GetAttributes", ("in", "c_ulong", "attribFlags"), ("in", "c_ulong", "sfgaoMask"), ("out", "POINTER(c_ulong)", "psfgaoAttribs")),
+        method("GetCount", ("out", "POINTER(c_uint)", "pdwNumItems")),
+        method("GetItemAt", ("in", "c_uint", "dwIndex"), ("out", "POINTER(POINTER(IShellItem))", "ppsi")),
+        method("EnumItems", ("out", "POINTER(POINTER(IUnknown))", "ppenumShellItems")),
+    )),
+    InterfaceSpec("IShellItemFilter", "{2659B475-EEB8-48B7-8F07-B378810F48CF}", "IUnknown", (
+        method("IncludeItem", ("in", "POINTER(IShellItem)", "psi")),
+        method("GetEnumFlagsForItem", ("in", "POINTER(IShellItem)", "psi"), ("out", "POINTER(c_ulong)", "pgrfFlags")),
+    )),
+    InterfaceSpec("IEnumShellItems", "{70629033-E363-4A28-A567-0DB78006E6D7}", "IUnknown", (
+        method("Next", ("in", "c_ulong", "celt"), ("out", "POINTER(POINTER(IShellItem))", "rgelt"), ("out", "POINTER(c_ulong)", "pceltFetched")),
+        method("Skip", ("in", "c_ulong", "celt")),
+        method("Reset"),
+        method("Clone", ("out", "POINTER(POINTER(IEnumShellItems))", "ppenum")),
+    )),
+    InterfaceSpec("IPropertyStore", "{886D8EEB-8CF2-4446-8D02-CDBA1DBDCF99}", "IUnknown", (
+        method("GetCount", ("out", "POINTER(c_ulong)", "count")),
+        method("GetAt", ("in", "c_ulong", "index"), ("out", "POINTER(GUID)", "key")),
+        method("GetValue", ("in", "POINTER(GUID)", "key"), ("out", "POINTER(c_void_p)", "pv")),
+        method("SetValue", ("in", "POINTER(GUID)", "key"), ("in", "POINTER(c_void_p)", "propvar")),
+        method("Commit"),
+    )),
+    InterfaceSpec("IFileOperationProgressSink", "{04B0F1A7-9490-44BC-96E1-4296A31252E2}", "IUnknown", (
+        method("StartOperations"),
+        method("FinishOperations", ("in", "HRESULT", "hr")),
+        method("PreRenameItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "c_wchar_p", "pszNewName")),
+        method("PostRenameItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "c_wchar_p", "pszNewName"), ("in", "HRESULT", "hrRename"), ("in", "POINTER(IShellItem)", "psiNewlyCreated")),
+        method("PreMoveItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName")),
+        method("PostMoveItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName"), ("in", "HRESULT", "hrMove"), ("in", "POINTER(IShellItem)", "psiNewlyCreated")),
+        method("PreCopyItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName")),
+        method("PostCopyItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName"), ("in", "HRESULT", "hrCopy"), ("in", "POINTER(IShellItem)", "psiNewlyCreated")),
+        method("PreDeleteItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem")),
+        method("PostDeleteItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiItem"), ("in", "HRESULT", "hrDelete"), ("in", "POINTER(IShellItem)", "psiNewlyCreated")),
+        method("PreNewItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName")),
+        method("PostNewItem", ("in", "c_ulong", "dwFlags"), ("in", "POINTER(IShellItem)", "psiDestinationFolder"), ("in", "c_wchar_p", "pszNewName"), ("in", "c_wchar_p", "pszTemplateName"), ("in", "c_ulong", "dwFileAttributes"), ("in", "HRESULT", "hrNew"), ("in", "POINTER(IShellItem)", "psiNewItem")),
+        method("UpdateProgress", ("in", "c_ulong", "iWorkTotal"), ("in", "c_ulong", "iWorkSoFar")),
+        method("ResetTimer"),
+        method("PauseTimer"),
+        method("ResumeTimer"),
+    )),
+    InterfaceSpec("IFileDialogEvents", "{973510DB-7D7F-452B-8975-74A85828D354}", "IUnknown", (
+        method("OnFileOk", ("in", "POINTER(IFileDialog)", "pfd")),
+        method("OnFolderChanging", ("in", "POINTER(IFileDialog)", "pfd"), ("in", "POINTER(IShellItem)", "psiFolder")),
+        method("OnFolderChange", ("in", "POINTER(IFileDialog)", "pfd")),
+        method("OnSelectionChange", ("in", "POINTER(IFileDialog)", "pfd")),
+        method("OnShareViolation", ("in", "POINTER(IFileDialog)", "pfd"), ("in", "POINTER(IShellItem)", "psi"), ("out", "POINTER(c_int)", "pResponse")),
+        method("OnTypeChange", ("in", "POINTER(IFileDialog)", "pfd")),
+        method("OnOverwrite", ("in", "POINTER(IFileDialog)", "pfd"), ("in", "POINTER(IShellItem)", "psi"), ("out", "POINTER(c_int)", "pResponse")),
+    )),
+    InterfaceSpec("IFileDialog", "{42F85136-DB7E-439C-85F1-E4075D135FC8}", "IModalWindow", (
+        method("SetFileTypes", ("in", "c_uint", "cFileTypes"), ("in", "c_void_p", "rgFilterSpec")),
+        method("SetFileTypeIndex", ("in", "c_uint", "iFileType")),
+        method("GetFileTypeIndex", ("out", "POINTER(c_uint)", "piFileType")),
+        method("Advise", ("in", "POINTER(IUnknown)", "pfde"), ("out", "POINTER(DWORD)", "pdwCookie")),
+        method("Unadvise", ("in", "DWORD", "dwCookie")),
+        method("SetOptions", ("in", "c_uint", "fos")),
+        method("GetOptions", ("out", "POINTER(DWORD)", "pfos")),
+        method("SetDefaultFolder", ("in", "POINTER(IShellItem)", "psi")),
+        method("SetFolder", ("in", "POINTER(IShellItem)", "psi")),
+        method("GetFolder", ("out", "POINTER(POINTER(IShellItem))", "ppsi")),
+        method("GetCurrentSelection", ("out", "POINTER(POINTER(IShellItem))", "ppsi")),
+        method("SetFileName", ("in", "LPCWSTR", "pszName")),
+        method("GetFileName", ("out", "POINTER(LPWSTR)", "pszName")),
+        method("SetTitle", ("in", "LPCWSTR", "pszTitle")),
+        method("SetOkButtonLabel", ("in", "LPCWSTR", "pszText")),
+        method("SetFileNameLabel", ("in", "LPCWSTR", "pszLabel")),
+        method("GetResult", ("out", "POINTER(POINTER(IShellItem))", "ppsi")),
+        method("AddPlace", ("in", "POINTER(IShellItem)", "psi"), ("in", "c_int", "fdap")),
+        method("SetDefaultExtension", ("in", "LPCWSTR", "pszDefaultExtension")),
+        method("Close", ("in", "HRESULT", "hr")),
+        method("SetClientGuid", ("in", "POINTER(GUID)", "guid")),
+        method("ClearClientData"),
+        method("SetFilter", ("in", "POINTER(IShellItemFilter)", "pFilter")),
+    )),
+    InterfaceSpec("IShellLibrary", "{11A66EFA-382E-451A-9234-1E0E12EF3085}", "IUnknown", (
+        method("LoadLibraryFromItem", ("in", "POINTER(IShellItem)", "psi"), ("in", "c_ulong", "grfMode")),
+        method("LoadLibraryFromKnownFolder", ("in", "POINTER(GUID)", "kfidLibrary"), ("in", "c_ulong", "grfMode")),
+        method("AddFolder", ("in", "POINTER(IShellItem)", "psi")),
+        method("RemoveFolder", ("in", "POINTER(IShellItem)", "psi")),
+        method("GetFolders", ("in", "c_int", "lff"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(POINTER(c_void_p))", "ppv")),
+        method("ResolveFolder", ("in", "POINTER(IShellItem)", "psi"), ("in", "c_ulong", "grfMode"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(POINTER(c_void_p))", "ppv")),
+        method("GetDefaultSaveFolder", ("in", "c_int", "dsft"), ("in", "POINTER(GUID)", "riid"), ("out", "POINTER(POINTER(c_void_p))", "ppv")),
+        method("SetDefaultSaveFolder", ("in", "c_int", "dsft"), ("in", "POINTER(IShellItem)", "psi")),
+        method("GetOptions", ("out", "POINTER(c_uint)", "pOptions")),
+        method("SetOptions", ("in", "c_ulong", "stfOptions"), ("in", "c_ulong", "stfMask")),
+        method("GetFolderType", ("out", "POINTER(GUID)", "pftid")),
+        method("SetFolderType", ("in", "POINTER(GUID)", "ftid")),
+        method("GetIcon", ("out", "POINTER(LPWSTR)", "ppszIcon")),
+        method("SetIcon", ("in", "LPCWSTR", "pszIcon")),
+        method("Commit"),
+        method("Save", ("in", "POINTER(IShellItem)", "psiFolderToSaveIn"), ("in", "LPCWSTR", "pszLibraryName"), ("in", "c_ulong", "lrf"), ("out", "POINTER(POINTER(IShellItem))", "ppsiNewItem")),
+        method("SaveInKnownFolder", ("in", "POINTER(GUID)", "kfid"), ("in", "LPCWSTR", "pszLibraryName"), ("in", "c_ulong", "lrf"), ("out", "POINTER(POINTER(IShellItem))", "ppsiNewItem")),
+    )),
+    InterfaceSpec("IFileOpenDialog", "{D57C7288-D4AD-4768-BE02-9D969532D960}", "IFileDialog", (
+        method("GetResults", ("out", "POINTER(POINTER(IShellItemArray))", "ppenum")),
+        method("GetSelectedItems", ("out", "POINTER(POINTER(IShellItemArray))", "ppsai")),
+    )),
+    InterfaceSpec("IFileSaveDialog", "{84BCCD23-5FDE-4CDB-AEA4-AF64B83D78AB}", "IFileDialog", (
+        method("SetSaveAsItem", ("in", "POINTER(IShellItem)", "psi")),
+        method("SetProperties", ("in", "POINTER(IUnknown)", "pStore")),
+        method("SetCollectedProperties", ("in", "POINTER(IUnknown)", "pList"), ("in", "BOOL", "fAppendDefault")),
+        method("GetProperties", ("out", "POINTER(POINTER(IUnknown))", "ppStore")),
+        method("ApplyProperties", ("in", "POINTER(IShellItem)", "psi"), ("in", "POINTER(IUnknown)", "pStore"), ("in", "HWND", "hwnd"), ("in", "POINTER(IUnknown)", "pSink")),
+    )),
+)
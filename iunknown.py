@@ -1,25 +1,36 @@
 from __future__ import annotations
 
+import sys
+import threading
+
+from collections import deque
 from ctypes import (
     POINTER,
-    WINFUNCTYPE,
     Structure,
     byref,
     c_int,
     c_uint,
     c_void_p,
     c_wchar_p,
-    windll,
+    sizeof,
     wintypes,
 )
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Callable, ClassVar, NamedTuple, Sequence
 
 from com_types import GUID
+from guid_registry import describe_guid
 from hresult import HRESULT
 
 if TYPE_CHECKING:
     from ctypes import _CData, _FuncPointer, _Pointer
 
+try:
+    from ctypes import WINFUNCTYPE, windll
+except ImportError:  # Not on Windows: there is only one calling convention, fake vtables (tests, benchmarks) use CFUNCTYPE.
+    from ctypes import CFUNCTYPE as WINFUNCTYPE
+
+    windll = None
+
 REFIID: type[_Pointer[GUID]] = POINTER(GUID)
 REFGUID: type[_Pointer[GUID]] = POINTER(GUID)
 
@@ -54,53 +65,172 @@ def FAILED(hr):
     return hr < 0
 
 
+class AtomicRefCount:
+    """A COM reference count without locks: each reference is a token in a deque, whose append and pop are atomic.
+
+    The count starts at 1, the creator's reference, held by a sentinel token at the bottom of the deque. Pops are
+    LIFO, so the sentinel is only popped by the Release that drops the last reference: exactly one thread ever sees
+    it, and that thread calls `on_zero`, once, before its Release returns.
+    """
+
+    __slots__ = ("_on_zero", "_references")
+
+    def __init__(self, on_zero: Callable[[], object] | None = None):
+        self._references: deque[object] = deque((_CREATOR_REFERENCE,))
+        self._on_zero: Callable[[], object] | None = on_zero
+
+    def add_ref(self) -> int:
+        references = self._references
+        references.append(None)
+        return len(references)  # Like the COM return value, only meaningful when nothing else races with it.
+
+    def release(self) -> int:
+        references = self._references
+        try:
+            token = references.pop()
+        except IndexError:
+            raise ValueError("Release() after the last reference was released") from None
+        if token is not _CREATOR_REFERENCE:
+            return len(references)
+        on_zero, self._on_zero = self._on_zero, None  # Dropped once called: it usually refers back to the object.
+        if on_zero is not None:
+            on_zero()
+        return 0
+
+    @property
+    def count(self) -> int:
+        return len(self._references)
+
+
+class LockedRefCount:
+    """AtomicRefCount's semantics with an int guarded by a per-object lock, for interpreters without atomic deques."""
+
+    __slots__ = ("_count", "_lock", "_on_zero")
+
+    def __init__(self, on_zero: Callable[[], object] | None = None):
+        self._count: int = 1
+        self._lock: threading.Lock = threading.Lock()
+        self._on_zero: Callable[[], object] | None = on_zero
+
+    def add_ref(self) -> int:
+        with self._lock:
+            self._count += 1
+            return self._count
+
+    def release(self) -> int:
+        with self._lock:
+            if self._count <= 0:
+                raise ValueError("Release() after the last reference was released")
+            self._count -= 1
+            count = self._count
+            on_zero = None
+            if count == 0:
+                on_zero, self._on_zero = self._on_zero, None
+        if on_zero is not None:
+            on_zero()
+        return count
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+
+_CREATOR_REFERENCE = object()
+
+# deque.append/pop are documented as thread-safe in CPython, including its free-threaded builds.
+RefCount: type[AtomicRefCount | LockedRefCount] = AtomicRefCount if sys.implementation.name == "cpython" else LockedRefCount
 
-# Define InterlockedIncrement manually
-def InterlockedIncrement(var_ptr):
-    windll.kernel32.EnterCriticalSection(byref(var_ptr))
-    var_ptr.contents.value += 1
-    result = var_ptr.contents.value
-    windll.kernel32.LeaveCriticalSection(byref(var_ptr))
-    return result
 
-# Define InterlockedDecrement manually
-def InterlockedDecrement(var_ptr):
-    windll.kernel32.EnterCriticalSection(byref(var_ptr))
-    var_ptr.contents.value -= 1
-    result = var_ptr.contents.value
-    windll.kernel32.LeaveCriticalSection(byref(var_ptr))
-    return result
+class RefCounted:
+    """AddRef/Release for objects implemented in Python (COM servers, event sinks), backed by a RefCount.
 
+    The object starts with one reference, its creator's, and is kept alive until its last reference is released, even
+    if no Python name refers to it (native callers only hold its interface pointer). The Release that drops the last
+    reference calls final_release() and lets it go: destruction happens then, deterministically, on that thread.
+    """
 
+    _live_objects: ClassVar[dict[int, RefCounted]] = {}
+    # False for objects whose references are counted, and whose lifetime is kept, by something else (comtypes.COMObject).
+    _pinned_: ClassVar[bool] = True
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._refcount: AtomicRefCount | LockedRefCount = RefCount(self._last_release)
+        if self._pinned_:
+            RefCounted._live_objects[id(self)] = self
+
+    def AddRef(self) -> int:  # noqa: N802
+        return self._refcount.add_ref()
+
+    def Release(self) -> int:  # noqa: N802
+        return self._refcount.release()
+
+    def _last_release(self) -> None:
+        try:
+            self.final_release()
+        finally:
+            RefCounted._live_objects.pop(id(self), None)
+
+    def final_release(self) -> None:
+        """Called once, when the last reference is released. Override to free resources."""
+
+
+class COMMethod(NamedTuple):
+    """A COMBase dispatch table entry: where the method sits in the vtable and the prototype to call it with."""
+
+    slot: int
+    prototype: type[_FuncPointer]
+    # Windows: a foreign function that reads the slot out of the `this` argument's vtable itself (prototype(slot, name)).
+    vtable_method: _FuncPointer | None
+    # Elsewhere: prototype(address) per implementation address seen, built on first call.
+    bound: dict[int, _FuncPointer]
 
 
 class COMBase(Structure):
+    """Base for raw-vtable COM interfaces.
+
+    Subclasses list their own methods in vtable order as `_methods_ = [(name, (restype, *argtypes)), ...]`, without
+    the `this` argument. __init_subclass__ compiles them, after the inherited ones, into `_dispatch_`: name -> COMMethod
+    with a prebuilt prototype, so call() is a dict lookup plus the foreign call.
+    """
+
+    _methods_: ClassVar[Sequence[tuple[str, Sequence[type]]]] = ()
+    _dispatch_: ClassVar[dict[str, COMMethod]] = {}
+
     def __init_subclass__(cls: type[COMBase], **kwargs):
         super().__init_subclass__(**kwargs)
+        dispatch = dict(cls._dispatch_)  # The parent's methods come first in the vtable.
+        methods = cls.__dict__.get("_methods_", ())
+        for name, (restype, *argtypes) in methods:
+            slot = dispatch[name].slot if name in dispatch else len(dispatch)
+            # `this` is passed as byref(self): POINTER(cls) cannot be built yet (the Structure has no layout until
+            # its metaclass finishes), and a void pointer lets subclasses share the inherited prototypes.
+            prototype: type[_FuncPointer] = WINFUNCTYPE(restype, c_void_p, *argtypes)
+            vtable_method = prototype(slot, name) if _VTABLE_INDEX_CALLS else None  # pyright: ignore[reportCallIssue]
+            dispatch[name] = COMMethod(slot, prototype, vtable_method, {})
+        cls._dispatch_ = dispatch
 
     def query_interface(self, interface_id: GUID):
         assert isinstance(self, IUnknown)
         p_interface = POINTER(self.__class__)()
         hr = self.call("QueryInterface", byref(interface_id), byref(p_interface))
         if hr != 0:
-            raise HRESULT(hr).exception("QueryInterface call failed!")
+            raise HRESULT(hr).exception(f"QueryInterface call failed for '{describe_guid(interface_id)}'!")
         return p_interface
 
     def call(self, method_name: str, *args):
-        func_type: Sequence[type] | None = None
-        for name, types in self._methods_:
-            if name == method_name:
-                func_type = types
-                break
-        else:
+        method = self._dispatch_.get(method_name)
+        if method is None:
             raise AttributeError(f"Method '{method_name}' not found in class {self.__class__.__name__}")
-
-        new_cfunctype: type[_FuncPointer] = WINFUNCTYPE(func_type[0], *([POINTER(type(self)), *func_type[1:]]))
-        func_ptr: _FuncPointer = getattr(self.lpVtbl.contents, method_name)
-        new_func_ptr: _FuncPointer = new_cfunctype(func_ptr)
-
-        return new_func_ptr(self, *args)
+        if method.vtable_method is not None:
+            return method.vtable_method(byref(self), *args)
+        if not self.lpVtbl:
+            raise ValueError(f"Cannot call '{method_name}' on {self.__class__.__name__}: NULL vtable pointer")
+        address: int = c_void_p.from_address(_vtable_address(self) + method.slot * _SLOT_SIZE).value  # pyright: ignore[reportAssignmentType]
+        func = method.bound.get(address)
+        if func is None:
+            func = method.bound.setdefault(address, method.prototype(address))
+        return func(byref(self), *args)
 
     def add_ref(self):
         return self.call("AddRef")
@@ -108,10 +238,28 @@ class COMBase(Structure):
     def release(self):
         return self.call("Release")
 
+
+# ctypes can only build vtable-index foreign functions (prototype(slot, name), as comtypes uses) on Windows.
+_VTABLE_INDEX_CALLS: bool = sys.platform == "win32"
+_SLOT_SIZE: int = sizeof(c_void_p)
+
+
+class _VTableAddress(Structure):
+    _fields_ = [("address", c_void_p)]
+
+
+# Reads lpVtbl (the first field of every interface) as a plain int straight from the instance buffer: a field
+# descriptor accepts any ctypes instance, and this is several times cheaper than cast(self.lpVtbl, POINTER(c_void_p)).
+_vtable_address = _VTableAddress.address.__get__
+
 # Define IUnknown interface
 IID_IUnknown = GUID("{00000000-0000-0000-C000-000000000046}")  # GUID(0x00000000, 0x0000, 0x0000, (0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x46))
 class IUnknown(COMBase):  # Forward reference of the interface.
-    _methods_: dict[str, Any]
+    _methods_: ClassVar[Sequence[tuple[str, Sequence[type]]]] = [
+        ("QueryInterface", (HRESULT, POINTER(GUID), LPVOID)),  # void**: takes byref() of any interface pointer.
+        ("AddRef", (ULONG,)),
+        ("Release", (ULONG,)),
+    ]
     _iid_: GUID = IID_IUnknown
     lpVtbl: _Pointer[IUnknownVTable]
 class IUnknownVTable(Structure):
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import OrderedDict
+from ctypes import byref, c_wchar_p
+from typing import TYPE_CHECKING, Callable, Generic, Mapping, TypeVar
+
+from com_types import GUID, oledll
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # pyright: ignore[reportMissingModuleSource]
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class ProgIDBackend:
+    """Where ProgID <-> CLSID lookups actually go. Subclass and pass to ProgIDResolver to plug in another source."""
+
+    def clsid_from_progid(self, progid: str) -> GUID:
+        raise NotImplementedError
+
+    def progid_from_clsid(self, clsid: GUID) -> str | None:
+        raise NotImplementedError
+
+
+class Ole32ProgIDBackend(ProgIDBackend):
+    """The registry, through ole32.CLSIDFromProgID / ProgIDFromCLSID. Windows only."""
+
+    def clsid_from_progid(self, progid: str) -> GUID:
+        if oledll is None:
+            raise OSError("ole32 is not available on this platform, cannot resolve ProgIDs from the registry")
+        clsid = GUID.from_buffer_copy(bytes(16))  # A scratch structure, not the interned NULL guid.
+        oledll.ole32.CLSIDFromProgID(progid, byref(clsid))
+        return GUID.from_raw(memoryview(clsid).tobytes())
+
+    def progid_from_clsid(self, clsid: GUID) -> str | None:
+        if oledll is None:
+            raise OSError("ole32 is not available on this platform, cannot resolve ProgIDs from the registry")
+        progid = c_wchar_p()
+        oledll.ole32.ProgIDFromCLSID(byref(clsid), byref(progid))
+        result = progid.value
+        oledll.ole32.CoTaskMemFree(progid)
+        return result
+
+
+class TableProgIDBackend(ProgIDBackend):
+    """An in-memory ProgID table, for tests and for exercising the cache on platforms without a registry.
+
+    `lookups` counts the calls that reached this backend, i.e. resolver cache misses.
+    """
+
+    def __init__(self, table: Mapping[str, GUID | str]):
+        self._by_progid: dict[str, GUID] = {}
+        self._by_clsid: dict[GUID, str] = {}
+        for progid, clsid in table.items():
+            guid = clsid if isinstance(clsid, GUID) else GUID(clsid)
+            self._by_progid[progid.casefold()] = guid
+            self._by_clsid.setdefault(guid, progid)
+        self.lookups: int = 0
+
+    def clsid_from_progid(self, progid: str) -> GUID:
+        self.lookups += 1
+        try:
+            return self._by_progid[progid.casefold()]
+        except KeyError:
+            raise OSError(f"Invalid class string: {progid!r}") from None
+
+    def progid_from_clsid(self, clsid: GUID) -> str | None:
+        self.lookups += 1
+        try:
+            return self._by_clsid[clsid]
+        except KeyError:
+            raise OSError(f"Class not registered: {clsid}") from None
+
+
+class _TTLCache(Generic[K, V]):
+    """Size-bounded LRU whose entries also expire `ttl` seconds after insertion. Callers hold the resolver lock."""
+
+    def __init__(self, maxsize: int, ttl: float | None, clock: Callable[[], float]):
+        self.maxsize: int = maxsize
+        self.ttl: float | None = ttl
+        self.clock: Callable[[], float] = clock
+        self.entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            self.expirations += 1
+            return False, None
+        self.entries.move_to_end(key)
+        return True, value
+
+    def put(self, key: K, value: V) -> None:
+        expires_at = float("inf") if self.ttl is None else self.clock() + self.ttl
+        self.entries[key] = (value, expires_at)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+
+class ProgIDResolver:
+    """Caches ProgID <-> CLSID lookups in front of a ProgIDBackend (ole32 by default).
+
+    Each direction is a bounded LRU with a TTL, so registry changes are eventually picked up. ProgIDs are matched
+    case-insensitively, like the registry does. Failed lookups are not cached.
+    """
+
+    def __init__(
+        self,
+        backend: ProgIDBackend | None = None,
+        maxsize: int = 256,
+        ttl: float | None = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.backend: ProgIDBackend = Ole32ProgIDBackend() if backend is None else backend
+        self._lock: threading.Lock = threading.Lock()
+        self._clsids: _TTLCache[str, GUID] = _TTLCache(maxsize, ttl, clock)
+        self._progids: _TTLCache[GUID, str | None] = _TTLCache(maxsize, ttl, clock)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def clsid(self, progid: str) -> GUID:
+        key = progid.casefold()
+        with self._lock:
+            found, clsid = self._clsids.get(key)
+            if found:
+                self.hits += 1
+                return clsid  # pyright: ignore[reportReturnType]
+            self.misses += 1
+        clsid = self.backend.clsid_from_progid(progid)
+        with self._lock:
+            self._clsids.put(key, clsid)
+        return clsid
+
+    def progid(self, clsid: GUID) -> str | None:
+        with self._lock:
+            found, progid = self._progids.get(clsid)
+            if found:
+                self.hits += 1
+                return progid
+            self.misses += 1
+        progid = self.backend.progid_from_clsid(clsid)
+        with self._lock:
+            self._progids.put(clsid, progid)
+        return progid
+
+    def clear(self) -> Self:
+        with self._lock:
+            self._clsids.entries.clear()
+            self._progids.entries.clear()
+        return self
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._clsids.entries) + len(self._progids.entries),
+                "evictions": self._clsids.evictions + self._progids.evictions,
+                "expirations": self._clsids.expirations + self._progids.expirations,
+            }
+
+
+_default_resolver: ProgIDResolver | None = None
+
+
+def get_progid_resolver() -> ProgIDResolver:
+    """The resolver used by GUID.from_progid / GUID.as_progid, created (with the ole32 backend) on first use."""
+    global _default_resolver  # noqa: PLW0603
+    if _default_resolver is None:
+        _default_resolver = ProgIDResolver()
+    return _default_resolver
+
+
+def set_progid_resolver(resolver: ProgIDResolver | None) -> None:
+    """Replace the resolver used by GUID.from_progid / GUID.as_progid. None restores the default on next use."""
+    global _default_resolver  # noqa: PLW0603
+    _default_resolver = resolver
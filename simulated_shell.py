@@ -0,0 +1,612 @@
+"""A simulated shell namespace over the local filesystem, for running and profiling the dialog code without Windows.
+
+IShellItem, IShellItemArray, IEnumShellItems and IFileOpenDialog/IFileSaveDialog are implemented as Python COM
+servers (com_server) on the raw-vtable interfaces, so callers drive them exactly as they drive the shell: through
+vtable_backend's RawInterface wrappers. windialogs does this with PYIFILEDIALOG_BACKEND=simulated.
+
+Show() opens no window. It runs a script: a callable that gets the dialog (its folder, options, file types, file name
+and what it lists, see FileDialog.listing()) and returns the paths the user picks, or None to cancel:
+
+    set_dialog_script(select("report.txt", "notes.md"))  # Relative paths are in the dialog's current folder.
+    set_dialog_script(select_all)  # Everything the dialog lists, e.g. a 100k-file folder.
+
+Items are created on demand: a selection is kept as paths, and GetItemAt/Next make an IShellItem per call, which
+its last Release destroys. Attributes come from the directory listing when an item was picked from it, and from
+os.stat otherwise; dot-files are hidden.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from ctypes import POINTER, c_void_p, c_wchar_p, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
+
+import vtable_backend
+
+from com_server import S_OK, COMServer, find_server
+from com_types import GUID
+from cotaskmem import get_task_allocator
+from filter_specs import filter_set
+from hresult import HRESULT, HRESULTError
+from vtable_backend import RawInterface, raw_interfaces
+
+if TYPE_CHECKING:
+    from ctypes import _Pointer, c_int, c_uint, c_ulong
+
+    from filter_specs import FilterMatcher
+
+S_FALSE = 1
+E_FAIL = 0x80004005
+E_INVALIDARG = 0x80070057
+E_UNEXPECTED = 0x8000FFFF
+ERROR_FILE_NOT_FOUND = 0x80070002
+ERROR_PATH_NOT_FOUND = 0x80070003
+ERROR_CANCELLED = 0x800704C7
+MK_E_NOOBJECT = 0x800401E5
+REGDB_E_CLASSNOTREG = 0x80040154
+
+SFGAO_HIDDEN = 0x00080000
+SFGAO_STREAM = 0x00400000
+SFGAO_FILESYSANCESTOR = 0x10000000
+SFGAO_FOLDER = 0x20000000
+SFGAO_FILESYSTEM = 0x40000000
+
+SIGDN_NORMALDISPLAY = 0x00000000
+SIGDN_PARENTRELATIVEPARSING = 0x80018001
+SIGDN_DESKTOPABSOLUTEPARSING = 0x80028000
+SIGDN_PARENTRELATIVEEDITING = 0x80031001
+SIGDN_DESKTOPABSOLUTEEDITING = 0x8004C000
+SIGDN_FILESYSPATH = 0x80058000
+SIGDN_URL = 0x80068000
+SIGDN_PARENTRELATIVEFORADDRESSBAR = 0x8007C001
+SIGDN_PARENTRELATIVE = 0x80080001
+_ABSOLUTE_NAMES = frozenset((SIGDN_DESKTOPABSOLUTEPARSING, SIGDN_DESKTOPABSOLUTEEDITING, SIGDN_FILESYSPATH))
+_RELATIVE_NAMES = frozenset((SIGDN_NORMALDISPLAY, SIGDN_PARENTRELATIVEPARSING, SIGDN_PARENTRELATIVEEDITING, SIGDN_PARENTRELATIVEFORADDRESSBAR, SIGDN_PARENTRELATIVE))
+
+SIATTRIBFLAGS_AND = 0x1
+SIATTRIBFLAGS_OR = 0x2
+
+FOS_OVERWRITEPROMPT = 0x00000002
+FOS_NOCHANGEDIR = 0x00000008
+FOS_PICKFOLDERS = 0x00000020
+FOS_ALLOWMULTISELECT = 0x00000200
+FOS_PATHMUSTEXIST = 0x00000800
+FOS_FILEMUSTEXIST = 0x00001000
+FOS_NOREADONLYRETURN = 0x00008000
+FOS_FORCESHOWHIDDEN = 0x10000000
+
+FDEOR_REFUSE = 2
+
+CLSID_FileOpenDialog = GUID("{DC1C5A9C-E88A-4dde-A5A1-60F82A20AEF7}")
+CLSID_FileSaveDialog = GUID("{C0B4E2F3-BA21-4773-8DBA-335EC946EB8B}")
+
+Selection = Iterable["str | os.PathLike[str]"]
+Script = Callable[["FileDialog"], "Selection | None"]
+
+
+def attributes_of(path: str, is_dir: bool | None = None) -> int:
+    """The SFGAO_* attributes of `path`. A path that does not exist (yet) is a file."""
+    if is_dir is None:
+        is_dir = os.path.isdir(path)
+    attributes = SFGAO_FILESYSTEM | (SFGAO_FOLDER | SFGAO_FILESYSANCESTOR if is_dir else SFGAO_STREAM)
+    if os.path.basename(path).startswith("."):
+        attributes |= SFGAO_HIDDEN
+    return attributes
+
+
+def _write_pointer(address: int, pointer: int | None) -> None:
+    c_void_p.from_address(address).value = pointer
+
+
+def _return_string(out: _Pointer[c_wchar_p], text: str) -> None:
+    cast(out, POINTER(c_void_p))[0] = get_task_allocator().alloc_string(text)  # The caller frees it.
+
+
+def _path_of(psi: int | None) -> str:
+    """The filesystem path of an IShellItem pointer, ours or not."""
+    _require_servers()
+    item = find_server(psi)
+    if isinstance(item, ShellItem):
+        return item.path
+    if not psi:
+        raise HRESULTError(E_INVALIDARG)
+    with raw_interfaces()["IShellItem"].from_address(psi).GetDisplayName(SIGDN_FILESYSPATH) as name:  # pyright: ignore[reportAttributeAccessIssue]
+        return str(name)
+
+
+def _query(pointer: int, interface: str) -> RawInterface:
+    """`pointer` as `interface`, with a reference of its own."""
+    return raw_interfaces()["IUnknown"].from_address(pointer).QueryInterface(interface)
+
+
+def cancel(dialog: FileDialog) -> None:  # noqa: ARG001
+    """The user presses Cancel. The default script."""
+    return
+
+
+def accept(dialog: FileDialog) -> list[str] | None:
+    """The user presses OK on the file name in the box (SetFileName), or cancels if it is empty."""
+    return [dialog.file_name] if dialog.file_name else None
+
+
+def select(*paths: str | os.PathLike[str]) -> Script:
+    """The user picks `paths`; relative ones are in the dialog's current folder."""
+    return lambda dialog: paths  # noqa: ARG005
+
+
+def select_all(dialog: FileDialog) -> list[os.DirEntry[str]]:
+    """The user selects everything the dialog lists in its current folder."""
+    return dialog.listing()
+
+
+_dialog_script: Script = cancel
+_script_lock = threading.Lock()
+
+
+def get_dialog_script() -> Script:
+    """The script dialogs without one of their own run when shown."""
+    return _dialog_script
+
+
+def set_dialog_script(script: Script | None) -> Script:
+    """Install `script` (None restores `cancel`) for dialogs without one of their own, returning the previous one."""
+    global _dialog_script  # noqa: PLW0603
+    with _script_lock:
+        previous, _dialog_script = _dialog_script, script or cancel
+    return previous
+
+
+# The servers implement vtable_backend.bindings(), which compiles (or loads) the raw interface bindings. They are
+# defined on first use, by module __getattr__ or by creating a dialog or item, not on import: importing this module
+# (windialogs does) costs nothing until a simulated object is made.
+_SERVER_CLASSES: tuple[str, ...] = ("ShellItem", "ShellItemArray", "EnumShellItems", "FileDialog", "FileOpenDialog", "FileSaveDialog")
+_dialog_types: dict[bytes, type[FileDialog]] = {}
+_servers_lock = threading.Lock()
+
+
+def _define_servers() -> None:  # noqa: C901
+    global ShellItem, ShellItemArray, EnumShellItems, FileDialog, FileOpenDialog, FileSaveDialog  # noqa: PLW0603
+    bindings = vtable_backend.bindings()
+
+    class ShellItem(COMServer):
+        """IShellItem over a filesystem path."""
+
+        _com_interfaces_ = [bindings.IShellItem]
+
+        def __init__(self, path: str, attributes: int | None = None):
+            super().__init__()
+            self.path: str = path
+            self._attributes: int | None = attributes
+
+        @property
+        def attributes(self) -> int:
+            if self._attributes is None:
+                self._attributes = attributes_of(self.path)
+            return self._attributes
+
+        def display_name(self, sigdn: int) -> str:
+            if sigdn in _ABSOLUTE_NAMES:
+                return self.path
+            if sigdn in _RELATIVE_NAMES:
+                return os.path.basename(self.path) or self.path  # A root is its own name.
+            if sigdn == SIGDN_URL:
+                return Path(self.path).as_uri()
+            raise HRESULTError(E_INVALIDARG)
+
+        def GetParent(self, ppsi: int) -> None:  # noqa: N802
+            parent = os.path.dirname(self.path)
+            if not parent or parent == self.path:
+                raise HRESULTError(MK_E_NOOBJECT)
+            _write_pointer(ppsi, ShellItem(parent).com_pointer())
+
+        def GetDisplayName(self, sigdnName: int, ppszName: _Pointer[c_wchar_p]) -> None:  # noqa: N802, N803
+            _return_string(ppszName, self.display_name(sigdnName))
+
+        def GetAttributes(self, sfgaoMask: int, psfgaoAttribs: _Pointer[c_ulong]) -> int:  # noqa: N802, N803
+            attributes = self.attributes & sfgaoMask
+            psfgaoAttribs[0] = attributes
+            return S_OK if attributes == sfgaoMask else S_FALSE
+
+        def Compare(self, psi: int, hint: int, piOrder: _Pointer[c_int]) -> int:  # noqa: N802, N803, ARG002
+            mine, theirs = os.path.normcase(self.path), os.path.normcase(_path_of(psi))
+            piOrder[0] = (mine > theirs) - (mine < theirs)
+            return S_OK if mine == theirs else S_FALSE
+
+
+    class ShellItemArray(COMServer):
+        """IShellItemArray over a list of paths. `attributes`, if given, holds each path's SFGAO_* attributes or None."""
+
+        _com_interfaces_ = [bindings.IShellItemArray]
+
+        def __init__(self, paths: Sequence[str], attributes: Sequence[int | None] | None = None):
+            super().__init__()
+            self.paths: Sequence[str] = paths
+            self.attributes: Sequence[int | None] | None = attributes
+
+        def item(self, index: int) -> ShellItem:
+            return ShellItem(self.paths[index], None if self.attributes is None else self.attributes[index])
+
+        def GetCount(self, pdwNumItems: _Pointer[c_uint]) -> None:  # noqa: N802, N803
+            pdwNumItems[0] = len(self.paths)
+
+        def GetItemAt(self, dwIndex: int, ppsi: int) -> None:  # noqa: N802, N803
+            if dwIndex >= len(self.paths):
+                raise HRESULTError(E_INVALIDARG)
+            _write_pointer(ppsi, self.item(dwIndex).com_pointer())
+
+        def EnumItems(self, ppenumShellItems: int) -> None:  # noqa: N802, N803
+            _write_pointer(ppenumShellItems, EnumShellItems(self).com_pointer())
+
+        def GetAttributes(self, attribFlags: int, sfgaoMask: int, psfgaoAttribs: _Pointer[c_ulong]) -> int:  # noqa: N802, N803
+            if attribFlags not in (SIATTRIBFLAGS_AND, SIATTRIBFLAGS_OR):
+                raise HRESULTError(E_INVALIDARG)
+            combined = sfgaoMask if attribFlags == SIATTRIBFLAGS_AND else 0
+            for index, path in enumerate(self.paths):
+                known = None if self.attributes is None else self.attributes[index]
+                attributes = (attributes_of(path) if known is None else known) & sfgaoMask
+                combined = combined & attributes if attribFlags == SIATTRIBFLAGS_AND else combined | attributes
+            psfgaoAttribs[0] = combined
+            return S_OK if combined == sfgaoMask else S_FALSE
+
+
+    class EnumShellItems(COMServer):
+        """IEnumShellItems over a ShellItemArray, which it holds a reference on."""
+
+        _com_interfaces_ = [bindings.IEnumShellItems]
+
+        def __init__(self, array: ShellItemArray, position: int = 0):
+            super().__init__()
+            array.AddRef()
+            self.array: ShellItemArray = array
+            self.position: int = position
+
+        def final_release(self) -> None:
+            self.array.Release()
+
+        def Next(self, celt: int, rgelt: int, pceltFetched: _Pointer[c_ulong] | None) -> int:  # noqa: N802
+            end = min(self.position + celt, len(self.array.paths))
+            fetched = max(end - self.position, 0)
+            if fetched:
+                slots = (c_void_p * fetched).from_address(rgelt)
+                for slot, index in enumerate(range(self.position, end)):
+                    slots[slot] = self.array.item(index).com_pointer()
+                self.position = end
+            if pceltFetched:
+                pceltFetched[0] = fetched
+            return S_OK if fetched == celt else S_FALSE
+
+        def Skip(self, celt: int) -> int:  # noqa: N802
+            count = len(self.array.paths)
+            skipped = min(celt, max(count - self.position, 0))
+            self.position += skipped
+            return S_OK if skipped == celt else S_FALSE
+
+        def Reset(self) -> None:  # noqa: N802
+            self.position = 0
+
+        def Clone(self, ppenum: int) -> None:  # noqa: N802
+            _write_pointer(ppenum, EnumShellItems(self.array, self.position).com_pointer())
+
+
+    class FileDialog(COMServer):
+        """IFileDialog: records what the caller configures, and runs a script instead of showing a window.
+
+        `script` overrides the one installed with set_dialog_script(). The state scripts read is public: `folder`,
+        `default_folder`, `options`, `file_name`, `file_types` [(name, spec), ...], `file_type_index` (1-based), `title`
+        and friends. After Show(), `selection` holds the picked paths.
+        """
+
+        default_options: int = 0
+
+        def __init__(self, script: Script | None = None):
+            super().__init__()
+            self.script: Script | None = script
+            self.options: int = self.default_options
+            self.title: str | None = None
+            self.ok_button_label: str | None = None
+            self.file_name_label: str | None = None
+            self.file_name: str = ""
+            self.default_extension: str | None = None
+            self.folder: str | None = None
+            self.default_folder: str | None = None
+            self.file_types: list[tuple[str, str]] = []
+            self.file_type_index: int = 1
+            self.close_result: int | None = None
+            self.selection: list[str] | None = None
+            self._selection_attributes: list[int | None] = []
+            self._pending: list[str] | None = None
+            self._sinks: dict[int, RawInterface] = {}
+            self._next_cookie: int = 1
+            self._filter: RawInterface | None = None
+
+        def final_release(self) -> None:
+            for sink in self._sinks.values():
+                sink.Release()
+            self._sinks.clear()
+            if self._filter is not None:
+                self._filter.Release()
+                self._filter = None
+
+        # What the simulated user sees.
+
+        @property
+        def current_folder(self) -> str:
+            return self.folder or self.default_folder or os.getcwd()
+
+        def type_matcher(self) -> FilterMatcher | None:
+            """The compiled specs of the selected file type, None when it shows every file."""
+            if not self.file_types or not 1 <= self.file_type_index <= len(self.file_types):
+                return None
+            matcher = filter_set(self.file_types).matcher(self.file_type_index)
+            return None if not matcher.patterns or matcher.everything else matcher
+
+        def listing(self) -> list[os.DirEntry[str]]:
+            """The entries the dialog lists in its current folder, sorted by name.
+
+            Hidden entries only with FOS_FORCESHOWHIDDEN, only folders with FOS_PICKFOLDERS, files matching the selected
+            file type, and whatever the IShellItemFilter set with SetFilter() includes.
+            """
+            show_hidden = self.options & FOS_FORCESHOWHIDDEN
+            pick_folders = self.options & FOS_PICKFOLDERS
+            matcher = self.type_matcher()
+            entries: list[os.DirEntry[str]] = []
+            with os.scandir(self.current_folder) as scan:
+                for entry in scan:
+                    if not show_hidden and entry.name.startswith("."):
+                        continue
+                    is_dir = entry.is_dir()
+                    if pick_folders and not is_dir:
+                        continue
+                    if not is_dir and matcher is not None and not matcher.match(entry.name):
+                        continue
+                    if self._filter is not None and not self._includes(entry.path, is_dir):
+                        continue
+                    entries.append(entry)
+            entries.sort(key=lambda entry: entry.name.lower())
+            return entries
+
+        def _includes(self, path: str, is_dir: bool) -> bool:  # noqa: FBT001
+            item = ShellItem(path, attributes_of(path, is_dir))
+            try:
+                return self._filter.IncludeItem(item.com_pointer()) == S_OK  # pyright: ignore[reportOptionalMemberAccess, reportAttributeAccessIssue]
+            finally:
+                item.Release()
+
+        def _resolve(self, picked: Selection) -> tuple[list[str], list[int | None]]:
+            folder = self.current_folder
+            paths: list[str] = []
+            attributes: list[int | None] = []
+            for entry in picked:
+                path = os.fspath(entry)
+                paths.append(path if os.path.isabs(path) else os.path.join(folder, path))
+                attributes.append(attributes_of(path, entry.is_dir()) if isinstance(entry, os.DirEntry) else None)
+            return paths, attributes
+
+        def _validate(self, paths: list[str]) -> None:
+            if not paths:
+                raise ValueError("A dialog script picked no paths; return None to cancel")
+            if len(paths) > 1 and not self.options & FOS_ALLOWMULTISELECT:
+                raise ValueError(f"A dialog script picked {len(paths)} paths without FOS_ALLOWMULTISELECT")
+            if self.options & FOS_PICKFOLDERS:
+                for path in paths:
+                    if not os.path.isdir(path):
+                        raise HRESULTError(ERROR_PATH_NOT_FOUND, path)
+            elif self.options & FOS_FILEMUSTEXIST:
+                for path in paths:
+                    if not os.path.isfile(path):
+                        raise HRESULTError(ERROR_FILE_NOT_FOUND, path)
+            elif self.options & FOS_PATHMUSTEXIST:
+                for folder in {os.path.dirname(path) for path in paths}:
+                    if not os.path.isdir(folder):
+                        raise HRESULTError(ERROR_PATH_NOT_FOUND, folder)
+
+        def _confirm(self, paths: list[str], attributes: list[int | None]) -> bool:  # noqa: ARG002
+            """Run the events the shell fires on OK. False if a handler refuses, which cancels."""
+            pfd = self.com_pointer()
+            try:
+                for sink in list(self._sinks.values()):
+                    sink.OnSelectionChange(pfd)  # pyright: ignore[reportAttributeAccessIssue]
+                for sink in list(self._sinks.values()):
+                    sink.OnFileOk(pfd)  # pyright: ignore[reportAttributeAccessIssue]
+            except HRESULTError:
+                return False
+            return True
+
+        # IModalWindow / IFileDialog.
+
+        def Show(self, hwndParent: int | None) -> None:  # noqa: N802, N803, ARG002
+            picked = (self.script or _dialog_script)(self)
+            if picked is None:
+                raise HRESULTError(ERROR_CANCELLED)
+            paths, attributes = self._resolve(picked)
+            self._validate(paths)
+            self._pending = paths
+            try:
+                if not self._confirm(paths, attributes):
+                    raise HRESULTError(ERROR_CANCELLED)
+            finally:
+                self._pending = None
+            self.selection, self._selection_attributes = paths, attributes
+
+        def SetFileTypes(self, cFileTypes: int, rgFilterSpec: int | None) -> None:  # noqa: N802, N803
+            if self.file_types:
+                raise HRESULTError(E_UNEXPECTED)  # Like the shell: once per dialog.
+            if cFileTypes and not rgFilterSpec:
+                raise HRESULTError(E_INVALIDARG)
+            strings = (c_wchar_p * (2 * cFileTypes)).from_address(rgFilterSpec) if cFileTypes else ()  # pyright: ignore[reportArgumentType]
+            self.file_types = [(strings[2 * index] or "", strings[2 * index + 1] or "") for index in range(cFileTypes)]
+
+        def SetFileTypeIndex(self, iFileType: int) -> None:  # noqa: N802, N803
+            self.file_type_index = iFileType
+
+        def GetFileTypeIndex(self, piFileType: _Pointer[c_uint]) -> None:  # noqa: N802, N803
+            piFileType[0] = self.file_type_index
+
+        def Advise(self, pfde: int | None, pdwCookie: _Pointer[c_ulong]) -> None:  # noqa: N802, N803
+            if not pfde:
+                raise HRESULTError(E_INVALIDARG)
+            cookie, self._next_cookie = self._next_cookie, self._next_cookie + 1
+            self._sinks[cookie] = _query(pfde, "IFileDialogEvents")
+            pdwCookie[0] = cookie
+
+        def Unadvise(self, dwCookie: int) -> None:  # noqa: N802, N803
+            sink = self._sinks.pop(dwCookie, None)
+            if sink is None:
+                raise HRESULTError(E_INVALIDARG)
+            sink.Release()
+
+        def SetOptions(self, fos: int) -> None:  # noqa: N802
+            self.options = fos
+
+        def GetOptions(self, pfos: _Pointer[c_ulong]) -> None:  # noqa: N802
+            pfos[0] = self.options
+
+        def SetDefaultFolder(self, psi: int | None) -> None:  # noqa: N802
+            self.default_folder = _path_of(psi)
+
+        def SetFolder(self, psi: int | None) -> None:  # noqa: N802
+            self.folder = _path_of(psi)
+
+        def GetFolder(self, ppsi: int) -> None:  # noqa: N802
+            _write_pointer(ppsi, ShellItem(self.current_folder).com_pointer())
+
+        def GetCurrentSelection(self, ppsi: int) -> None:  # noqa: N802
+            selection = self._pending or self.selection
+            if not selection:
+                raise HRESULTError(E_FAIL)
+            _write_pointer(ppsi, ShellItem(selection[0]).com_pointer())
+
+        def SetFileName(self, pszName: str | None) -> None:  # noqa: N802, N803
+            self.file_name = pszName or ""
+
+        def GetFileName(self, pszName: _Pointer[c_wchar_p]) -> None:  # noqa: N802, N803
+            _return_string(pszName, self.file_name)
+
+        def SetTitle(self, pszTitle: str | None) -> None:  # noqa: N802, N803
+            self.title = pszTitle
+
+        def SetOkButtonLabel(self, pszText: str | None) -> None:  # noqa: N802, N803
+            self.ok_button_label = pszText
+
+        def SetFileNameLabel(self, pszLabel: str | None) -> None:  # noqa: N802, N803
+            self.file_name_label = pszLabel
+
+        def GetResult(self, ppsi: int) -> None:  # noqa: N802
+            if self._pending:  # OnFileOk asks for the item being confirmed.
+                _write_pointer(ppsi, ShellItem(self._pending[0]).com_pointer())
+                return
+            if not self.selection:
+                raise HRESULTError(E_UNEXPECTED)
+            _write_pointer(ppsi, ShellItem(self.selection[0], self._selection_attributes[0]).com_pointer())
+
+        def AddPlace(self, psi: int | None, fdap: int) -> None:  # noqa: N802
+            pass
+
+        def SetDefaultExtension(self, pszDefaultExtension: str | None) -> None:  # noqa: N802, N803
+            self.default_extension = (pszDefaultExtension or "").lstrip(".") or None
+
+        def Close(self, hr: int) -> None:  # noqa: N802
+            self.close_result = hr
+
+        def SetClientGuid(self, guid: _Pointer[GUID]) -> None:  # noqa: N802
+            pass
+
+        def ClearClientData(self) -> None:  # noqa: N802
+            pass
+
+        def SetFilter(self, pFilter: int | None) -> None:  # noqa: N802, N803
+            previous, self._filter = self._filter, _query(pFilter, "IShellItemFilter") if pFilter else None
+            if previous is not None:
+                previous.Release()
+
+
+    class FileOpenDialog(FileDialog):
+        _com_interfaces_ = [bindings.IFileOpenDialog]
+        default_options = FOS_PATHMUSTEXIST | FOS_FILEMUSTEXIST | FOS_NOCHANGEDIR
+
+        def GetResults(self, ppenum: int) -> None:  # noqa: N802
+            if self.selection is None:
+                raise HRESULTError(E_UNEXPECTED)
+            _write_pointer(ppenum, ShellItemArray(self.selection, self._selection_attributes).com_pointer())
+
+        def GetSelectedItems(self, ppsai: int) -> None:  # noqa: N802
+            selection = self._pending or self.selection
+            if selection is None:
+                raise HRESULTError(E_UNEXPECTED)
+            _write_pointer(ppsai, ShellItemArray(selection).com_pointer())
+
+
+    class FileSaveDialog(FileDialog):
+        """IFileSaveDialog. The default extension is appended to picked names without one, as the shell does."""
+
+        _com_interfaces_ = [bindings.IFileSaveDialog]
+        default_options = FOS_OVERWRITEPROMPT | FOS_NOREADONLYRETURN | FOS_PATHMUSTEXIST | FOS_NOCHANGEDIR
+
+        def _resolve(self, picked: Selection) -> tuple[list[str], list[int | None]]:
+            paths, attributes = super()._resolve(picked)
+            if self.default_extension:
+                paths = [path if os.path.splitext(path)[1] else f"{path}.{self.default_extension}" for path in paths]
+            return paths, attributes
+
+        def _confirm(self, paths: list[str], attributes: list[int | None]) -> bool:
+            if self.options & FOS_OVERWRITEPROMPT and os.path.exists(paths[0]):
+                item = ShellItem(paths[0], attributes[0])
+                try:
+                    for sink in list(self._sinks.values()):
+                        if sink.OnOverwrite(self.com_pointer(), item.com_pointer()) == FDEOR_REFUSE:  # pyright: ignore[reportAttributeAccessIssue]
+                            return False
+                except HRESULTError:
+                    return False
+                finally:
+                    item.Release()
+            return super()._confirm(paths, attributes)
+
+        def SetSaveAsItem(self, psi: int | None) -> None:  # noqa: N802
+            path = _path_of(psi)
+            self.folder, self.file_name = os.path.split(path)
+
+    _dialog_types.update({bytes(CLSID_FileOpenDialog): FileOpenDialog, bytes(CLSID_FileSaveDialog): FileSaveDialog})
+
+
+def _require_servers() -> None:
+    if "FileSaveDialog" not in globals():  # Defined last.
+        with _servers_lock:
+            if "FileSaveDialog" not in globals():
+                _define_servers()
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _SERVER_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _require_servers()
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SERVER_CLASSES})
+
+
+def create_file_dialog(clsid: GUID, interface: str, script: Script | None = None) -> RawInterface:
+    """CoCreateInstance for the simulated dialogs: a FileOpenDialog or FileSaveDialog, as a RawInterface."""
+    _require_servers()
+    dialog_type = _dialog_types.get(bytes(clsid))
+    if dialog_type is None:
+        raise HRESULT(REGDB_E_CLASSNOTREG).exception(f"CoCreateInstance({interface}) failed: {clsid} is not simulated")
+    target = raw_interfaces()[interface]
+    dialog = dialog_type(script)
+    try:
+        return target.from_address(dialog.query_interface(target._binding_._iid_))
+    finally:
+        dialog.Release()  # The creator's reference: the caller owns the one QueryInterface added.
+
+
+def create_shell_item(path: str | os.PathLike[str]) -> RawInterface:
+    """SHCreateItemFromParsingName for an existing local path, as a RawInterface."""
+    path = os.path.abspath(path)
+    if not os.path.exists(path):
+        raise HRESULTError(ERROR_FILE_NOT_FOUND, f"Failed to create shell item from path: {path}")
+    _require_servers()
+    return raw_interfaces()["IShellItem"].from_address(ShellItem(path).com_pointer())
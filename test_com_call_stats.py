@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import itertools
+import threading
+
+import pytest
+
+import com_call_stats
+
+from allocation_testing import peak_allocated_bytes
+from com_call_stats import COMCallStats, call_site, get_com_call_stats, set_com_call_stats
+from com_helpers import HandleCOMCall
+from hresult import HRESULTError
+
+
+@pytest.fixture
+def stats():
+    collector = COMCallStats()
+    previous = set_com_call_stats(collector)
+    yield collector
+    set_com_call_stats(previous)
+
+
+def test_disabled_by_default():
+    assert get_com_call_stats() is None
+
+
+def test_counts_calls_and_failures_per_site(stats: COMCallStats):
+    assert get_com_call_stats() is stats
+    for _ in range(3):
+        stats.record_call("SetFolder")
+    stats.record_call("SetOptions")
+    stats.record_failure("SetFolder", 0x80070005, HRESULTError(0x80070005, "SetFolder failed"))
+    stats.record_failure("SetFolder", -2147023673, HRESULTError(0x800704C7, "SetFolder failed again"))
+    stats.record_failure("SetFolder", 0x80070005, OSError("plain OSError"))
+    snapshot = stats.snapshot()
+    assert snapshot["SetFolder"] == {
+        "calls": 3,
+        "failures": {"0x80070005": 2, "0x800704C7": 1},
+        "failure_count": 3,
+        "last_error": {"hresult": "0x80070005", "type": "OSError", "description": "plain OSError"},
+    }
+    assert snapshot["SetOptions"] == {"calls": 1, "failures": {}, "failure_count": 0, "last_error": None}
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+def test_sites_are_labelled_without_arguments(stats: COMCallStats):
+    for path in ("C:\\", "C:\\Users", "D:\\data (old)"):
+        stats.record_call(call_site(f"SetFolder({path})"))
+    stats.record_call(call_site("Show"))
+    assert {label: site["calls"] for label, site in stats.snapshot().items()} == {"SetFolder": 3, "Show": 1}
+
+
+def test_last_error_keeps_the_short_description(stats: COMCallStats):
+    stats.record_failure("Show", 0x800704C7, HRESULTError(0x800704C7, "Failed to show the file dialog!"))
+    assert stats.snapshot()["Show"]["last_error"] == {"hresult": "0x800704C7", "type": "Cancelled", "description": "Failed to show the file dialog!"}
+
+
+def test_concurrent_calls_are_all_counted(stats: COMCallStats):
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(5_000):
+            stats.record_call("GetResults")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stats.snapshot()["GetResults"]["calls"] == 40_000
+
+
+def test_recording_calls_does_not_allocate(stats: COMCallStats):
+    def calls(count: int) -> None:
+        for _ in itertools.repeat(None, count):
+            stats.record_call("SetOptions")
+
+    # Counts past the small-int cache are new int objects, each replacing the previous one: a constant couple of
+    # objects at peak. Anything allocated per call would scale with the count.
+    assert peak_allocated_bytes(calls, 10_000) == peak_allocated_bytes(calls, 100)
+
+
+def test_handled_calls_use_the_given_label(stats: COMCallStats, capsys):
+    with HandleCOMCall("SetFolder(C:\\data (old))", "SetFolder") as check:
+        check(0)
+    with pytest.raises(HRESULTError), HandleCOMCall("SetOptions(64)") as check:
+        check(0x80070005)
+    assert {label: (site["calls"], site["failure_count"]) for label, site in stats.snapshot().items()} == {"SetFolder": (1, 0), "SetOptions": (1, 1)}
+    capsys.readouterr()
+
+
+def test_handled_calls_skip_labelling_while_disabled(monkeypatch, capsys):
+    assert get_com_call_stats() is None
+    monkeypatch.setattr(com_call_stats, "call_site", lambda action_desc: pytest.fail(f"labelled {action_desc}"))
+    with HandleCOMCall("SetFolder(C:\\)") as check:
+        check(0)
+    capsys.readouterr()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import io
+
+from ctypes import c_void_p
+
+import pytest
+
+from com_refcount import RefcountTracker, instrument, set_refcount_tracker
+from test_vtable_backend import fake, fake_item
+
+
+@pytest.fixture
+def tracker():
+    tracking = RefcountTracker()
+    previous = set_refcount_tracker(tracking)
+    yield tracking
+    set_refcount_tracker(previous)
+
+
+def fake_selection(count: int):
+    items = [fake_item(f"/home/user/file{i}.txt") for i in range(count)]
+
+    def get_count(this, pcount):  # noqa: ARG001
+        pcount[0] = len(items)
+        return 0
+
+    def get_item_at(this, index, ppsi):  # noqa: ARG001
+        unknown, item = items[index]
+        unknown.refcount += 1  # The reference the caller now owns.
+        c_void_p.from_address(ppsi).value = item.address
+        return 0
+
+    unknown, array = fake("IShellItemArray", GetCount=get_count, GetItemAt=get_item_at)
+    return array, (unknown, items)
+
+
+def leak_one_of(array) -> None:
+    for index in range(array.GetCount()):
+        item = array.GetItemAt(index)
+        if index != 1:
+            item.Release()
+
+
+def test_census_counts_leaked_references(tracker: RefcountTracker):
+    array, keep_alive = fake_selection(3)
+    leak_one_of(array)
+    array.GetItemAt(1)
+    (survivor,) = tracker.survivors()
+    assert (survivor.interface, survivor.references) == ("IShellItem", 2)
+    assert survivor.address == keep_alive[1][1][1].address
+    assert any(frame.name == "leak_one_of" for frame in survivor.stack)
+    assert tracker.census() == {"IShellItem": {"objects": 1, "references": 2}}
+    assert not tracker.over_releases
+
+
+def test_over_release_is_reported(tracker: RefcountTracker):
+    array, keep_alive = fake_selection(1)
+    item = array.GetItemAt(0)
+    assert item.AddRef() == 3  # noqa: PLR2004  # The fake's own reference, GetItemAt's and this one.
+    item.Release()
+    item.Release()
+    assert not tracker.survivors()
+    item.Release()
+    (over_release,) = tracker.over_releases
+    assert (over_release.interface, over_release.address) == ("IShellItem", item.address)
+
+    report = io.StringIO()
+    tracker.report(report)
+    assert "0 live interface pointer(s), 1 over-release(s)" in report.getvalue()
+    assert "test_over_release_is_reported" in report.getvalue()
+    del keep_alive
+
+
+def test_pointers_acquired_unseen_are_not_leaks(tracker: RefcountTracker):
+    borrowed_fake, borrowed = fake_item("/home/user")
+    borrowed.AddRef()  # First seen being AddRef'd: a borrowed pointer the process now owns a reference on.
+    borrowed.Release()
+    acquired_fake, acquired = fake_item("/home/user/file.txt")
+    acquired.Release()  # First seen being released: acquired before the tracker was installed.
+    assert not tracker.survivors()
+    assert not tracker.over_releases
+
+
+def test_nothing_is_tracked_when_disabled():
+    tracking = RefcountTracker()
+    array, keep_alive = fake_selection(1)
+    array.GetItemAt(0)
+    assert not tracking.survivors()
+    del keep_alive
+
+
+class IFake:
+    pass
+
+
+class FakePointer(c_void_p):
+    """Stands in for a comtypes interface pointer: a c_void_p whose type names its interface."""
+
+    __com_interface__ = IFake
+    refcounts: dict[int, int] = {}
+
+    def AddRef(self) -> int:  # noqa: N802
+        self.refcounts[self.value] = self.refcounts.get(self.value, 1) + 1  # pyright: ignore[reportArgumentType]
+        return self.refcounts[self.value]  # pyright: ignore[reportArgumentType]
+
+    def Release(self) -> int:  # noqa: N802
+        self.refcounts[self.value] -= 1  # pyright: ignore[reportArgumentType]
+        return self.refcounts[self.value]  # pyright: ignore[reportArgumentType]
+
+
+def test_instrumented_comtypes_style_interfaces(tracker: RefcountTracker):
+    instrument(FakePointer)
+    instrument(FakePointer)  # Idempotent.
+    pointer = FakePointer(0x1000)
+    assert pointer.__ctypes_from_outparam__() is pointer  # What ctypes calls on an out-parameter result.
+    assert pointer.AddRef() == 2  # noqa: PLR2004
+    assert tracker.census() == {"IFake": {"objects": 1, "references": 2}}
+    assert pointer.Release() == 1
+    assert pointer.Release() == 0
+    assert not tracker.survivors()
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+from ctypes import POINTER, addressof, c_void_p, cast
+
+import pytest
+
+import com_server
+import vtable_backend
+
+from com_server import COMServer, interface_ids
+from hresult import HRESULTError, NoInterface
+from iunknown import IID_IUnknown, IUnknown
+from vtable_backend import raw_interfaces
+
+ERROR_CANCELLED = 0x800704C7
+
+
+def dialog_server_type() -> type[COMServer]:
+    bindings = vtable_backend.bindings()
+
+    class FileOpenDialog(COMServer):
+        _com_interfaces_ = [bindings.IFileOpenDialog, bindings.IShellItemFilter]
+
+        def __init__(self):
+            super().__init__()
+            self.shown: list[int] = []
+            self.released = False
+
+        def Show(self, hwndParent):  # noqa: N802, N803
+            self.shown.append(hwndParent or 0)
+            if hwndParent == 1:
+                raise HRESULTError(ERROR_CANCELLED)
+
+        def final_release(self):
+            self.released = True
+
+    return FileOpenDialog
+
+
+def test_qi_table_covers_inherited_interfaces():
+    bindings = vtable_backend.bindings()
+    server_type = dialog_server_type()
+    assert [str(iid) for iid in interface_ids(bindings.IFileOpenDialog)] == [
+        str(bindings.IFileOpenDialog._iid_), str(bindings.IFileDialog._iid_), str(bindings.IModalWindow._iid_), str(IID_IUnknown),
+    ]
+    assert server_type._qi_table_ == {
+        bytes(bindings.IFileOpenDialog._iid_): 0,
+        bytes(bindings.IFileDialog._iid_): 0,
+        bytes(bindings.IModalWindow._iid_): 0,
+        bytes(IID_IUnknown): 0,  # The identity: the first interface listed, never IShellItemFilter's.
+        bytes(bindings.IShellItemFilter._iid_): 1,
+    }
+
+
+def test_native_callers_reach_the_python_methods():
+    bindings = vtable_backend.bindings()
+    server = dialog_server_type()()
+    dialog = raw_interfaces()["IFileOpenDialog"].from_address(server.com_pointer())
+    dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    with pytest.raises(HRESULTError) as cancelled:
+        dialog.Show(1)  # pyright: ignore[reportAttributeAccessIssue]
+    assert cancelled.value.hresult == ERROR_CANCELLED
+    assert server.shown == [0, 1]
+    with pytest.raises(HRESULTError, match="NOTIMPL|not implemented"):
+        dialog.SetTitle("Open")  # pyright: ignore[reportAttributeAccessIssue]
+
+    shell_filter = dialog.QueryInterface("IShellItemFilter")
+    assert shell_filter.address == server.com_pointer(bindings.IShellItemFilter._iid_)
+    assert shell_filter.QueryInterface("IModalWindow").address == dialog.address  # Back to the identity pointer.
+    with pytest.raises(NoInterface):
+        dialog.QueryInterface("IShellItem")
+
+    out = c_void_p(1)
+    assert server.IUnknown_QueryInterface(None, bindings.IShellItem._iid_, addressof(out)) == com_server.E_NOINTERFACE
+    assert out.value is None
+    assert server.IUnknown_QueryInterface(None, IID_IUnknown, None) == com_server.E_POINTER
+    assert server._refcount.count == 3  # noqa: PLR2004, SLF001  # The creator's, plus the two successful QueryInterface calls.
+
+
+def test_last_release_destroys_the_server():
+    server = dialog_server_type()()
+    pointer = server.query_interface(vtable_backend.bindings().IModalWindow._iid_)
+    assert pointer == server.com_pointer()
+    server_ref = weakref.ref(server)
+    del server
+    gc.collect()
+    unknown = raw_interfaces()["IUnknown"].from_address(pointer)
+    assert unknown.Release() == 1
+    assert unknown.Release() == 0
+    assert server_ref() is None
+    assert pointer not in com_server._servers  # noqa: SLF001
+
+
+def test_comtypes_interfaces_need_a_comobject_base():
+    class IFoo:
+        _iid_ = IID_IUnknown
+
+    class Server(COMServer):
+        _com_interfaces_ = [IFoo]
+
+    live = len(Server._live_objects)
+    with pytest.raises(TypeError, match="COMObject"):
+        Server()
+    assert len(Server._live_objects) == live
+
+
+class FakeCOMObject:
+    """What COMServer relies on from comtypes.COMObject: its interface pointers, whose vtables call the object's
+    IUnknown_<method>(this, ...) the way comtypes' do, and its own reference count."""
+
+    _instances_: dict[FakeCOMObject, None] = {}
+    _objects_: weakref.WeakValueDictionary[int, FakeCOMObject] = weakref.WeakValueDictionary()
+    _callbacks_: list = [
+        IUnknown._dispatch_["QueryInterface"].prototype(lambda this, riid, ppv: FakeCOMObject._objects_[this].IUnknown_QueryInterface(this, riid, cast(ppv, POINTER(c_void_p)))),
+        IUnknown._dispatch_["AddRef"].prototype(lambda this: FakeCOMObject._objects_[this].IUnknown_AddRef(this)),
+        IUnknown._dispatch_["Release"].prototype(lambda this: FakeCOMObject._objects_[this].IUnknown_Release(this)),
+    ]
+    _vtable_ = (c_void_p * 3)(*[cast(callback, c_void_p).value for callback in _callbacks_])
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        self._refcnt = 0
+        self._storage = (c_void_p * len(cls._com_interfaces_))(*[addressof(cls._vtable_)] * len(cls._com_interfaces_))  # pyright: ignore[reportAttributeAccessIssue]
+        self._com_pointers_ = {interface._iid_: addressof(self._storage) + index * 8 for index, interface in enumerate(cls._com_interfaces_)}  # pyright: ignore[reportAttributeAccessIssue]
+        for address in self._com_pointers_.values():
+            FakeCOMObject._objects_[address] = self
+        return self
+
+    def IUnknown_QueryInterface(self, this, riid, ppv):  # noqa: N802, ARG002
+        """comtypes' own lookup, which COMServer's table replaces."""
+        return com_server.E_NOINTERFACE
+
+    def IUnknown_AddRef(self, this):  # noqa: N802, ARG002
+        self._refcnt += 1
+        if self._refcnt == 1:
+            FakeCOMObject._instances_[self] = None
+        return self._refcnt
+
+    def IUnknown_Release(self, this):  # noqa: N802, ARG002
+        self._refcnt -= 1
+        if self._refcnt == 0:
+            self._final_release_()
+            del FakeCOMObject._instances_[self]
+        return self._refcnt
+
+    def QueryInterface(self, interface):  # noqa: N802
+        """COMObject.QueryInterface: `interface`'s pointer for Python callers, with a reference."""
+        self.IUnknown_AddRef(None)
+        return self._com_pointers_[interface._iid_]
+
+
+def test_comtypes_servers_use_the_comobject_reference_count():
+    class IFoo:
+        _iid_ = vtable_backend.bindings().IShellItemFilter._iid_
+
+    released: list[str] = []
+
+    class Server(COMServer, FakeCOMObject):
+        _com_interfaces_ = [IFoo]
+
+        def final_release(self):
+            released.append(type(self).__name__)
+
+    live, servers = len(Server._live_objects), len(com_server._servers)  # noqa: SLF001
+    server = Server()
+    assert (len(Server._live_objects), len(com_server._servers)) == (live, servers)  # noqa: SLF001  # Nothing pinned.
+    pointer = server.query_interface(IFoo._iid_)
+    assert pointer == server.com_pointer(IFoo._iid_)
+    assert server._refcnt == 1  # noqa: SLF001
+    server_ref = weakref.ref(server)
+    del server
+    assert server_ref() is not None  # Kept alive by the COMObject while native callers hold a reference.
+    assert server_ref().Release() == 0  # pyright: ignore[reportOptionalMemberAccess]
+    assert released == ["Server"]
+    gc.collect()
+    assert server_ref() is None
+
+
+def test_comtypes_servers_answer_native_query_interface_from_the_table():
+    bindings = vtable_backend.bindings()
+
+    class IUnknownInterface:  # Stand-ins for comtypes interfaces, which derive from comtypes.IUnknown.
+        _iid_ = IID_IUnknown
+
+    class IModalWindow(IUnknownInterface):
+        _iid_ = bindings.IModalWindow._iid_
+
+    class IFileDialog(IModalWindow):
+        _iid_ = bindings.IFileDialog._iid_
+
+    class IShellItemFilter(IUnknownInterface):
+        _iid_ = bindings.IShellItemFilter._iid_
+
+    class Server(COMServer, FakeCOMObject):
+        _com_interfaces_ = [IFileDialog, IShellItemFilter]
+
+    server = Server()
+    unknown = raw_interfaces()["IUnknown"].from_address(server.query_interface(IID_IUnknown))
+    shell_filter = unknown.QueryInterface("IShellItemFilter")  # Through the vtable, as a native caller would.
+    assert shell_filter.address == server.com_pointer(IShellItemFilter._iid_)
+    modal = shell_filter.QueryInterface("IModalWindow")
+    assert modal.address == unknown.address  # The identity pointer: IModalWindow is a base of IFileDialog.
+    with pytest.raises(NoInterface):
+        unknown.QueryInterface("IShellItem")
+    assert server._refcnt == 3  # noqa: PLR2004, SLF001
+
+    assert server.QueryInterface(IShellItemFilter) == shell_filter.address  # Still COMObject's, for Python callers.
+    assert server.Release() == 3  # noqa: PLR2004
+    assert (modal.Release(), shell_filter.Release(), unknown.Release()) == (2, 1, 0)
+
+
+def test_raw_servers_query_interface_like_comobject():
+    bindings = vtable_backend.bindings()
+    server = dialog_server_type()()
+    shell_filter = server.QueryInterface(bindings.IShellItemFilter)
+    assert shell_filter.address == server.com_pointer(bindings.IShellItemFilter._iid_)
+    assert server.QueryInterface("IModalWindow").Release() == 2  # noqa: PLR2004
+    assert shell_filter.Release() == 1
+    assert server.Release() == 0
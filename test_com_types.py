@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import pytest
+
+import gc
+import itertools
+import pickle
+import threading
+import tracemalloc
+import uuid
+
+from ctypes import byref, memmove, sizeof
+
+from com_types import _GUID_LE_STRUCT, GUID, GUID_NULL, GUIDInternCache, format_guid
+
+IID_IShellItem_STR = "{43826D1E-E718-42EE-BC55-A1E261C37BFE}"
+
+
+def test_format_guid_matches_string_from_clsid_layout():
+    assert format_guid(0x43826D1E, 0xE718, 0x42EE, bytes.fromhex("BC55A1E261C37BFE")) == IID_IShellItem_STR
+    assert format_guid(0, 0, 0, bytes(8)) == "{00000000-0000-0000-0000-000000000000}"
+
+
+def test_str_is_cached_and_canonical():
+    guid = GUID(IID_IShellItem_STR.lower())
+    assert str(guid) == IID_IShellItem_STR
+    assert str(guid) is str(guid)
+    assert repr(guid) == f'GUID("{IID_IShellItem_STR}")'
+
+
+def test_to_string_and_copy_use_canonical_form():
+    guid = GUID(IID_IShellItem_STR)
+    assert GUID.to_string(GUID.from_string(IID_IShellItem_STR)) == IID_IShellItem_STR
+    assert guid.copy() == guid
+
+
+def test_numeric_forms_match_string_form():
+    expected = GUID(IID_IShellItem_STR)
+    d1, d2, d3, d4 = 0x43826D1E, 0xE718, 0x42EE, bytes.fromhex("BC55A1E261C37BFE")
+    assert GUID(d1, d2, d3, d4) is expected
+    assert GUID(d1, d2, d3, tuple(d4)) is expected
+    assert GUID(d1, d2, d3, *d4) is expected
+    assert GUID(tuple(bytes(expected))) is expected
+    assert GUID(0, 0, 0, bytes(8)) is GUID.NULL()
+
+
+@pytest.mark.parametrize(
+    "guid_string",
+    [
+        "{43826D1E-E718-42EE-BC55-A1E261C37BF}",
+        "{43826D1E-E718-42EE-BC55-A1E261C37BFE",
+        "43826D1E-E718-42EE-BC55A1E261C37BFE0",
+        "{43826D1E-E718-42EE-BC55-A1E261C37 FE}",
+        "{4382GD1E-E718-42EE-BC55-A1E261C37BFE}",
+    ],
+)
+def test_malformed_strings_are_rejected(guid_string: str):
+    with pytest.raises(ValueError, match="Invalid GUID string"):
+        GUID.from_string(guid_string)
+    with pytest.raises(OSError, match="Failed to construct a GUID"):
+        GUID(guid_string)
+
+
+def test_out_of_range_fields_are_rejected():
+    with pytest.raises(OSError, match="Failed to construct a GUID"):
+        GUID(1 << 32, 0, 0, bytes(8))
+    with pytest.raises(OSError, match="Failed to construct a GUID"):
+        GUID(0, 0, 0, b"short")
+
+
+def test_guid_is_sixteen_bytes():
+    assert sizeof(GUID) == 16
+    assert sizeof(GUID * 4) == 64
+
+
+def test_parse_many_and_format_many_round_trip():
+    strings = [IID_IShellItem_STR, "{00000000-0000-0000-C000-000000000046}", "b63ea76d-1f85-456f-a19c-48159efa858b"]
+    array = GUID.parse_many(strings)
+    assert len(array) == 3
+    assert array[0] == GUID(IID_IShellItem_STR)
+    assert GUID.format_many(array) == [IID_IShellItem_STR, "{00000000-0000-0000-C000-000000000046}", "{B63EA76D-1F85-456F-A19C-48159EFA858B}"]
+    assert GUID.format_many(list(array)) == GUID.format_many(array)
+    assert GUID.format_many(GUID.parse_many([bytes(GUID(IID_IShellItem_STR))])) == [IID_IShellItem_STR]
+
+
+def test_parse_many_from_writable_buffer_is_zero_copy():
+    buffer = bytearray(bytes(GUID(IID_IShellItem_STR)) * 2)
+    array = GUID.parse_many(buffer)
+    buffer[16:20] = bytes(4)
+    assert str(array[1]) == "{00000000-E718-42EE-BC55-A1E261C37BFE}"
+    assert GUID.parse_many(bytes(buffer))[0] == GUID(IID_IShellItem_STR)
+    with pytest.raises(ValueError, match="multiple of 16"):
+        GUID.parse_many(bytearray(17))
+
+
+def test_parse_many_rejects_bad_entries():
+    with pytest.raises(ValueError, match="Invalid GUID string"):
+        GUID.parse_many([IID_IShellItem_STR, "{43826D1E-E718-42EE-BC55-A1E261C3 BFE}"])
+    with pytest.raises(TypeError):
+        GUID.parse_many([12345])
+
+
+def test_as_numpy_view():
+    np = pytest.importorskip("numpy")
+    array = GUID.parse_many([IID_IShellItem_STR, "{00000000-0000-0000-C000-000000000046}", IID_IShellItem_STR])
+    view = GUID.as_numpy(array)
+    assert view["Data1"].tolist() == [0x43826D1E, 0, 0x43826D1E]
+    assert len(np.unique(view.view("V16"))) == 2
+
+
+def _key(n: int) -> bytes:
+    return _GUID_LE_STRUCT.pack(n, 0, 0, bytes(8))
+
+
+def test_intern_cache_lru_is_bounded_and_counts():
+    cache = GUIDInternCache(maxsize=4, shards=1)
+    first = cache.get_or_create(_key(1), GUID.from_buffer_copy)
+    assert cache.get_or_create(_key(1), GUID.from_buffer_copy) is first
+    for n in range(2, 10):
+        cache.get_or_create(_key(n), GUID.from_buffer_copy)
+    stats = cache.stats()
+    assert stats["recent"] == 4
+    assert stats["evictions"] == 5
+    assert stats["misses"] == 9
+    assert stats["hits"] == 1
+    # Evicted from the LRU but still referenced here, so it must stay the interned instance.
+    assert cache.get_or_create(_key(1), GUID.from_buffer_copy) is first
+
+
+def test_intern_cache_drops_unreferenced_evicted_entries():
+    cache = GUIDInternCache(maxsize=1, shards=1)
+    cache.get_or_create(_key(1), GUID.from_buffer_copy)
+    cache.get_or_create(_key(2), GUID.from_buffer_copy)
+    gc.collect()
+    assert cache.get(_key(1)) is None
+    assert cache.get(_key(2)) is not None
+
+
+def test_intern_cache_pin_keeps_identity():
+    cache = GUIDInternCache(maxsize=1, shards=1)
+    existing = cache.get_or_create(_key(1), GUID.from_buffer_copy)
+    cache.pin(GUID.from_buffer_copy(_key(1)))
+    for n in range(2, 10):
+        cache.get_or_create(_key(n), GUID.from_buffer_copy)
+    gc.collect()
+    assert cache.get(_key(1)) is existing
+    assert cache.stats()["pinned_hits"] == 1
+
+
+def test_intern_cache_rejects_bad_shard_count():
+    with pytest.raises(ValueError, match="power of two"):
+        GUIDInternCache(shards=3)
+
+
+def test_concurrent_construction_yields_one_instance():
+    results: list[GUID] = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(GUID("{7E9FB0D3-919F-4307-AB2E-9B1860310C93}"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(result is results[0] for result in results)
+
+
+def test_null_singleton_and_truthiness():
+    assert GUID.NULL() is GUID_NULL
+    assert GUID() is not GUID_NULL
+    assert GUID() is not GUID()
+    assert not GUID_NULL
+    assert not GUID.parse_many([bytes(16)])[0]
+    assert GUID(IID_IShellItem_STR)
+
+
+def test_out_parameters_are_fresh_and_read_after_being_filled():
+    out = GUID()
+    assert (str(out), hash(out)) == (str(GUID_NULL), hash(GUID_NULL))  # Formatted and hashed before the call fills it.
+    memmove(byref(out), bytes(GUID(IID_IShellItem_STR)), sizeof(GUID))  # What a callee does.
+    assert str(out) == IID_IShellItem_STR
+    assert out == GUID(IID_IShellItem_STR)
+    assert hash(out) == hash(GUID(IID_IShellItem_STR))
+    assert not GUID_NULL
+
+
+def test_equality_and_hash_use_raw_bytes():
+    interned = GUID(IID_IShellItem_STR)
+    copy = GUID.parse_many([IID_IShellItem_STR])[0]
+    assert copy is not interned
+    assert copy == interned
+    assert not copy != interned  # noqa: SIM202
+    assert hash(copy) == hash(interned)
+    assert bytes(copy) == bytes(interned) == _GUID_LE_STRUCT.pack(*GUID.from_string(IID_IShellItem_STR))
+    assert {interned: 1}[copy] == 1
+    assert interned != GUID_NULL
+
+
+def test_dict_lookups_do_not_allocate():
+    interned = GUID(IID_IShellItem_STR)
+    copy = GUID.parse_many([IID_IShellItem_STR])[0]
+    table = {interned: 1, GUID_NULL: 0}
+
+    def lookups(count: int) -> None:
+        for _ in itertools.repeat(None, count):
+            table[interned]
+            table[copy]
+            bool(copy)
+
+    def peak(count: int) -> int:
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            lookups(count)
+            return tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+
+    lookups(1)
+    # The call itself (iterator, frame) costs a constant few bytes; anything per lookup would scale with the count.
+    assert peak(10_000) == peak(1)
+
+
+def test_uuid_round_trip_uses_bytes_le():
+    guid = GUID(IID_IShellItem_STR)
+    as_uuid = guid.to_uuid()
+    assert as_uuid == uuid.UUID(IID_IShellItem_STR)
+    assert GUID.from_uuid(as_uuid) is guid
+
+
+def test_memoryview_export_is_zero_copy():
+    array = GUID.parse_many([IID_IShellItem_STR])
+    view = array[0].to_memoryview()
+    assert view.nbytes == 16
+    assert view.tobytes() == bytes(GUID(IID_IShellItem_STR))
+    view[0] = 0
+    assert array[0].Data1 == 0x43826D00
+
+
+def test_pickle_round_trips_through_the_intern_cache():
+    guid = GUID(IID_IShellItem_STR)
+    assert pickle.loads(pickle.dumps(guid)) is guid  # noqa: S301
+    assert pickle.loads(pickle.dumps(GUID.parse_many([IID_IShellItem_STR])[0])) is guid  # noqa: S301
+    assert guid.copy() is guid
+    with pytest.raises(ValueError, match="16 bytes"):
+        GUID.from_raw(b"too short")
+
+
+def test_create_many_sets_rfc4122_bits():
+    array = GUID.create_many(256)
+    assert len(array) == 256
+    uuids = [guid.to_uuid() for guid in array]
+    assert {value.version for value in uuids} == {4}
+    assert {value.variant for value in uuids} == {uuid.RFC_4122}
+    assert len(set(uuids)) == 256
+    assert len(GUID.create_many(0)) == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        GUID.create_many(-1)
+
+
+def test_create_new_is_random_and_not_interned():
+    first, second = GUID.create_new(), GUID.create_new()
+    assert first != second
+    assert first.to_uuid().version == 4
+    assert GUID.from_raw(bytes(first)) is not first
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gc
+import os
+
+from ctypes import POINTER, c_void_p, c_wchar_p, cast, pointer
+
+import pytest
+
+from cotaskmem import (
+    WCHAR_SIZE,
+    CoTaskMemString,
+    TrackingTaskAllocator,
+    comtypes_display_name,
+    get_task_allocator,
+    set_task_allocator,
+)
+from test_vtable_backend import fake
+
+PATH = "C:\\Users\\Zoë\\Документы\\report.txt"
+ENCODING = "utf-16-le" if WCHAR_SIZE == 2 else "utf-32-le"  # noqa: PLR2004
+
+
+@pytest.fixture
+def allocator():
+    tracking = TrackingTaskAllocator()
+    set_task_allocator(tracking)
+    yield tracking
+    set_task_allocator(None)
+
+
+def test_freed_exactly_once(allocator: TrackingTaskAllocator):
+    name = CoTaskMemString.take(allocator.alloc_string(PATH))
+    assert name is not None
+    assert len(name) == len(PATH)
+    assert name.value == PATH
+    assert name.value is name.value  # Decoded once.
+    name.close()
+    name.close()
+    assert name.closed
+    assert (allocator.allocations, allocator.frees, allocator.live) == (1, 1, {})
+    assert os.fspath(name) == PATH  # The decoded value outlives the buffer.
+
+
+def test_context_manager_and_garbage_collection_free(allocator: TrackingTaskAllocator):
+    with CoTaskMemString.take(allocator.alloc_string(PATH)) as name:  # pyright: ignore[reportOptionalContextManager]
+        assert str(name) == PATH
+    assert not allocator.live
+    CoTaskMemString.take(allocator.alloc_string(PATH))
+    gc.collect()
+    assert allocator.frees == 2  # noqa: PLR2004
+    assert not allocator.live
+
+
+def test_take_accepts_out_parameters(allocator: TrackingTaskAllocator):
+    assert CoTaskMemString.take(None) is None
+    assert CoTaskMemString.take(c_wchar_p()) is None
+    with pytest.raises(ValueError, match="NULL"):
+        CoTaskMemString(0)
+    out = c_wchar_p()
+    cast(pointer(out), POINTER(c_void_p))[0] = allocator.alloc_string(PATH)
+    with CoTaskMemString.take(out) as name:  # pyright: ignore[reportOptionalContextManager]
+        assert name.value == PATH
+    assert not allocator.live
+
+
+def test_view_reads_the_buffer_without_decoding(allocator: TrackingTaskAllocator):
+    name = CoTaskMemString.take(allocator.alloc_string(PATH))
+    assert name is not None
+    view = name.view()
+    assert view.readonly
+    assert view == PATH.encode(ENCODING)
+    assert name.tobytes() == PATH.encode(ENCODING)
+    assert name._text is None  # noqa: SLF001
+    name.close()
+    with pytest.raises(ValueError, match="released"):
+        bytes(view)
+    with pytest.raises(ValueError, match="closed"):
+        name.view()
+
+
+def test_double_free_is_detected():
+    tracking = TrackingTaskAllocator()
+    address = tracking.alloc_string(PATH)
+    tracking.free(address)
+    with pytest.raises(ValueError, match="not allocated"):
+        tracking.free(address)
+
+
+def test_display_names_from_the_raw_backend_do_not_leak(allocator: TrackingTaskAllocator):
+    def get_display_name(this, sigdn, ppsz):  # noqa: ARG001
+        cast(ppsz, POINTER(c_void_p))[0] = get_task_allocator().alloc_string(PATH)
+        return 0
+
+    fake_object, item = fake("IShellItem", GetDisplayName=get_display_name)
+    for _ in range(1000):
+        with item.GetDisplayName(0) as name:  # pyright: ignore[reportAttributeAccessIssue]
+            assert name.view() == PATH.encode(ENCODING)
+    names = [item.GetDisplayName(0) for _ in range(10)]  # pyright: ignore[reportAttributeAccessIssue]
+    assert len(allocator.live) == 10  # noqa: PLR2004
+    del names
+    assert (allocator.allocations, allocator.frees, allocator.live) == (1010, 1010, {})
+    assert fake_object.refcount == 1
+
+
+class FakeComtypesShellItem:
+    """The raw method comtypes generates for IShellItem::GetDisplayName, next to the wrapper that would leak."""
+
+    def __init__(self, path: str | None):
+        self.path = path
+
+    def _IShellItem__com_GetDisplayName(self, sigdn, ppsz):  # noqa: ARG002, N802
+        if self.path is not None:
+            cast(ppsz, POINTER(c_void_p))[0] = get_task_allocator().alloc_string(self.path)
+        return 0
+
+
+def test_display_names_from_comtypes_items_do_not_leak(allocator: TrackingTaskAllocator):
+    for _ in range(100):
+        with comtypes_display_name(FakeComtypesShellItem(PATH), 0) as name:  # pyright: ignore[reportOptionalContextManager]
+            assert str(name) == PATH
+    assert comtypes_display_name(FakeComtypesShellItem(None), 0) is None
+    assert (allocator.allocations, allocator.frees, allocator.live) == (100, 100, {})
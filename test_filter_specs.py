@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import fnmatch
+import gc
+import itertools
+
+from ctypes import c_wchar_p
+
+import pytest
+
+import com_server
+
+from filter_specs import COMDLG_FILTERSPEC, FilterMatcher, FilterSet, FilterSetCache, compile_filters, filter_set
+from simulated_shell import CLSID_FileOpenDialog, create_file_dialog
+
+FILTERS = [("Text Files", "*.txt"), ("Image Files", "*.png;*.jpg"), ("Makefiles", "Makefile")]
+
+
+def test_filter_sets_are_interned_by_content():
+    cache = FilterSetCache(maxsize=2)
+    first = cache.get(FILTERS)
+    assert cache.get([COMDLG_FILTERSPEC(name, spec) for name, spec in FILTERS]) is first
+    assert cache.get(list(FILTERS)) is first
+    assert cache.get(first) is first  # No key to build at all.
+    assert cache.get(FILTERS[:2]) is not first
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    cache.get([("A", "*.a")])
+    cache.get([("B", "*.b")])  # `first` fell out of the LRU, but is still referenced here.
+    assert cache.get(FILTERS) is first
+    assert list(first) == FILTERS
+    assert (first[2], first[:1], len(first), first.count) == (FILTERS[2], (FILTERS[0],), 3, 3)
+    assert not any(isinstance(entry, COMDLG_FILTERSPEC) for entry in first)  # The shared array is not handed out.
+
+
+def test_the_array_is_what_set_file_types_reads():
+    file_types = FilterSet(tuple(FILTERS))
+    gc.collect()  # The converted strings belong to the array, not to any temporary.
+    strings = (c_wchar_p * 6).from_address(file_types.address)  # pyright: ignore[reportArgumentType]
+    assert list(strings) == [text for entry in FILTERS for text in entry]
+    assert FilterSet(()).address is None
+
+    dialog = create_file_dialog(CLSID_FileOpenDialog, "IFileOpenDialog")
+    dialog.SetFileTypes(file_types.count, file_types.address)  # pyright: ignore[reportAttributeAccessIssue]
+    assert com_server.find_server(dialog.address).file_types == FILTERS  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    dialog.Release()
+    assert filter_set(FILTERS) is filter_set(file_types.key)
+
+
+SPECS = [
+    ("Images", "*.png;*.JPG;*.jpeg"),
+    ("Builds", "Makefile;pom.xml;*.build.xml"),
+    ("Data", "data??.csv;*~;report*.txt"),
+]
+
+
+def test_matcher_agrees_with_fnmatch():
+    matcher = compile_filters(SPECS)
+    assert (matcher.extensions, matcher.names) == ({"png", "jpg", "jpeg", "build.xml"}, {"makefile", "pom.xml"})
+    patterns = [pattern.lower() for _, spec in SPECS for pattern in spec.split(";")]
+    stems = ["", "a", "data01", "data1", "report", "Makefile", "pom", "x.build", "build", ".hidden"]
+    suffixes = ["", ".png", ".PNG", ".jpg.bak", ".xml", ".csv", "~", ".txt", ".tar.jpeg"]
+    for name in map("".join, itertools.product(stems, suffixes)):
+        expected = any(fnmatch.fnmatchcase(name.lower(), pattern) for pattern in patterns)
+        assert matcher.match(name) is expected, name
+    for specs, name in ((["*.c;a?c"], "abc"), (["*.;*~"], "foo~"), (["*.txt", "?txt"], "atxt")):
+        assert FilterMatcher(specs).match(name), (specs, name)  # A wildcard pattern whose tail equals an extension.
+    assert matcher.match_many(["/a/b/c.PNG", "/a/Makefile", "/a/Makefile.bak", "relative/data42.csv", "/a/b.txt"]) == [
+        "/a/b/c.PNG", "/a/Makefile", "relative/data42.csv",
+    ]
+
+
+def test_matchers_are_compiled_once_per_set_and_file_type():
+    file_types = filter_set([("All Files", "*.*"), *SPECS])
+    assert file_types.matcher() is compile_filters(file_types)
+    assert file_types.matcher().everything
+    images = file_types.matcher(2)
+    assert images is file_types.matcher(2)
+    assert images.match_many(["a.png", "b.txt", "c.jpeg"]) == ["a.png", "c.jpeg"]
+    with pytest.raises(IndexError):
+        file_types.matcher(len(file_types) + 1)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+
+import pytest
+
+from com_types import GUID
+from guid_registry import GUIDSymbolRegistry, describe_guid, guid_name
+
+MODULE_SOURCE = textwrap.dedent(
+    """
+    from com_types import GUID
+
+    IID_IFirst = GUID("{11111111-0000-0000-C000-000000000046}")
+    IID_ISecond = GUID("{22222222-0000-0000-C000-000000000046}")
+    CLSID_Shadowed = GUID("{33333333-0000-0000-C000-000000000046}")
+    CLSID_Shadowed = GUID("{44444444-0000-0000-C000-000000000046}")
+    IID_IAlias = GUID("{11111111-0000-0000-C000-000000000046}")
+    NOT_A_SYMBOL = GUID("{55555555-0000-0000-C000-000000000046}")
+    """
+)
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    (tmp_path / "fake_guid_module.py").write_text(MODULE_SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield GUIDSymbolRegistry(["fake_guid_module"])
+    sys.modules.pop("fake_guid_module", None)
+
+
+def test_index_is_built_lazily(registry: GUIDSymbolRegistry):
+    assert registry._index is None  # noqa: SLF001
+    with pytest.warns(RuntimeWarning):
+        assert registry.name_of("{22222222-0000-0000-C000-000000000046}") == "IID_ISecond"
+    assert registry._index is not None  # noqa: SLF001
+    assert "fake_guid_module" not in sys.modules
+
+
+def test_redefinitions_and_collisions_are_reported(registry: GUIDSymbolRegistry):
+    with pytest.warns(RuntimeWarning, match="CLSID_Shadowed redefined") as record:
+        registry.lookup(GUID("{11111111-0000-0000-C000-000000000046}"))
+    assert any("IID_IAlias" in str(warning.message) and "IID_IFirst" in str(warning.message) for warning in record)
+    assert [(first.lineno, second.lineno) for first, second in registry.redefinitions] == [(6, 7)]
+    assert [(first.name, second.name) for first, second in registry.collisions] == [("IID_IFirst", "IID_IAlias")]
+    # The shadowed value is no longer reachable under that name; the live binding is.
+    assert registry.name_of("{33333333-0000-0000-C000-000000000046}") is None
+    assert registry.name_of("{44444444-0000-0000-C000-000000000046}") == "CLSID_Shadowed"
+    assert registry.name_of("{55555555-0000-0000-C000-000000000046}") is None
+
+
+def test_describe_formats_known_and_unknown_guids(registry: GUIDSymbolRegistry):
+    with pytest.warns(RuntimeWarning):
+        assert registry.describe("{22222222-0000-0000-c000-000000000046}") == "IID_ISecond {22222222-0000-0000-C000-000000000046}"
+    assert registry.describe("{66666666-0000-0000-C000-000000000046}") == "{66666666-0000-0000-C000-000000000046}"
+
+
+def test_default_registry_covers_interfaces_constants():
+    with pytest.warns(RuntimeWarning, match="CLSID_ShellItemArrayShellNamespacehelper redefined"):
+        assert guid_name("{43826D1E-E718-42EE-BC55-A1E261C37BFE}") == "IID_IShellItem"
+    assert describe_guid(GUID("{DC1C5A9C-E88A-4dde-A5A1-60F82A20AEF7}")) == "CLSID_FileOpenDialog {DC1C5A9C-E88A-4DDE-A5A1-60F82A20AEF7}"
+
+
+def test_lazy_constant_tables_are_indexed(tmp_path, monkeypatch):
+    source = textwrap.dedent(
+        """
+        _SHADOWED: list[tuple[str, str]] = [
+            ("CLSID_Lazy", "{88888888-0000-0000-C000-000000000046}"),
+        ]
+        _GUIDS: dict[str, str] = {
+            "IID_ILazy": "{77777777-0000-0000-C000-000000000046}",
+            "CLSID_Lazy": "{99999999-0000-0000-C000-000000000046}",
+            "NOT_A_SYMBOL": "{55555555-0000-0000-C000-000000000046}",
+        }
+        """
+    )
+    (tmp_path / "fake_guid_table.py").write_text(source, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = GUIDSymbolRegistry(["fake_guid_table"])
+    with pytest.warns(RuntimeWarning, match="CLSID_Lazy redefined at fake_guid_table:7, shadowing the definition at line 3"):
+        assert registry.name_of("{77777777-0000-0000-C000-000000000046}") == "IID_ILazy"
+    assert registry.name_of("{88888888-0000-0000-C000-000000000046}") is None
+    assert registry.name_of("{99999999-0000-0000-C000-000000000046}") == "CLSID_Lazy"
+    assert registry.name_of("{55555555-0000-0000-C000-000000000046}") is None
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import itertools
+import pickle
+import subprocess
+import sys
+
+from array import array
+from pathlib import Path
+
+import pytest
+
+from allocation_testing import peak_allocated_bytes
+from hresult import (
+    HRESULT,
+    S_FALSE,
+    S_OK,
+    Cancelled,
+    HRESULTCodeTable,
+    HRESULTError,
+    NoInterface,
+    NullError,
+    Win32Error,
+    decode_hresult,
+    decode_hresults,
+    error_class_for,
+    facility_error_class,
+    hresult_message,
+    hresult_name,
+)
+from hresult_codes import HRESULT_CODES as HRESULT_CODE_ROWS
+
+E_FAIL = 0x80004005
+E_NOINTERFACE = 0x80004002
+
+
+def test_check_returns_on_success():
+    assert HRESULT.check(0) == 0
+    assert HRESULT.check(S_OK) == 0
+    assert HRESULT.check(1, ignore_s_false=True) == 1
+    assert HRESULT.check(None) == 0  # What a comtypes wrapper returns once it stripped a successful HRESULT.
+    HRESULT.raise_for_status(None)
+
+
+@pytest.mark.parametrize("status", [1, S_FALSE, E_FAIL, -2147467259, HRESULT(E_FAIL)])
+def test_check_raises_on_failure(status):
+    with pytest.raises(HRESULTError, match="CoInitialize failed!"):
+        HRESULT.check(status, "CoInitialize failed!")
+    with pytest.raises(HRESULTError):
+        HRESULT.raise_for_status(status)
+
+
+def test_check_rejects_non_integers():
+    with pytest.raises(TypeError, match="Invalid type for HRESULT"):
+        HRESULT.check("0")
+
+
+def test_equality_accepts_signed_and_unsigned_forms():
+    failure = HRESULT(E_FAIL)
+    assert failure.value == -2147467259
+    assert failure == E_FAIL
+    assert failure == -2147467259
+    assert E_FAIL == failure
+    assert failure == HRESULT(-2147467259)
+    assert failure != 0
+    assert S_OK == 0
+    assert 0 in (S_OK, S_FALSE)
+    assert S_OK != "0"
+    assert hash(HRESULT(E_FAIL)) == hash(failure)
+
+
+def test_construction_forms():
+    assert HRESULT().value == 0
+    assert HRESULT(HRESULT(5)).value == 5
+    assert HRESULT(True).value == 1
+    with pytest.raises(TypeError, match="Invalid type for HRESULT"):
+        HRESULT("5")
+
+
+def test_success_path_does_not_allocate():
+    ok = HRESULT(0)
+
+    def checks(count: int) -> None:
+        for _ in itertools.repeat(None, count):
+            HRESULT.check(0)
+            ok == 0  # noqa: B015
+            ok != S_OK  # noqa: B015
+
+    assert peak_allocated_bytes(checks, 10_000) == peak_allocated_bytes(checks, 1)
+
+
+def test_importing_does_not_load_the_code_table():
+    code = (
+        "import sys, hresult; hresult.HRESULT.check(0);"
+        " assert not any(hasattr(hresult, name) for name in ('x', '__wrapped__', '_fields', 'NoSuchError'));"
+        " print('hresult_codes' in sys.modules, hresult.HRESULT_CODES.loaded)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)  # noqa: S603
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_code_table_lookups():
+    table = HRESULTCodeTable()
+    assert not table.loaded
+    assert table.lookup(0x800704C7) == ("ERROR_CANCELLED", "The operation was canceled by the user.")
+    assert table.loaded
+    assert table.name(HRESULT(E_NOINTERFACE)) == "E_NOINTERFACE"
+    assert table.name(-2147467259) == "E_FAIL"
+    assert table.name(0x80004006) is None
+    assert hresult_name(0) == "S_OK"
+    assert hresult_message(0x8000FFFF) == "Catastrophic failure."
+
+
+def test_code_table_source_is_sorted_and_unique():
+    codes = [row[0] for row in HRESULT_CODE_ROWS]
+    assert codes == sorted(set(codes))
+    assert all(0 <= code <= 0xFFFFFFFF for code in codes)
+
+
+def test_decode_includes_name_and_message():
+    decoded = decode_hresult(HRESULT(E_NOINTERFACE))
+    assert decoded.splitlines() == [
+        "HRESULT: 0x80004002",
+        "Severity: Failure",
+        "Facility: FACILITY_NULL (0)",
+        "Code: 0x4002 (16386)",
+        "Name: E_NOINTERFACE",
+        "Message: No such interface supported.",
+    ]
+    assert decode_hresult(0x887A0001).splitlines()[2] == "Facility: FACILITY_DXGI (2170)"
+    assert decode_hresult(-2147467262) is decode_hresult(0x80004002)
+    assert HRESULT(E_NOINTERFACE).decode() == decoded
+
+
+def test_exceptions_pick_cached_per_code_and_facility_classes():
+    error = HRESULT(0x800704C7).exception("Failed to show the file dialog!")
+    assert type(error) is Cancelled
+    assert isinstance(error, (Win32Error, HRESULTError, OSError))
+    assert type(HRESULTError(0x800704C7)) is Cancelled
+    assert type(HRESULTError(E_FAIL)) is error_class_for(E_FAIL) is error_class_for(HRESULT(E_FAIL))
+    assert error_class_for(E_FAIL).__name__ == "E_FAIL"
+    assert error_class_for(E_FAIL).__bases__ == (NullError,)
+    assert type(HRESULTError(0x80071234)) is Win32Error
+    assert facility_error_class(39).__name__ == "ShellError"
+    assert facility_error_class(5000) is facility_error_class(5000)
+    with pytest.raises(NoInterface):
+        HRESULT.check(-2147467262)
+
+
+def test_exception_formats_lazily():
+    error = HRESULTError(-2147023673, "Failed to show the file dialog!")
+    assert error.args == (0x800704C7, "Failed to show the file dialog!")
+    assert (error.hresult, error.errno, error.short_desc) == (0x800704C7, 0x800704C7, "Failed to show the file dialog!")
+    assert str(error).splitlines()[0] == "Failed to show the file dialog!"
+    assert "Name: ERROR_CANCELLED" in str(error)
+    assert str(HRESULTError(E_FAIL)) == decode_hresult(E_FAIL)
+
+
+def test_exceptions_pickle_by_generated_class_name():
+    for error in (HRESULTError(0x800704C7, "desc"), HRESULTError(0x80004003), HRESULTError(0x80271234)):
+        restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+    module = sys.modules[HRESULTError.__module__]
+    assert module.E_ABORT.code == 0x80004004  # noqa: PLR2004
+    assert module.DispatchError.facility == 2  # noqa: PLR2004
+    for name in ("E_NO_SUCH_CODE", "NoSuchError", "e_abort"):
+        with pytest.raises(AttributeError):
+            getattr(module, name)
+
+
+BATCH = [0, 1, E_FAIL, 0x800704C7, 0x887A0001, 0x800704C7]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        BATCH,
+        array("i", [HRESULT(value).value for value in BATCH]),
+        array("I", BATCH),
+        array("q", BATCH),
+        array("I", BATCH).tobytes(),
+        bytearray(array("I", BATCH)),
+    ],
+)
+def test_decode_hresults_pure_python(values):
+    columns = decode_hresults(values, use_numpy=False)
+    assert list(columns.severity) == [0, 0, 1, 1, 1, 1]
+    assert list(columns.facility) == [0, 0, 0, 7, 2170, 7]
+    assert list(columns.code) == [0, 1, 0x4005, 0x04C7, 1, 0x04C7]
+    assert columns.facility_histogram == {"FACILITY_NULL": 3, "FACILITY_WIN32": 2, "FACILITY_DXGI": 1}
+
+
+def test_decode_hresults_matches_decode_hresult():
+    values = [0x80000000 | (facility << 16) | code for facility in (0, 7, 39, 4000, 0x1FFF) for code in (0, 1, 0xFFFF)]
+    columns = decode_hresults(values, use_numpy=False)
+    for value, severity, facility, code in zip(values, columns.severity, columns.facility, columns.code):
+        lines = decode_hresult(value).splitlines()
+        assert lines[1] == f"Severity: {'Failure' if severity else 'Success'}"
+        assert lines[2].endswith(f"({facility})")
+        assert lines[3] == f"Code: 0x{code:04X} ({code})"
+    assert columns.facility_histogram["Unknown Facility (4000)"] == 3
+
+
+def test_decode_hresults_rejects_partial_values():
+    with pytest.raises(ValueError, match="multiple of 4"):
+        decode_hresults(b"\x00" * 6, use_numpy=False)
+
+
+def test_decode_hresults_numpy_matches_pure_python():
+    np = pytest.importorskip("numpy")
+    expected = decode_hresults(BATCH, use_numpy=False)
+    for values in (np.array(BATCH, dtype=np.uint32), np.array(BATCH, dtype=np.int64), array("I", BATCH).tobytes()):
+        columns = decode_hresults(values, use_numpy=True)
+        assert columns.severity.tolist() == list(expected.severity)
+        assert columns.facility.tolist() == list(expected.facility)
+        assert columns.code.tolist() == list(expected.code)
+        assert columns.facility_histogram == expected.facility_histogram
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import ast
+import sys
+
+from ctypes import byref, c_uint
+from pathlib import Path
+
+import pytest
+
+import interface_compiler
+
+from interface_compiler import InterfaceSpec, compile_interfaces, load_interfaces, method, ordered, spec_hash
+from interface_specs import SHELL_INTERFACES
+from test_iunknown import FakeUnknown
+
+E_NOTIMPL = -2147467263
+
+THING_SPECS = (
+    InterfaceSpec("IThing", "{11111111-2222-3333-4444-555555555555}", "IUnknown", (method("GetCount", ("out", "POINTER(c_uint)", "pCount")),)),
+    InterfaceSpec("IBigThing", "{11111111-2222-3333-4444-666666666666}", "IThing", (method("Clone", ("out", "POINTER(POINTER(IBigThing))", "ppThing")),)),
+)
+
+
+@pytest.fixture(autouse=True)
+def forget_loaded_bindings():
+    yield
+    for name in [name for name in sys.modules if name.startswith("_interfaces_")]:
+        del sys.modules[name]
+
+
+def test_raw_backend_builds_working_bindings(tmp_path: Path):
+    bindings = load_interfaces(SHELL_INTERFACES, "raw", tmp_path)
+    dispatch = bindings.IFileOpenDialog._dispatch_
+    assert (dispatch["QueryInterface"].slot, dispatch["Show"].slot, dispatch["SetFilter"].slot, dispatch["GetResults"].slot) == (0, 3, 26, 27)
+    assert issubclass(bindings.IFileOpenDialog, bindings.IFileDialog)
+
+    def get_count(this, count):  # noqa: ARG001
+        count[0] = 3
+        return 0
+
+    not_implemented = (lambda *args: E_NOTIMPL,) * 4  # BindToHandler .. GetAttributes.
+    items = FakeUnknown(bindings.IShellItemArrayVTable, extra=(*not_implemented, get_count)).attach(bindings.IShellItemArray)
+    count = c_uint()
+    assert items.call("GetCount", byref(count)) == 0
+    assert count.value == 3
+    assert items.call("GetAttributes", 0, 0, None) == E_NOTIMPL
+
+
+def test_only_the_raw_backend_is_generated(tmp_path: Path):
+    with pytest.raises(ValueError, match="Unknown backend"):
+        compile_interfaces(SHELL_INTERFACES, "comtypes")  # interfaces.py defines those by hand.
+    with pytest.raises(ValueError, match="Unknown backend"):
+        load_interfaces(SHELL_INTERFACES, "comtypes", tmp_path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_compiled_modules_are_cached_by_spec_hash(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    first = load_interfaces(THING_SPECS, "raw", tmp_path)
+    cached = tmp_path / f"_interfaces_raw_{spec_hash(THING_SPECS, 'raw')}.py"
+    assert Path(first.__file__) == cached
+    assert load_interfaces(THING_SPECS, "raw", tmp_path) is first
+
+    def refuse(*args):
+        raise AssertionError("cached bindings were recompiled")
+
+    del sys.modules[first.__name__]
+    monkeypatch.setattr(interface_compiler, "compile_interfaces", refuse)
+    again = load_interfaces(THING_SPECS, "raw", tmp_path)
+    assert again is not first
+    assert again.IBigThing._dispatch_["Clone"].slot == 4
+
+    changed = (*THING_SPECS[:1], THING_SPECS[1]._replace(iid="{11111111-2222-3333-4444-777777777777}"))
+    assert spec_hash(changed, "raw") != spec_hash(THING_SPECS, "raw")
+    with pytest.raises(AssertionError, match="recompiled"):
+        load_interfaces(changed, "raw", tmp_path)
+
+
+def test_unwritable_cache_falls_back_to_uncached_bindings(tmp_path: Path):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("", encoding="utf-8")
+    bindings = load_interfaces(THING_SPECS, "raw", not_a_directory)
+    assert bindings.IThing._dispatch_["GetCount"].slot == 3
+    assert getattr(bindings, "__file__", None) is None
+
+
+@pytest.mark.parametrize(
+    ("specs", "error"),
+    [
+        ((THING_SPECS[0], THING_SPECS[0]), "defined more than once"),
+        ((THING_SPECS[1],), "unknown interface IThing"),
+        ((THING_SPECS[0]._replace(methods=(method("GetCount", ("out", "POINTER(SIZE_T)", "pCount")),)),), r"unknown names \['SIZE_T'\]"),
+        ((THING_SPECS[0]._replace(methods=(method("GetCount", ("inout", "c_uint", "pCount")),)),), "must be 'in' or 'out'"),
+        ((THING_SPECS[0]._replace(methods=(method("GetCount", ("in", "c_uint[4]", "pCount")),)),), "only use names and calls"),
+        ((THING_SPECS[0]._replace(parent="IBigThing"), THING_SPECS[1]), "cyclic parent chain"),
+        ((THING_SPECS[0]._replace(iid="not a guid"),), "malformed IID"),
+    ],
+)
+def test_invalid_specs_are_rejected(specs, error):
+    with pytest.raises(ValueError, match=error):
+        compile_interfaces(specs, "raw")
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        compile_interfaces(THING_SPECS, "pywin32")
+
+
+def _hand_written_interfaces() -> dict[str, tuple[str, str, list[tuple[str, list[tuple[str, str, str]]]]]]:
+    """(parent, IID, [(method, [(direction, type, name), ...]), ...]) per interface written out in interfaces.py."""
+    tree = ast.parse(Path(__file__).with_name("interfaces.py").read_text(encoding="utf-8"))
+    guids = next(node.value for node in tree.body if isinstance(node, ast.AnnAssign) and ast.unparse(node.target) == "_GUIDS")
+    guid_strings = {key.value: value.value for key, value in zip(guids.keys, guids.values)}  # pyright: ignore[reportAttributeAccessIssue]
+    interfaces: dict[str, list] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name.startswith("I") and node.name != "IUnknown":
+            iid = next(statement.value.args[0].value for statement in node.body if isinstance(statement, ast.AnnAssign) and ast.unparse(statement.target) == "_iid_")  # _guid("IID_...")  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+            interfaces.setdefault(node.name, [None, None, None])[:2] = [ast.unparse(node.bases[0]).replace("comtypes.", ""), guid_strings[iid]]
+        assigned = [node.target] if isinstance(node, ast.AnnAssign) else node.targets if isinstance(node, ast.Assign) else []
+        for target in assigned:
+            if ast.unparse(target).endswith("_methods_") and getattr(node, "value", None) is not None:
+                owner = target.value.id if isinstance(target, ast.Attribute) else next(
+                    klass.name for klass in ast.walk(tree) if isinstance(klass, ast.ClassDef) and node in klass.body
+                )
+                interfaces.setdefault(owner, [None, None, None])[2] = node.value
+    result = {}
+    for name, (parent, iid, methods) in interfaces.items():
+        if parent is None:  # IUnknown, whose methods comtypes defines.
+            continue
+        entries = []
+        for call in methods.elts:
+            params = [(p.elts[0].elts[0].value, ast.unparse(p.elts[1]).replace("C_POINTER", "POINTER"), p.elts[2].value) for p in call.args[3:]]
+            entries.append((call.args[2].value, params))
+        result[name] = (parent, iid, entries)
+    return result
+
+
+def test_specs_match_the_hand_written_comtypes_interfaces():
+    hand_written = _hand_written_interfaces()
+    assert sorted(spec.name for spec in SHELL_INTERFACES) == sorted(hand_written)
+    for spec in ordered(SHELL_INTERFACES):
+        entries = [(entry.name, [tuple(param) for param in entry.params]) for entry in spec.methods]
+        assert (spec.parent, spec.iid, entries) == hand_written[spec.name], spec.name
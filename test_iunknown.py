@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+
+from ctypes import Structure, addressof, cast, pointer
+
+import pytest
+
+from com_types import GUID
+from hresult import NoInterface
+from iunknown import ULONG, AtomicRefCount, COMBase, IID_IUnknown, IUnknown, IUnknownVTable, LockedRefCount, RefCounted
+
+E_NOINTERFACE = -2147467262  # As a signed LONG, the way a callback returns it.
+
+
+def vtable_fields(vtable_type: type) -> list[tuple]:
+    """All slots of `vtable_type`, including those of the vtable Structures it extends."""
+    return [field for klass in reversed(vtable_type.__mro__) for field in klass.__dict__.get("_fields_", ())]
+
+
+class FakeUnknown:
+    """An IUnknown whose vtable slots are Python callbacks (CFUNCTYPE outside Windows)."""
+
+    def __init__(self, vtable_type: type = IUnknownVTable, extra: tuple = ()):
+        self.refcount = 1
+        prototypes = [field[1] for field in vtable_fields(vtable_type)]
+        self.callbacks = [prototypes[0](self.QueryInterface), prototypes[1](self.AddRef), prototypes[2](self.Release)]
+        self.callbacks += [prototype(func) for prototype, func in zip(prototypes[3:], extra)]
+        self.vtable = vtable_type(*self.callbacks)
+
+    def attach(self, interface: type[IUnknown]) -> IUnknown:
+        instance = interface()
+        vtable_pointer_type = dict(interface._fields_)["lpVtbl"]  # pyright: ignore[reportAttributeAccessIssue]
+        instance.lpVtbl = cast(pointer(self.vtable), vtable_pointer_type)  # pyright: ignore[reportAttributeAccessIssue]
+        return instance
+
+    def QueryInterface(self, this, riid, ppv):  # noqa: N802
+        if riid.contents != IID_IUnknown:
+            return E_NOINTERFACE
+        ppv[0] = this
+        self.refcount += 1
+        return 0
+
+    def AddRef(self, this):  # noqa: N802, ARG002
+        self.refcount += 1
+        return self.refcount
+
+    def Release(self, this):  # noqa: N802, ARG002
+        self.refcount -= 1
+        return self.refcount
+
+
+def test_dispatch_table_is_built_once_per_class():
+    assert [(name, method.slot) for name, method in IUnknown._dispatch_.items()] == [("QueryInterface", 0), ("AddRef", 1), ("Release", 2)]
+    assert COMBase._dispatch_ == {}
+
+
+def test_calls_go_through_the_fake_vtable():
+    fake = FakeUnknown()
+    unknown = fake.attach(IUnknown)
+    assert unknown.add_ref() == 2
+    assert unknown.add_ref() == 3
+    assert unknown.release() == 2
+    # The prototype is bound once per implementation address, then reused.
+    assert len(IUnknown._dispatch_["AddRef"].bound) >= 1
+    bound = dict(IUnknown._dispatch_["AddRef"].bound)
+    unknown.add_ref()
+    assert IUnknown._dispatch_["AddRef"].bound == bound
+
+
+def test_query_interface():
+    fake = FakeUnknown()
+    unknown = fake.attach(IUnknown)
+    result = unknown.query_interface(IID_IUnknown)
+    assert addressof(result.contents) == addressof(unknown)
+    assert fake.refcount == 2
+    with pytest.raises(NoInterface):
+        unknown.query_interface(GUID("{43826D1E-E718-42EE-BC55-A1E261C37BFE}"))
+
+
+def test_subclasses_extend_the_inherited_vtable():
+    class IThing(IUnknown):
+        _methods_ = [("GetCount", (ULONG,))]
+
+    class IThingVTable(Structure):
+        _fields_ = [*IUnknownVTable._fields_, ("GetCount", IUnknownVTable._fields_[1][1])]
+
+    assert IThing._dispatch_["GetCount"].slot == 3
+    assert IThing._dispatch_["AddRef"] is IUnknown._dispatch_["AddRef"]
+    fake = FakeUnknown(IThingVTable, extra=(lambda this: 42,))
+    thing = fake.attach(IThing)
+    assert thing.call("GetCount") == 42
+    assert thing.add_ref() == 2
+
+
+def test_unknown_methods_and_null_vtables_are_rejected():
+    unknown = FakeUnknown().attach(IUnknown)
+    with pytest.raises(AttributeError, match="Method 'Frobnicate' not found"):
+        unknown.call("Frobnicate")
+    with pytest.raises(ValueError, match="NULL vtable"):
+        IUnknown().add_ref()
+
+
+@pytest.mark.parametrize("refcount_type", [AtomicRefCount, LockedRefCount])
+def test_refcount_calls_on_zero_once(refcount_type: type[AtomicRefCount | LockedRefCount]):
+    zeroes: list[int] = []
+    refcount = refcount_type(lambda: zeroes.append(refcount.count))
+    assert refcount.add_ref() == 2  # noqa: PLR2004
+    assert refcount.release() == 1
+    assert zeroes == []
+    assert refcount.release() == 0
+    assert zeroes == [0]
+    with pytest.raises(ValueError, match="after the last reference"):
+        refcount.release()
+    assert zeroes == [0]
+
+
+@pytest.mark.parametrize("refcount_type", [AtomicRefCount, LockedRefCount])
+def test_refcount_survives_concurrent_add_ref_release(refcount_type: type[AtomicRefCount | LockedRefCount]):
+    zeroes: list[int] = []
+    refcount = refcount_type(lambda: zeroes.append(1))
+    threads_count, pairs = 8, 2_000
+    for _ in range(threads_count):
+        refcount.add_ref()  # Each thread's own reference, handed over before it starts.
+    start = threading.Barrier(threads_count)
+
+    def worker():
+        start.wait()
+        for _ in range(pairs):
+            refcount.add_ref()
+            refcount.release()
+        refcount.release()
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert refcount.count == 1
+    assert zeroes == []
+    refcount.release()
+    assert zeroes == [1]
+
+
+def test_ref_counted_objects_are_destroyed_on_the_last_release():
+    class Sink(RefCounted):
+        def __init__(self):
+            super().__init__()
+            self.released = 0
+
+        def final_release(self):
+            self.released += 1
+
+    sink = Sink()
+    sink_ref = weakref.ref(sink)
+    released = sink.released
+    del sink
+    gc.collect()
+    sink = sink_ref()
+    assert sink is not None  # Kept alive by its creator's reference, not by a Python name.
+    assert sink.AddRef() == 2  # noqa: PLR2004
+    assert sink.Release() == 1
+    assert sink.Release() == 0
+    assert sink.released == released + 1
+    del sink
+    assert sink_ref() is None  # Freed right away: no reference cycle left for the collector.
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from com_types import GUID
+from progid import ProgIDResolver, TableProgIDBackend, get_progid_resolver, set_progid_resolver
+
+SHELL_APPLICATION = "{13709620-C279-11CE-A49E-444553540000}"
+FILE_OPEN_DIALOG = "{DC1C5A9C-E88A-4DDE-A5A1-60F82A20AEF7}"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def backend() -> TableProgIDBackend:
+    return TableProgIDBackend({"Shell.Application": SHELL_APPLICATION, "Shell.FileOpenDialog": GUID(FILE_OPEN_DIALOG)})
+
+
+@pytest.fixture
+def installed(backend: TableProgIDBackend):
+    resolver = ProgIDResolver(backend)
+    set_progid_resolver(resolver)
+    yield resolver
+    set_progid_resolver(None)
+
+
+def test_lookups_are_cached_and_case_insensitive(backend: TableProgIDBackend):
+    resolver = ProgIDResolver(backend)
+    assert resolver.clsid("Shell.Application") is GUID(SHELL_APPLICATION)
+    assert resolver.clsid("shell.application") is GUID(SHELL_APPLICATION)
+    assert resolver.progid(GUID(SHELL_APPLICATION)) == "Shell.Application"
+    assert resolver.progid(GUID(SHELL_APPLICATION)) == "Shell.Application"
+    assert backend.lookups == 2
+    stats = resolver.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+
+
+def test_failures_are_not_cached(backend: TableProgIDBackend):
+    resolver = ProgIDResolver(backend)
+    for _ in range(2):
+        with pytest.raises(OSError, match="Invalid class string"):
+            resolver.clsid("No.Such.Class")
+    assert backend.lookups == 2
+    assert resolver.stats()["size"] == 0
+
+
+def test_entries_expire_after_ttl(backend: TableProgIDBackend):
+    clock = FakeClock()
+    resolver = ProgIDResolver(backend, ttl=10.0, clock=clock)
+    resolver.clsid("Shell.Application")
+    clock.now = 9.9
+    resolver.clsid("Shell.Application")
+    assert backend.lookups == 1
+    clock.now = 10.0
+    resolver.clsid("Shell.Application")
+    assert backend.lookups == 2
+    assert resolver.stats()["expirations"] == 1
+
+
+def test_lru_evicts_least_recently_used(backend: TableProgIDBackend):
+    resolver = ProgIDResolver(backend, maxsize=1)
+    resolver.clsid("Shell.Application")
+    resolver.clsid("Shell.FileOpenDialog")
+    resolver.clsid("Shell.FileOpenDialog")
+    assert backend.lookups == 2
+    resolver.clsid("Shell.Application")
+    assert backend.lookups == 3
+    assert resolver.stats()["evictions"] == 2
+    with pytest.raises(ValueError, match="maxsize"):
+        ProgIDResolver(backend, maxsize=0)
+
+
+def test_guid_progid_methods_go_through_the_installed_resolver(installed: ProgIDResolver, backend: TableProgIDBackend):
+    assert get_progid_resolver() is installed
+    assert GUID.from_progid("Shell.FileOpenDialog") is GUID(FILE_OPEN_DIALOG)
+    assert GUID.from_progid(FILE_OPEN_DIALOG) is GUID(FILE_OPEN_DIALOG)
+    assert GUID(SHELL_APPLICATION).as_progid() == "Shell.Application"
+    installed.clear()
+    assert GUID(SHELL_APPLICATION).as_progid() == "Shell.Application"
+    assert backend.lookups == 3
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from ctypes import addressof, c_wchar_p
+from pathlib import Path
+
+import pytest
+
+import com_server
+import simulated_shell
+import vtable_backend
+
+from com_server import COMServer
+from cotaskmem import TrackingTaskAllocator, set_task_allocator
+from hresult import HRESULTError
+from simulated_shell import (
+    CLSID_FileOpenDialog,
+    CLSID_FileSaveDialog,
+    FOS_ALLOWMULTISELECT,
+    FOS_FILEMUSTEXIST,
+    FOS_FORCESHOWHIDDEN,
+    FOS_OVERWRITEPROMPT,
+    SFGAO_FILESYSTEM,
+    SFGAO_FOLDER,
+    SIGDN_FILESYSPATH,
+    SIGDN_NORMALDISPLAY,
+    accept,
+    create_file_dialog,
+    create_shell_item,
+    select,
+    select_all,
+)
+
+
+@pytest.fixture
+def allocator():
+    tracking = TrackingTaskAllocator()
+    set_task_allocator(tracking)
+    yield tracking
+    set_task_allocator(None)
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for name in ("b.txt", "a.TXT", "c.md", ".hidden.txt"):
+        (tmp_path / name).write_text(name)
+    (tmp_path / "sub").mkdir()
+    return tmp_path
+
+
+def open_dialog(folder, script, options: int = FOS_FILEMUSTEXIST | FOS_ALLOWMULTISELECT):
+    dialog = create_file_dialog(CLSID_FileOpenDialog, "IFileOpenDialog", script)
+    shell_folder = create_shell_item(folder)
+    dialog.SetFolder(shell_folder)  # pyright: ignore[reportAttributeAccessIssue]
+    shell_folder.Release()
+    dialog.SetOptions(options)  # pyright: ignore[reportAttributeAccessIssue]
+    return dialog
+
+
+def results(dialog) -> list[tuple[str, int, str]]:
+    """What windialogs.getFileOpenDialogResults does with a dialog, through the same raw calls."""
+    found = []
+    array = dialog.GetResults()
+    for index in range(array.GetCount()):
+        item = array.GetItemAt(index)
+        with item.GetDisplayName(SIGDN_FILESYSPATH) as path:
+            attributes = item.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
+            unknown = item.GetParent()  # Declared as an IUnknown out-parameter.
+            parent = unknown.QueryInterface("IShellItem")
+            unknown.Release()
+            with parent.GetDisplayName(SIGDN_NORMALDISPLAY) as parent_name:
+                found.append((str(path), attributes, str(parent_name)))
+            parent.Release()
+        item.Release()
+    array.Release()
+    return found
+
+
+def test_open_dialog_results_go_through_the_raw_calls(folder, allocator: TrackingTaskAllocator):
+    servers = len(com_server._servers)  # noqa: SLF001
+    dialog = open_dialog(folder, select("a.TXT", folder / "sub"), FOS_ALLOWMULTISELECT)
+    dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    assert results(dialog) == [
+        (str(folder / "a.TXT"), SFGAO_FILESYSTEM, folder.name),
+        (str(folder / "sub"), SFGAO_FILESYSTEM | SFGAO_FOLDER, folder.name),
+    ]
+    assert dialog.Release() == 0
+    assert len(com_server._servers) == servers  # noqa: SLF001  # Every item, array and the dialog itself were destroyed.
+    assert (allocator.allocations, allocator.live) == (4, {})
+
+
+def test_cancel_and_validation(folder):
+    dialog = open_dialog(folder, None)
+    with pytest.raises(HRESULTError) as cancelled:
+        dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    assert cancelled.value.hresult == simulated_shell.ERROR_CANCELLED
+    with pytest.raises(HRESULTError):
+        dialog.GetResults()  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.Release()
+
+    dialog = open_dialog(folder, select("missing.txt"))
+    with pytest.raises(HRESULTError) as missing:
+        dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    assert missing.value.hresult == simulated_shell.ERROR_FILE_NOT_FOUND
+    dialog.Release()
+
+
+class ExcludeB(COMServer):
+    _com_interfaces_ = [vtable_backend.bindings().IShellItemFilter]
+
+    def IncludeItem(self, psi):  # noqa: N802
+        return simulated_shell.S_FALSE if simulated_shell._path_of(psi).endswith("b.txt") else 0  # noqa: SLF001
+
+
+def test_listing_applies_file_types_hidden_items_and_the_item_filter(folder):
+    dialog = open_dialog(folder, select_all)
+    file_types = (c_wchar_p * 4)("Text Files", "*.txt", "All Files", "*.*")
+    dialog.SetFileTypes(2, addressof(file_types))  # pyright: ignore[reportAttributeAccessIssue]
+    server = com_server.find_server(dialog.address)
+    assert server.file_types == [("Text Files", "*.txt"), ("All Files", "*.*")]  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    assert [entry.name for entry in server.listing()] == ["a.TXT", "b.txt", "sub"]  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+    dialog.SetFileTypeIndex(2)  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.SetOptions(FOS_ALLOWMULTISELECT | FOS_FORCESHOWHIDDEN)  # pyright: ignore[reportAttributeAccessIssue]
+    assert [entry.name for entry in server.listing()] == [".hidden.txt", "a.TXT", "b.txt", "c.md", "sub"]  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+
+    item_filter = ExcludeB()
+    dialog.SetFilter(item_filter.com_pointer())  # pyright: ignore[reportAttributeAccessIssue]
+    item_filter.Release()  # The dialog holds its own reference.
+    dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    assert [os.path.basename(path) for path, _, _ in results(dialog)] == [".hidden.txt", "a.TXT", "c.md", "sub"]
+
+    array = dialog.GetResults()  # pyright: ignore[reportAttributeAccessIssue]
+    unknown = array.EnumItems()  # Declared as an IUnknown out-parameter.
+    enum = unknown.QueryInterface("IEnumShellItems")
+    unknown.Release()
+    array.Release()  # The enumerator keeps it alive.
+    enum.Skip(1)
+    item, fetched = enum.Next(1)
+    clone = enum.Clone()
+    cloned, _ = clone.Next(1)
+    with item.GetDisplayName(SIGDN_NORMALDISPLAY) as name, cloned.GetDisplayName(SIGDN_NORMALDISPLAY) as cloned_name:
+        assert (str(name), fetched, str(cloned_name)) == ("a.TXT", 1, "c.md")
+    for reference in (item, cloned, clone):
+        reference.Release()
+    enum.Reset()
+    assert enum.Skip(10) == simulated_shell.S_FALSE
+    assert enum.Release() == 0
+    assert dialog.Release() == 0
+    assert item_filter._refcount.count == 0  # noqa: SLF001  # Released by the dialog's destruction.
+
+
+class RefuseOverwrite(COMServer):
+    _com_interfaces_ = [vtable_backend.bindings().IFileDialogEvents]
+
+    def __init__(self):
+        super().__init__()
+        self.events: list[str] = []
+
+    def OnOverwrite(self, pfd, psi, pResponse):  # noqa: N802, N803
+        self.events.append(f"OnOverwrite({os.path.basename(simulated_shell._path_of(psi))})")  # noqa: SLF001
+        pResponse[0] = simulated_shell.FDEOR_REFUSE
+
+    def OnFileOk(self, pfd):  # noqa: N802
+        self.events.append("OnFileOk")
+
+
+def test_save_dialog(folder):
+    dialog = create_file_dialog(CLSID_FileSaveDialog, "IFileSaveDialog", accept)
+    shell_folder = create_shell_item(folder)
+    dialog.SetFolder(shell_folder)  # pyright: ignore[reportAttributeAccessIssue]
+    shell_folder.Release()
+    dialog.SetDefaultExtension(".txt")  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.SetFileName("new")  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    result = dialog.GetResult()  # pyright: ignore[reportAttributeAccessIssue]
+    with result.GetDisplayName(SIGDN_FILESYSPATH) as path:
+        assert str(path) == str(folder / "new.txt")
+    result.Release()
+
+    events = RefuseOverwrite()
+    cookie = dialog.Advise(events.com_pointer())  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.SetFileName("b")  # pyright: ignore[reportAttributeAccessIssue]
+    assert dialog.GetOptions() & FOS_OVERWRITEPROMPT  # pyright: ignore[reportAttributeAccessIssue]
+    with pytest.raises(HRESULTError):
+        dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    assert events.events == ["OnOverwrite(b.txt)"]
+    dialog.Unadvise(cookie)  # pyright: ignore[reportAttributeAccessIssue]
+    dialog.Show(None)  # pyright: ignore[reportAttributeAccessIssue]
+    with dialog.GetFileName() as name:  # pyright: ignore[reportAttributeAccessIssue]
+        assert str(name) == "b"
+    assert dialog.Release() == 0
+    assert events.Release() == 0
+
+
+@pytest.fixture
+def windialogs_simulated():
+    windialogs = pytest.importorskip("windialogs")
+    backend = windialogs.dialog_backend
+    windialogs.set_dialog_backend("simulated")
+    servers = len(com_server._servers)  # noqa: SLF001
+    yield windialogs
+    simulated_shell.set_dialog_script(None)
+    windialogs.set_dialog_backend(backend)
+    assert len(com_server._servers) == servers  # noqa: SLF001  # Every dialog, item and events handler was destroyed.
+
+
+def test_windialogs_browse_and_save_on_the_simulated_backend(folder, windialogs_simulated, allocator: TrackingTaskAllocator):
+    simulated_shell.set_dialog_script(select("a.TXT", "c.md"))
+    assert windialogs_simulated.browse_files(default_folder=str(folder), allow_multiple=True) == [str(folder / "a.TXT"), str(folder / "c.md")]
+    simulated_shell.set_dialog_script(accept)
+    assert windialogs_simulated.save_file(default_folder=str(folder), default_file_name="b.txt") == str(folder / "b.txt")
+    assert allocator.live == {}
+
+
+def test_windialogs_failed_and_cancelled_dialogs_return_nothing(folder, windialogs_simulated, capsys):
+    simulated_shell.set_dialog_script(select("missing.txt"))  # Fails Show with ERROR_FILE_NOT_FOUND: not a cancellation.
+    assert windialogs_simulated.browse_files(default_folder=str(folder)) == []
+    assert "Failed to show the file dialog" in capsys.readouterr().out
+    simulated_shell.set_dialog_script(accept)
+    assert windialogs_simulated.save_file(default_folder=str(folder), default_file_name="new.txt") == ""  # FOS_FILEMUSTEXIST
+    assert "Failed to show the file dialog" in capsys.readouterr().out
+    simulated_shell.set_dialog_script(None)
+    assert windialogs_simulated.browse_folders(default_folder=str(folder)) == []
+    assert "Failed" not in capsys.readouterr().out
+
+
+def test_windialogs_results_and_events_on_the_simulated_backend(folder, windialogs_simulated, capsys):
+    windialogs = windialogs_simulated
+    dialog = windialogs.createFileDialog(CLSID_FileOpenDialog, "IFileOpenDialog")
+    try:
+        file_types = windialogs.configureFileDialog(None, dialog, [("Text Files", "*.txt")], folder, FOS_FILEMUSTEXIST)  # noqa: F841  # Held until the dialog is done.
+        assert com_server.find_server(dialog.address).file_types == [("Text Files", "*.txt")]  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess]
+        cookie = windialogs.setupFileDialogEvents(dialog)
+        simulated_shell.set_dialog_script(select("b.txt"))
+        assert windialogs.showDialog(dialog, None)
+        dialog.Unadvise(cookie)  # pyright: ignore[reportAttributeAccessIssue]
+        assert windialogs.getFileOpenDialogResults(None, dialog) == [str(folder / "b.txt")]
+    finally:
+        windialogs.releaseRaw(dialog)
+    printed = capsys.readouterr().out
+    assert f"OnSelectionChange, selected item: {folder / 'b.txt'}" in printed
+    assert f"OnFileOk, selected '{folder / 'b.txt'}'" in printed
+
+
+def test_importing_windialogs_loads_no_backend():
+    pytest.importorskip("windialogs")
+    code = "import sys, windialogs; print(*(name in sys.modules for name in ('comtypes', 'vtable_backend', 'simulated_shell')))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parent)  # noqa: S603
+    assert result.stdout.split() == ["False", "False", "False"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from ctypes import POINTER, addressof, byref, c_ulong, c_void_p, cast
+
+import pytest
+
+import vtable_backend
+
+from cotaskmem import get_task_allocator
+from hresult import HRESULTError
+from test_iunknown import FakeUnknown, vtable_fields
+from vtable_backend import RawInterface, raw_interfaces
+
+E_NOTIMPL = -2147467263
+SFGAO_FOLDER = 0x20000000
+
+
+def fake(interface: str, **implementations) -> tuple[FakeUnknown, RawInterface]:
+    """A fake object whose `interface` methods are `implementations` by name, E_NOTIMPL for the rest."""
+    bindings = vtable_backend.bindings()
+    vtable_type = getattr(bindings, f"{interface}VTable")
+    names = [field[0] for field in vtable_fields(vtable_type)][3:]
+    unknown = FakeUnknown(vtable_type, extra=tuple(implementations.get(name, lambda *args: E_NOTIMPL) for name in names))
+    instance = unknown.attach(getattr(bindings, interface))
+    unknown.instance = instance  # pyright: ignore[reportAttributeAccessIssue]  # Keeps the object's memory alive.
+    return unknown, raw_interfaces()[interface].from_address(addressof(instance))
+
+
+def fake_item(path: str, attributes: int = 0) -> tuple[FakeUnknown, RawInterface]:
+    def get_display_name(this, sigdn, ppsz):  # noqa: ARG001
+        cast(ppsz, POINTER(c_void_p))[0] = get_task_allocator().alloc_string(path)  # The caller frees it.
+        return 0
+
+    def get_attributes(this, mask, attribs):  # noqa: ARG001
+        attribs[0] = attributes & mask
+        return 0
+
+    return fake("IShellItem", GetDisplayName=get_display_name, GetAttributes=get_attributes)
+
+
+def test_wrappers_follow_the_comtypes_calling_convention():
+    fakes = [fake_item(f"/home/user/file{i}.txt", SFGAO_FOLDER * (i % 2)) for i in range(3)]
+
+    def get_count(this, count):  # noqa: ARG001
+        count[0] = len(fakes)
+        return 0
+
+    def get_item_at(this, index, ppsi):  # noqa: ARG001
+        c_void_p.from_address(ppsi).value = fakes[index][1].address
+        return 0
+
+    _, items = fake("IShellItemArray", GetCount=get_count, GetItemAt=get_item_at)
+    assert items.GetCount() == 3  # pyright: ignore[reportAttributeAccessIssue]
+    item = items.GetItemAt(1)  # pyright: ignore[reportAttributeAccessIssue]
+    assert isinstance(item, raw_interfaces()["IShellItem"])
+    with item.GetDisplayName(0x80058000) as name:
+        assert str(name) == "/home/user/file1.txt"
+    assert item.GetAttributes(SFGAO_FOLDER | 0x40000000) == SFGAO_FOLDER
+    assert item.Release() == 0
+    assert fakes[1][0].refcount == 0
+
+
+def test_interface_arguments_are_passed_by_address():
+    folders: list[int] = []
+
+    def set_folder(this, psi):  # noqa: ARG001
+        folders.append(psi)
+        return 0
+
+    _, dialog = fake("IFileOpenDialog", SetFolder=set_folder)
+    _, item = fake_item("/home/user")
+    assert dialog.SetFolder(item) == 0  # pyright: ignore[reportAttributeAccessIssue]  # No out parameters: the HRESULT.
+    assert folders == [item.address]
+
+
+def test_out_parameters_between_in_parameters():
+    calls: list[tuple] = []
+
+    def parse_display_name(this, hwnd, pbc, name, eaten, pidl, attributes):  # noqa: ARG001, PLR0913
+        calls.append((hwnd, name, attributes[0]))
+        eaten[0] = 4
+        pidl[0] = 0x1234
+        return 0
+
+    _, folder = fake("IShellFolder", ParseDisplayName=parse_display_name)
+    assert folder.ParseDisplayName(None, None, "file", byref(c_ulong(7))) == (4, 0x1234)  # pyright: ignore[reportAttributeAccessIssue]
+    assert calls == [(None, "file", 7)]
+
+
+def test_failures_raise():
+    _, items = fake("IShellItemArray")
+    with pytest.raises(HRESULTError, match=r"IShellItemArray\.GetCount failed"):
+        items.GetCount()  # pyright: ignore[reportAttributeAccessIssue]
+    with pytest.raises(TypeError, match="takes 1 arguments"):
+        items.GetItemAt()  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_query_interface():
+    unknown, item = fake_item("/home/user")
+    other = item.QueryInterface("IUnknown")
+    assert type(other) is raw_interfaces()["IUnknown"]
+    assert other.address == item.address
+    assert unknown.refcount == 2
+    with pytest.raises(HRESULTError):
+        item.QueryInterface("IShellItemArray")
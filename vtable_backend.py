@@ -0,0 +1,228 @@
+"""Drive the shell interfaces through direct vtable calls, without comtypes.
+
+interface_compiler's raw backend turns interface_specs.SHELL_INTERFACES into iunknown.COMBase bindings with
+precomputed prototypes. RawInterface wraps one such interface pointer and gives it comtypes' calling convention, so the
+windialogs functions run unchanged on either backend: in-parameters are passed positionally, out-parameters are
+allocated by the wrapper and returned (one value, or a tuple of several), and a failed HRESULT raises HRESULTError.
+What a parameter needs is worked out once per method when the wrappers are built, not on every call:
+  - interface pointers out: wrapped in the RawInterface subclass of their interface (None for NULL),
+  - LPWSTR out: a cotaskmem.CoTaskMemString, which owns (and frees) the callee's buffer,
+  - any other POINTER(T) out: T().value,
+  - interface pointers in: a RawInterface is passed as its address.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from ctypes import POINTER, addressof, byref, c_long, c_ulong, c_void_p, c_wchar_p
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
+
+import com_refcount
+
+from com_types import GUID
+from cotaskmem import CoTaskMemString
+from hresult import HRESULT
+from interface_compiler import ROOT_INTERFACE, load_interfaces, ordered, type_names
+from interface_specs import SHELL_INTERFACES
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from interface_compiler import InterfaceSpec, Method
+    from iunknown import COMBase
+
+try:
+    from ctypes import WINFUNCTYPE, windll
+except ImportError:  # Not on Windows: only fake vtables (tests, benchmarks).
+    windll = None
+
+CLSCTX_INPROC_SERVER = 0x1
+
+# Private prototypes: setting argtypes on windll.ole32.CoCreateInstance would change them for every other caller in
+# the process (comtypes passes POINTER(POINTER(interface)) out-parameters). The c_long results stay plain ints.
+if windll is not None:
+    _CoCreateInstance = WINFUNCTYPE(c_long, POINTER(GUID), c_void_p, c_ulong, POINTER(GUID), POINTER(c_void_p))(("CoCreateInstance", windll.ole32))
+    _SHCreateItemFromParsingName = WINFUNCTYPE(c_long, c_wchar_p, c_void_p, POINTER(GUID), POINTER(c_void_p))(("SHCreateItemFromParsingName", windll.shell32))
+
+
+class RawInterface:
+    """A COM interface pointer called through its vtable. Subclasses per interface are built by raw_interfaces()."""
+
+    __slots__ = ("_com",)
+
+    _interface_: ClassVar[str] = ROOT_INTERFACE
+    _binding_: ClassVar[type[COMBase]]
+
+    def __init__(self, com: COMBase):
+        self._com: COMBase = com
+
+    @classmethod
+    def from_address(cls, address: int) -> RawInterface:
+        """Wrap the interface pointer `address` (a pointer to the object, whose first field is its vtable pointer)."""
+        return cls(cls._binding_.from_address(address))
+
+    @property
+    def address(self) -> int:
+        return addressof(self._com)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} at {self.address:#x}>"
+
+    def QueryInterface(self, interface: type | str) -> RawInterface:  # noqa: N802
+        """`interface` is an interface name or any class named after one, e.g. a comtypes interface."""
+        name = interface if isinstance(interface, str) else interface.__name__
+        target = raw_interfaces()[name]
+        result = c_void_p()
+        HRESULT.check(self._com.call("QueryInterface", byref(target._binding_._iid_), byref(result)), f"QueryInterface({name}) failed")
+        return _acquire(target, result.value)  # pyright: ignore[reportReturnType]
+
+    def AddRef(self) -> int:  # noqa: N802
+        refcount = self._com.call("AddRef")
+        tracker = com_refcount._refcount_tracker  # noqa: SLF001  # None unless enabled with set_refcount_tracker().
+        if tracker is not None:
+            tracker.added(self.address, self._interface_, refcount)
+        return refcount
+
+    def Release(self) -> int:  # noqa: N802
+        refcount = self._com.call("Release")
+        tracker = com_refcount._refcount_tracker  # noqa: SLF001
+        if tracker is not None:
+            tracker.released(self.address, self._interface_, refcount)
+        return refcount
+
+
+def _acquire(interface: type[RawInterface], address: int | None) -> RawInterface | None:
+    """Wrap an interface pointer the caller now owns a reference on (an out-parameter), None for NULL."""
+    if not address:
+        return None
+    tracker = com_refcount._refcount_tracker  # noqa: SLF001
+    if tracker is not None:
+        tracker.acquired(address, interface._interface_)
+    return interface.from_address(address)
+
+
+def _address_of(value: RawInterface | int | None) -> int | None:
+    return value.address if isinstance(value, RawInterface) else value
+
+
+def _compile_method(spec: InterfaceSpec, entry: Method, binding: type[COMBase], interfaces: dict[str, type[RawInterface]], names: set[str]) -> Callable[..., Any]:
+    """A comtypes-style method for `entry`. Out interface pointers are wrapped by looking their class up in `interfaces`
+    when called, since an interface may return one defined after it (IFileDialogEvents takes an IFileDialog)."""
+    argtypes = binding._dispatch_[entry.name].prototype._argtypes_[1:]  # Without `this`.
+    order: list[int] = []  # Index into the caller's arguments, or ~index into the out values.
+    unwrap: list[int] = []
+    out_types: list[Callable[[], Any]] = []
+    converters: list[Callable[[Any], Any]] = []
+    for param, argtype in zip(entry.params, argtypes):
+        interface = type_names(param.type) & names
+        if param.direction == "in":
+            if interface:
+                unwrap.append(len(order) - len(out_types))
+            order.append(len(order) - len(out_types))
+            continue
+        order.append(~len(out_types))
+        if interface:
+            (name,) = interface
+            out_types.append(c_void_p)
+            converters.append(lambda pointer, name=name: _acquire(interfaces[name], pointer.value))
+        elif argtype._type_ is c_wchar_p:
+            out_types.append(c_wchar_p)
+            converters.append(CoTaskMemString.take)
+        else:
+            out_types.append(argtype._type_)
+            converters.append(lambda value: value.value)
+
+    method_name = entry.name
+    description = f"{spec.name}.{method_name} failed"
+    arity = len(order) - len(out_types)
+    trailing_outs = order == [*range(arity), *(~i for i in range(len(out_types)))]
+    checks_hresult = entry.restype == "HRESULT"
+
+    def check_arguments(self: RawInterface, args: tuple) -> tuple | list:
+        if len(args) != arity:
+            raise TypeError(f"{self._interface_}.{method_name}() takes {arity} arguments ({len(args)} given)")
+        if unwrap:
+            args = list(args)  # pyright: ignore[reportAssignmentType]
+            for index in unwrap:
+                args[index] = _address_of(args[index])  # pyright: ignore[reportIndexIssue]
+        return args
+
+    # Specialized for the shapes nearly every shell method has: no out-parameters, or a single one after the inputs.
+    if not out_types:
+
+        def invoke(self: RawInterface, *args):
+            hr = self._com.call(method_name, *check_arguments(self, args))
+            if checks_hresult:
+                HRESULT.check(hr, description, ignore_s_false=True)
+            return hr
+
+    elif len(out_types) == 1 and trailing_outs:
+        (out_type,), (convert,) = out_types, converters
+
+        def invoke(self: RawInterface, *args):
+            out = out_type()
+            hr = self._com.call(method_name, *check_arguments(self, args), byref(out))
+            if checks_hresult:
+                HRESULT.check(hr, description, ignore_s_false=True)
+            return convert(out)
+
+    else:
+
+        def invoke(self: RawInterface, *args):
+            args = check_arguments(self, args)
+            outs = [new() for new in out_types]
+            hr = self._com.call(method_name, *[args[i] if i >= 0 else byref(outs[~i]) for i in order])
+            if checks_hresult:
+                HRESULT.check(hr, description, ignore_s_false=True)
+            return tuple(convert(out) for convert, out in zip(converters, outs))
+
+    invoke.__name__ = invoke.__qualname__ = method_name
+    return invoke
+
+
+_interfaces_lock = threading.Lock()
+_interfaces: dict[str, type[RawInterface]] = {}
+
+
+def raw_interfaces() -> dict[str, type[RawInterface]]:
+    """Interface name -> RawInterface subclass for every shell interface spec, built on first use."""
+    if _interfaces:
+        return _interfaces
+    with _interfaces_lock:
+        if not _interfaces:
+            module = bindings()
+            built: dict[str, type[RawInterface]] = {ROOT_INTERFACE: type("RawIUnknown", (RawInterface,), {"__slots__": (), "_binding_": module.IUnknown})}
+            names = {ROOT_INTERFACE, *(spec.name for spec in SHELL_INTERFACES)}
+            for spec in ordered(SHELL_INTERFACES):
+                binding = getattr(module, spec.name)
+                namespace: dict[str, Any] = {"__slots__": (), "_interface_": spec.name, "_binding_": binding}
+                namespace.update((entry.name, _compile_method(spec, entry, binding, built, names)) for entry in spec.methods)
+                built[spec.name] = type(f"Raw{spec.name}", (built[spec.parent],), namespace)
+            _interfaces.update(built)
+    return _interfaces
+
+
+def bindings() -> ModuleType:
+    """The raw COMBase bindings the wrappers call through."""
+    return load_interfaces(SHELL_INTERFACES, "raw")
+
+
+def create_instance(clsid: GUID, interface: str) -> RawInterface:
+    """CoCreateInstance(clsid) for `interface`, e.g. create_instance(CLSID_FileOpenDialog, "IFileOpenDialog")."""
+    if windll is None:
+        raise OSError("CoCreateInstance is only available on Windows")
+    target = raw_interfaces()[interface]
+    result = c_void_p()
+    HRESULT.check(_CoCreateInstance(byref(clsid), None, CLSCTX_INPROC_SERVER, byref(target._binding_._iid_), byref(result)), f"CoCreateInstance({interface}) failed")
+    return _acquire(target, result.value)  # pyright: ignore[reportReturnType]
+
+
+def create_shell_item(path: str) -> RawInterface:
+    """SHCreateItemFromParsingName(path) as a raw IShellItem."""
+    if windll is None:
+        raise OSError("SHCreateItemFromParsingName is only available on Windows")
+    target = raw_interfaces()["IShellItem"]
+    result = c_void_p()
+    HRESULT.check(_SHCreateItemFromParsingName(path, None, byref(target._binding_._iid_), byref(result)), f"Failed to create shell item from path: {path}")
+    return _acquire(target, result.value)  # pyright: ignore[reportReturnType]
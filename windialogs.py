@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import errno
 import os
+import sys
 
-from ctypes import POINTER, WINFUNCTYPE, byref, c_ulong, c_void_p, c_wchar_p, cast as cast_with_ctypes, windll
+from ctypes import POINTER, byref, c_ulong, c_void_p, c_wchar_p, cast as cast_with_ctypes
 from ctypes.wintypes import HMODULE, HWND, LPCWSTR
-from pathlib import WindowsPath
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Sequence
 
-import comtypes  # pyright: ignore[reportMissingTypeStubs]
-import comtypes.client  # pyright: ignore[reportMissingTypeStubs]
+import interfaces
 
 from com_helpers import HandleCOMCall
 from com_types import GUID
-from hresult import HRESULT, S_FALSE, S_OK
+from cotaskmem import CoTaskMemString, comtypes_display_name
+from filter_specs import FilterSet, Filters, filter_set
+from hresult import HRESULT, S_FALSE, S_OK, Cancelled, HRESULTError
 from interfaces import (
     COMDLG_FILTERSPEC,
     FOS_ALLOWMULTISELECT,
@@ -29,34 +32,55 @@ from interfaces import (
     CLSID_FileOpenDialog,
     CLSID_FileSaveDialog,
     COMFunctionPointers,
-    IFileDialogEvents,
-    IFileOpenDialog,
-    IFileSaveDialog,
-    IShellItem,
 )
 
 if TYPE_CHECKING:
-    from ctypes import _FuncPointer, _Pointer
-    from ctypes.wintypes import LPWSTR
+    from ctypes import _FuncPointer, _Pointer, c_int
 
-    from interfaces import IFileDialog, IShellItemArray
+    import comtypes  # pyright: ignore[reportMissingTypeStubs]
 
+    from com_server import COMServer
+    from interfaces import IFileDialog, IFileOpenDialog, IFileSaveDialog, IShellItem, IShellItemArray
+    from vtable_backend import RawInterface
 
-class FileDialogEventsHandler(comtypes.COMObject):
-    _com_interfaces_: Sequence[type[comtypes.IUnknown]] = [IFileDialogEvents]
+# How browse_folders/browse_files/save_file drive the dialog: "comtypes" goes through the comtypes interfaces of
+# interfaces.py, "raw" calls the IFileDialog/IShellItem/IShellItemArray vtables directly (vtable_backend), and
+# "simulated" makes the same raw calls into simulated_shell's Python dialogs over the local filesystem.
+# Each backend's modules (comtypes and windll, vtable_backend, simulated_shell) are imported by the first call that
+# selects it, not by importing this module: the simulated backend runs anywhere, comtypes is only needed for its own.
+DIALOG_BACKENDS: tuple[str, ...] = ("comtypes", "raw", "simulated")
+dialog_backend: str = os.environ.get("PYIFILEDIALOG_BACKEND", "comtypes")
+
+
+def set_dialog_backend(backend: str) -> None:
+    if backend not in DIALOG_BACKENDS:
+        raise ValueError(f"Unknown dialog backend {backend!r}, expected one of {DIALOG_BACKENDS}")
+    global dialog_backend  # noqa: PLW0603
+    dialog_backend = backend
+
+
+class FileDialogEventsHandler:
+    """IFileDialogEvents, written once for every backend: the methods get interface pointers with comtypes' calling
+    convention (RawInterface wrappers on the raw and simulated backends). createFileDialogEventsHandler() makes the
+    COM object for a dialog."""
 
     def OnFileOk(self, pfd: IFileDialog) -> HRESULT:
         ppsi: IShellItem = pfd.GetResult()
-        pszFilePath = ppsi.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        try:
+            with getDisplayName(ppsi, SIGDN.SIGDN_FILESYSPATH) as name:
+                pszFilePath = str(name)
+        finally:
+            releaseRaw(ppsi)
         print(f"OnFileOk, selected '{pszFilePath}'")
-        resolved_path = WindowsPath(pszFilePath).resolve()
+        resolved_path = Path(pszFilePath).resolve()
         if not resolved_path.exists():
             print(f"Invalid file selected: {resolved_path}")
             return S_FALSE  # Cancel closing the dialog
         return S_OK
 
     def OnFolderChanging(self, ifd: IFileDialog, isiFolder: IShellItem) -> HRESULT:  # noqa: N803
-        folder_path = isiFolder.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        with getDisplayName(isiFolder, SIGDN.SIGDN_FILESYSPATH) as name:
+            folder_path = str(name)
         print(f"OnFolderChanging to folder: {folder_path}")
         attributes = isiFolder.GetAttributes(0xFFFFFFFF)
         print(f"Folder attributes: {attributes}")
@@ -64,18 +88,27 @@ class FileDialogEventsHandler(comtypes.COMObject):
 
     def OnFolderChange(self, pfd: IFileDialog) -> HRESULT:
         folder: IShellItem = pfd.GetFolder()
-        folder_path = folder.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        try:
+            with getDisplayName(folder, SIGDN.SIGDN_FILESYSPATH) as name:
+                folder_path = str(name)
+        finally:
+            releaseRaw(folder)
         print(f"OnFolderChange, current folder: {folder_path}")
         return S_OK
 
     def OnSelectionChange(self, pfd: IFileDialog) -> HRESULT:
         selection: IShellItem = pfd.GetCurrentSelection()
-        selection_path = selection.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        try:
+            with getDisplayName(selection, SIGDN.SIGDN_FILESYSPATH) as name:
+                selection_path = str(name)
+        finally:
+            releaseRaw(selection)
         print(f"OnSelectionChange, selected item: {selection_path}")
         return S_OK
 
     def OnShareViolation(self, pfd: IFileDialog, psi: IShellItem) -> int:
-        file_path = psi.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        with getDisplayName(psi, SIGDN.SIGDN_FILESYSPATH) as name:
+            file_path = str(name)
         print(f"OnShareViolation for file: {file_path}!")
         return 1
 
@@ -85,12 +118,65 @@ class FileDialogEventsHandler(comtypes.COMObject):
         return S_OK
 
     def OnOverwrite(self, ifd: IFileDialog, isi: IShellItem) -> int:
-        file_path = isi.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
+        with getDisplayName(isi, SIGDN.SIGDN_FILESYSPATH) as name:
+            file_path = str(name)
         # 1 = Allow Overwrite, 0 will disallow
         print(f"OnOverwrite for file: {file_path}. Allowing overwrite!")
         return 1
 
 
+@lru_cache(maxsize=None)
+def _eventsHandlerType(raw: bool) -> type[FileDialogEventsHandler]:  # noqa: FBT001
+    """The COM class of FileDialogEventsHandler for comtypes dialogs, or for raw and simulated ones. Built once."""
+    if not raw:
+        import comtypes  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415
+
+        class ComtypesFileDialogEventsHandler(FileDialogEventsHandler, comtypes.COMObject):
+            _com_interfaces_: Sequence[type[comtypes.IUnknown]] = [interfaces.IFileDialogEvents]
+
+        return ComtypesFileDialogEventsHandler
+
+    import vtable_backend  # noqa: PLC0415
+
+    from com_server import COMServer  # noqa: PLC0415
+
+    wrappers = vtable_backend.raw_interfaces()
+
+    class RawFileDialogEventsHandler(FileDialogEventsHandler, COMServer):
+        """Called through its vtable with the raw arguments: wraps the (borrowed) interface pointers and writes the
+        out-parameters, then runs the shared handler."""
+
+        _com_interfaces_ = [vtable_backend.bindings().IFileDialogEvents]
+
+        def OnFileOk(self, pfd: int) -> HRESULT:  # pyright: ignore[reportIncompatibleMethodOverride]
+            return super().OnFileOk(wrappers["IFileDialog"].from_address(pfd))  # pyright: ignore[reportArgumentType]
+
+        def OnFolderChanging(self, ifd: int, isiFolder: int) -> HRESULT:  # noqa: N803  # pyright: ignore[reportIncompatibleMethodOverride]
+            return super().OnFolderChanging(wrappers["IFileDialog"].from_address(ifd), wrappers["IShellItem"].from_address(isiFolder))  # pyright: ignore[reportArgumentType]
+
+        def OnFolderChange(self, pfd: int) -> HRESULT:  # pyright: ignore[reportIncompatibleMethodOverride]
+            return super().OnFolderChange(wrappers["IFileDialog"].from_address(pfd))  # pyright: ignore[reportArgumentType]
+
+        def OnSelectionChange(self, pfd: int) -> HRESULT:  # pyright: ignore[reportIncompatibleMethodOverride]
+            return super().OnSelectionChange(wrappers["IFileDialog"].from_address(pfd))  # pyright: ignore[reportArgumentType]
+
+        def OnShareViolation(self, pfd: int, psi: int, pResponse: _Pointer[c_int]) -> None:  # noqa: N803  # pyright: ignore[reportIncompatibleMethodOverride]
+            pResponse[0] = super().OnShareViolation(wrappers["IFileDialog"].from_address(pfd), wrappers["IShellItem"].from_address(psi))  # pyright: ignore[reportArgumentType]
+
+        def OnTypeChange(self, ifd: int) -> HRESULT:  # pyright: ignore[reportIncompatibleMethodOverride]
+            return super().OnTypeChange(wrappers["IFileDialog"].from_address(ifd))  # pyright: ignore[reportArgumentType]
+
+        def OnOverwrite(self, ifd: int, isi: int, pResponse: _Pointer[c_int]) -> None:  # noqa: N803  # pyright: ignore[reportIncompatibleMethodOverride]
+            pResponse[0] = super().OnOverwrite(wrappers["IFileDialog"].from_address(ifd), wrappers["IShellItem"].from_address(isi))  # pyright: ignore[reportArgumentType]
+
+    return RawFileDialogEventsHandler
+
+
+def createFileDialogEventsHandler(fileDialog: Any) -> comtypes.COMObject | COMServer:  # noqa: N803
+    """A new FileDialogEventsHandler COM object for the backend `fileDialog` comes from, holding one reference."""
+    return _eventsHandlerType(isRaw(fileDialog))()
+
+
 # Helper to convert std::wstring to LPCWSTR
 def string_to_LPCWSTR(s: str) -> LPCWSTR:
     return c_wchar_p(s)
@@ -103,6 +189,8 @@ def LPCWSTR_to_string(s: LPCWSTR) -> str | None:
 
 # Load COM function pointers
 def LoadCOMFunctionPointers(dialog_type: type[IFileDialog | IFileOpenDialog | IFileSaveDialog]) -> COMFunctionPointers:
+    from ctypes import WINFUNCTYPE  # noqa: PLC0415
+
     comFuncPtrs = COMFunctionPointers()
     comFuncPtrs.hOle32 = comFuncPtrs.load_library("ole32.dll")
     comFuncPtrs.hShell32 = comFuncPtrs.load_library("shell32.dll")
@@ -120,12 +208,14 @@ def LoadCOMFunctionPointers(dialog_type: type[IFileDialog | IFileOpenDialog | IF
         comFuncPtrs.pCoTaskMemFree = comFuncPtrs.resolve_function(comFuncPtrs.hOle32, b"CoTaskMemFree", PFN_CoTaskMemFree)
 
     if comFuncPtrs.hShell32:
-        PFN_SHCreateItemFromParsingName: type[_FuncPointer] = WINFUNCTYPE(HRESULT, LPCWSTR, c_void_p, POINTER(GUID), POINTER(POINTER(IShellItem)))
+        PFN_SHCreateItemFromParsingName: type[_FuncPointer] = WINFUNCTYPE(HRESULT, LPCWSTR, c_void_p, POINTER(GUID), POINTER(POINTER(interfaces.IShellItem)))
         comFuncPtrs.pSHCreateItemFromParsingName = comFuncPtrs.resolve_function(comFuncPtrs.hShell32, b"SHCreateItemFromParsingName", PFN_SHCreateItemFromParsingName)
     return comFuncPtrs
 
 
 def FreeCOMFunctionPointers(comFuncPtrs: Any):  # noqa: N803
+    from ctypes import windll  # noqa: PLC0415
+
     if comFuncPtrs.hOle32:
         windll.kernel32.FreeLibrary(cast_with_ctypes(comFuncPtrs.hOle32, HMODULE))
     if comFuncPtrs.hShell32:
@@ -136,24 +226,49 @@ def showDialog(
     fileDialog: IFileOpenDialog | IFileSaveDialog | IFileDialog,  # noqa: N803
     hwndOwner: HWND,  # noqa: N803
 ) -> bool:
-    """Shows the IFileDialog. Returns True if the user progressed to the end and found a file. False if they cancelled."""
-    hr: HRESULT | int = -1
+    """Shows the IFileDialog. Returns True if the user progressed to the end and found a file. False if they cancelled
+    or the dialog failed (which is printed)."""
     try:
-        hr = fileDialog.Show(hwndOwner)
-    except OSError as e:
-        CANCELLED_BY_USER = 0x800704C7
-        if e.winerror == CANCELLED_BY_USER:
-            return False
-        if hr != -1:
-            raise HRESULT(hr).exception("Failed to show the file dialog!") from e  # noqa: B904
+        with HandleCOMCall("Show") as check:  # Turns comtypes' COMError into the same typed HRESULTError as the raw backends.
+            check(fileDialog.Show(hwndOwner))
+    except Cancelled:
         return False
-    else:
-        return True
-
-
-def createShellItem(comFuncs: Any, path: str) -> _Pointer[IShellItem]:  # noqa: N803, ARG001
+    except HRESULTError as e:
+        print(f"Failed to show the file dialog: {e}")
+        return False
+    return True
+
+
+def createFileDialog(clsid: GUID, interface: type[IFileOpenDialog | IFileSaveDialog] | str) -> IFileOpenDialog | IFileSaveDialog | RawInterface:
+    """CoCreateInstance on the selected backend. `interface` is a comtypes interface of interfaces.py or its name."""
+    name = interface if isinstance(interface, str) else interface.__name__
+    if dialog_backend == "raw":
+        import vtable_backend  # noqa: PLC0415
+        return vtable_backend.create_instance(clsid, name)
+    if dialog_backend == "simulated":
+        import simulated_shell  # noqa: PLC0415
+        return simulated_shell.create_file_dialog(clsid, name)
+    if dialog_backend != "comtypes":
+        raise ValueError(f"Unknown dialog backend {dialog_backend!r}, expected one of {DIALOG_BACKENDS}")
+    import comtypes.client  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415
+    return comtypes.client.CreateObject(clsid, interface=getattr(interfaces, name))
+
+
+def loadBackend(dialog_type: str) -> COMFunctionPointers | None:
+    """The exported functions the comtypes backend calls (LoadCOMFunctionPointers). The others need none."""
+    return LoadCOMFunctionPointers(getattr(interfaces, dialog_type)) if dialog_backend == "comtypes" else None
+
+
+def createShellItem(comFuncs: Any, path: str) -> _Pointer[IShellItem] | RawInterface:  # noqa: N803, ARG001
+    if dialog_backend == "raw":
+        import vtable_backend  # noqa: PLC0415
+        return vtable_backend.create_shell_item(path)
+    if dialog_backend == "simulated":
+        import simulated_shell  # noqa: PLC0415
+        return simulated_shell.create_shell_item(path)
     if not comFuncs.pSHCreateItemFromParsingName:
         raise OSError("comFuncs.pSHCreateItemFromParsingName not found")
+    IShellItem = interfaces.IShellItem  # noqa: N806
     shell_item = POINTER(IShellItem)()
     hr = comFuncs.pSHCreateItemFromParsingName(path, None, IShellItem._iid_, byref(shell_item))
     if hr != S_OK:
@@ -161,6 +276,51 @@ def createShellItem(comFuncs: Any, path: str) -> _Pointer[IShellItem]:  # noqa:
     return shell_item
 
 
+def getDisplayName(shellItem: IShellItem | RawInterface, sigdn: int) -> CoTaskMemString:  # noqa: N803
+    """IShellItem.GetDisplayName as an owned string, freed once on close (use it in a with-statement)."""
+    if isRaw(shellItem):
+        name = shellItem.GetDisplayName(sigdn)  # pyright: ignore[reportAttributeAccessIssue]
+    else:
+        name = comtypes_display_name(shellItem, sigdn)
+    if name is None:
+        raise FileNotFoundError(errno.ENOENT, "GetDisplayName returned no name")
+    return name
+
+
+def isRaw(pointer: Any) -> bool:
+    """Whether `pointer` is a raw or simulated interface pointer (a RawInterface) rather than a comtypes one."""
+    vtable_backend = sys.modules.get("vtable_backend")  # Not imported: no raw pointer can exist yet.
+    return vtable_backend is not None and isinstance(pointer, vtable_backend.RawInterface)
+
+
+def releaseRaw(pointer: Any) -> None:
+    """Release a raw or simulated interface pointer. comtypes pointers release themselves when they are collected."""
+    if isRaw(pointer):
+        pointer.Release()
+
+
+def getParentDisplayName(shellItem: IShellItem | RawInterface, sigdn: int) -> str | None:  # noqa: N803
+    """The display name of shellItem's parent, releasing every reference GetParent hands out."""
+    parentItem: IShellItem | comtypes.IUnknown | RawInterface = shellItem.GetParent()
+    if isRaw(parentItem):
+        # Declared as an IUnknown out-parameter: the raw backends return a RawIUnknown to QueryInterface.
+        try:
+            parentShellItem = parentItem.QueryInterface("IShellItem")  # pyright: ignore[reportAttributeAccessIssue]
+        finally:
+            parentItem.Release()
+        try:
+            with getDisplayName(parentShellItem, sigdn) as szParentName:
+                return str(szParentName)
+        finally:
+            parentShellItem.Release()
+    if hasattr(parentItem, "GetDisplayName"):
+        with getDisplayName(parentItem, sigdn) as szParentName:  # pyright: ignore[reportArgumentType]
+            parentName = str(szParentName)
+        parentItem.Release()
+        return parentName
+    return None
+
+
 def setDialogAttributes(
     fileDialog: IFileDialog | IFileOpenDialog | IFileSaveDialog,  # noqa: N803
     title: str,
@@ -178,12 +338,16 @@ def setDialogAttributes(
 def setupFileDialogEvents(
     fileDialog: IFileOpenDialog | IFileSaveDialog | IFileDialog,  # noqa: N803
 ) -> int:
-    #events_interface = IFileDialogEvents()
-    events_handler = FileDialogEventsHandler()
-    return fileDialog.Advise(events_handler)
+    events_handler = createFileDialogEventsHandler(fileDialog)
+    if not isRaw(fileDialog):
+        return fileDialog.Advise(events_handler)
+    try:
+        return fileDialog.Advise(events_handler.com_pointer())  # pyright: ignore[reportAttributeAccessIssue]
+    finally:
+        events_handler.Release()  # The dialog holds its own reference until Unadvise.
 
 
-DEFAULT_FILTERS: list[COMDLG_FILTERSPEC] = [
+DEFAULT_FILTERS: FilterSet = filter_set([
     COMDLG_FILTERSPEC("All Files", "*.*"),
     COMDLG_FILTERSPEC("Text Files", "*.txt"),
     COMDLG_FILTERSPEC("Image Files", "*.png;*.jpg;*.jpeg;*.bmp;*.gif"),
@@ -234,43 +398,44 @@ DEFAULT_FILTERS: list[COMDLG_FILTERSPEC] = [
     COMDLG_FILTERSPEC("Terraform Files", "*.tf"),
     COMDLG_FILTERSPEC("HCL Files", "*.hcl"),
     COMDLG_FILTERSPEC("Kubernetes YAML Files", "*.yaml;*.yml")
-]
+])
 
 
 def configureFileDialog(  # noqa: PLR0913
     comFuncs: Any,  # noqa: N803
     fileDialog: IFileOpenDialog | IFileSaveDialog | IFileDialog,  # noqa: N803
-    filters: list[COMDLG_FILTERSPEC] | None = None,  # noqa: N803
+    filters: Filters | None = None,  # noqa: N803
     defaultFolder: str | os.PathLike | None = None,  # noqa: N803
     options: int | None = None,
-):
+) -> FilterSet:
+    """Apply the folder, options and file types. Returns the FilterSet SetFileTypes was given: keep it while the
+    dialog is in use, the dialog reads its strings in place."""
     if defaultFolder:
-        defaultFolder_path: WindowsPath = WindowsPath(defaultFolder).resolve()
+        defaultFolder_path: Path = Path(defaultFolder).resolve()
         defaultFolder_pathStr = str(defaultFolder_path)
         if not defaultFolder_path.is_dir():
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), defaultFolder_pathStr)
-        shell_item: comtypes._Pointer[IShellItem] = createShellItem(comFuncs, defaultFolder_pathStr)
-        with HandleCOMCall(f"SetFolder({defaultFolder_pathStr})") as check:
-            check(fileDialog.SetFolder(shell_item))
-        with HandleCOMCall(f"SetDefaultFolder({defaultFolder_pathStr})") as check:
-            check(fileDialog.SetDefaultFolder(shell_item))
+        shell_item: comtypes._Pointer[IShellItem] | RawInterface = createShellItem(comFuncs, defaultFolder_pathStr)
+        try:
+            with HandleCOMCall(f"SetFolder({defaultFolder_pathStr})", "SetFolder") as check:
+                check(fileDialog.SetFolder(shell_item))
+            with HandleCOMCall(f"SetDefaultFolder({defaultFolder_pathStr})", "SetDefaultFolder") as check:
+                check(fileDialog.SetDefaultFolder(shell_item))
+        finally:
+            releaseRaw(shell_item)  # The dialog holds its own references.
 
     if options is not None:
-        with HandleCOMCall(f"SetOptions({options})") as check:
+        with HandleCOMCall(f"SetOptions({options})", "SetOptions") as check:
             check(fileDialog.SetOptions(options))
         cur_options = fileDialog.GetOptions()
         assert options == cur_options
 
-    if filters is None:  # if empty actually leave it empty. None means default.
-        filters = DEFAULT_FILTERS
-    filter_array = (COMDLG_FILTERSPEC * len(filters))()
-    for i, dialogFilter in enumerate(filters):
-        filter_array[i].pszName = dialogFilter.pszName
-        filter_array[i].pszSpec = dialogFilter.pszSpec
-
-    #hr = fileDialog.SetFileTypes(len(filters), c_void_p(addressof(filter_array)))
-    #if hr != S_OK:
-    #    raise HRESULT(hr).exception("Failed to set file types")
+    # None means the defaults; an empty list leaves the dialog without file types.
+    file_types: FilterSet = filter_set(DEFAULT_FILTERS if filters is None else filters)
+    if file_types:
+        with HandleCOMCall(f"SetFileTypes({file_types.count})", "SetFileTypes") as check:
+            check(fileDialog.SetFileTypes(file_types.count, file_types.address))
+    return file_types
 
 
 def browse_folders(
@@ -279,8 +444,8 @@ def browse_folders(
     allow_multiple: bool = False,  # noqa: FBT001, FBT002
     show_hidden: bool = False  # noqa: FBT001, FBT002
 ) -> list[str]:
-    comFuncs: COMFunctionPointers = LoadCOMFunctionPointers(IFileOpenDialog)
-    fileOpenDialog: IFileOpenDialog = comtypes.client.CreateObject(CLSID_FileOpenDialog, interface=IFileOpenDialog)
+    comFuncs: COMFunctionPointers | None = loadBackend("IFileOpenDialog")
+    fileOpenDialog: IFileOpenDialog = createFileDialog(CLSID_FileOpenDialog, "IFileOpenDialog")  # pyright: ignore[reportAssignmentType]
 
     options: int = FOS_PICKFOLDERS | FOS_FORCEFILESYSTEM | FOS_PATHMUSTEXIST | FOS_FILEMUSTEXIST
     if allow_multiple:
@@ -288,22 +453,25 @@ def browse_folders(
     if show_hidden:
         options |= FOS_FORCESHOWHIDDEN
 
-    filters = []
-    configureFileDialog(comFuncs, fileOpenDialog, filters, default_folder, options)
-    setDialogAttributes(fileOpenDialog, title)
-    showDialog(fileOpenDialog, HWND(0))
+    try:
+        file_types: FilterSet = configureFileDialog(comFuncs, fileOpenDialog, [], default_folder, options)  # noqa: F841  # Held until the dialog is done.
+        setDialogAttributes(fileOpenDialog, title)
+        if not showDialog(fileOpenDialog, HWND(0)):
+            return []
 
-    return getFileOpenDialogResults(comFuncs, fileOpenDialog)
+        return getFileOpenDialogResults(comFuncs, fileOpenDialog)
+    finally:
+        releaseRaw(fileOpenDialog)
 
 def browse_files(
     title: str = "Select File(s)",
     default_folder: str = "C:\\",
     allow_multiple: bool = False,  # noqa: FBT001, FBT002
     show_hidden: bool = True,  # noqa: FBT001, FBT002
-    filters: list[COMDLG_FILTERSPEC] | None = None
+    filters: Filters | None = None
 ) -> list[str]:
-    comFuncs: COMFunctionPointers = LoadCOMFunctionPointers(IFileOpenDialog)
-    fileOpenDialog: IFileOpenDialog = comtypes.client.CreateObject(CLSID_FileOpenDialog, interface=IFileOpenDialog)
+    comFuncs: COMFunctionPointers | None = loadBackend("IFileOpenDialog")
+    fileOpenDialog: IFileOpenDialog = createFileDialog(CLSID_FileOpenDialog, "IFileOpenDialog")  # pyright: ignore[reportAssignmentType]
 
     options: int = FOS_FORCEFILESYSTEM | FOS_PATHMUSTEXIST | FOS_FILEMUSTEXIST
     if allow_multiple:
@@ -311,15 +479,16 @@ def browse_files(
     if show_hidden:
         options |= FOS_FORCESHOWHIDDEN
 
-    if filters is None:
-        filters = DEFAULT_FILTERS
-
-    configureFileDialog(comFuncs, fileOpenDialog, filters, default_folder, options)
-    setDialogAttributes(fileOpenDialog, title)
-    showDialog(fileOpenDialog, HWND(0))
+    try:
+        file_types: FilterSet = configureFileDialog(comFuncs, fileOpenDialog, filters, default_folder, options)  # noqa: F841  # Held until the dialog is done.
+        setDialogAttributes(fileOpenDialog, title)
+        if not showDialog(fileOpenDialog, HWND(0)):
+            return []
 
-    results: list[str] = getFileOpenDialogResults(comFuncs, fileOpenDialog)
-    return results
+        results: list[str] = getFileOpenDialogResults(comFuncs, fileOpenDialog)
+        return results
+    finally:
+        releaseRaw(fileOpenDialog)
 
 def save_file(
     title: str = "Save File",
@@ -327,10 +496,10 @@ def save_file(
     default_file_name: str = "Untitled",
     overwrite_prompt: bool = True,
     show_hidden: bool = False,
-    filters: list[COMDLG_FILTERSPEC] | None = None
+    filters: Filters | None = None
 ) -> str:
-    comFuncs: COMFunctionPointers = LoadCOMFunctionPointers(IFileSaveDialog)
-    fileSaveDialog: IFileSaveDialog = comtypes.client.CreateObject(CLSID_FileSaveDialog, interface=IFileSaveDialog)
+    comFuncs: COMFunctionPointers | None = loadBackend("IFileSaveDialog")
+    fileSaveDialog: IFileSaveDialog = createFileDialog(CLSID_FileSaveDialog, "IFileSaveDialog")  # pyright: ignore[reportAssignmentType]
 
     options = FOS_FORCEFILESYSTEM | FOS_PATHMUSTEXIST | FOS_FILEMUSTEXIST
     if overwrite_prompt:
@@ -338,16 +507,17 @@ def save_file(
     if show_hidden:
         options |= FOS_FORCESHOWHIDDEN
 
-    if filters is None:
-        filters = DEFAULT_FILTERS
-
-    configureFileDialog(comFuncs, fileSaveDialog, filters, default_folder, options)
-    setDialogAttributes(fileSaveDialog, title)
-    fileSaveDialog.SetFileName(default_file_name)
-    showDialog(fileSaveDialog, HWND(0))
+    try:
+        file_types: FilterSet = configureFileDialog(comFuncs, fileSaveDialog, filters, default_folder, options)  # noqa: F841  # Held until the dialog is done.
+        setDialogAttributes(fileSaveDialog, title)
+        fileSaveDialog.SetFileName(default_file_name)
+        if not showDialog(fileSaveDialog, HWND(0)):
+            return ""
 
-    result: str = getFileSaveDialogResults(comFuncs, fileSaveDialog)
-    return result
+        result: str = getFileSaveDialogResults(comFuncs, fileSaveDialog)
+        return result
+    finally:
+        releaseRaw(fileSaveDialog)
 
 
 def getFileOpenDialogResults(  # noqa: C901, PLR0912, PLR0915
@@ -356,32 +526,30 @@ def getFileOpenDialogResults(  # noqa: C901, PLR0912, PLR0915
 ) -> list[str]:
     results: list[str] = []
     resultsArray: IShellItemArray = fileOpenDialog.GetResults()
-    itemCount: int = resultsArray.GetCount()
-
-    for i in range(itemCount):
-        shell_item: IShellItem = resultsArray.GetItemAt(i)
-        szFilePath: str = shell_item.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
-        szFilePathStr = str(szFilePath)
-        if szFilePathStr and szFilePathStr.strip():
-            results.append(szFilePathStr)
-            print(f"Item {i} file path: {szFilePath}")
-            #comFuncs.pCoTaskMemFree(szFilePath)   # line crashes
-        else:
-            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(szFilePath))
-
-        attributes: c_ulong = shell_item.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
-        print(f"Item {i} attributes: {attributes}")
-
-        parentItem: IShellItem | comtypes.IUnknown = shell_item.GetParent()
-        if isinstance(parentItem, IShellItem) or hasattr(parentItem, "GetDisplayName"):
-            szParentName: LPWSTR | str = parentItem.GetDisplayName(SIGDN.SIGDN_NORMALDISPLAY)
-            print(f"Item {i} parent: {szParentName}")
-            comFuncs.pCoTaskMemFree(szParentName)
-            parentItem.Release()
-
-        shell_item.Release()
-
-    resultsArray.Release()
+    try:
+        itemCount: int = resultsArray.GetCount()
+
+        for i in range(itemCount):
+            shell_item: IShellItem = resultsArray.GetItemAt(i)
+            try:
+                with getDisplayName(shell_item, SIGDN.SIGDN_FILESYSPATH) as szFilePath:
+                    szFilePathStr = str(szFilePath)
+                if szFilePathStr and szFilePathStr.strip():
+                    results.append(szFilePathStr)
+                    print(f"Item {i} file path: {szFilePathStr}")
+                else:
+                    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), szFilePathStr)
+
+                attributes: c_ulong = shell_item.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
+                print(f"Item {i} attributes: {attributes}")
+
+                parentName = getParentDisplayName(shell_item, SIGDN.SIGDN_NORMALDISPLAY)
+                if parentName is not None:
+                    print(f"Item {i} parent: {parentName}")
+            finally:
+                shell_item.Release()
+    finally:
+        resultsArray.Release()
     return results
 
 
@@ -391,26 +559,23 @@ def getFileSaveDialogResults(  # noqa: C901, PLR0912, PLR0915
 ) -> str:
     results = ""
     resultItem: IShellItem = fileSaveDialog.GetResult()
+    try:
+        with getDisplayName(resultItem, SIGDN.SIGDN_FILESYSPATH) as szFilePath:
+            szFilePathStr = str(szFilePath)
+        if szFilePathStr and szFilePathStr.strip():
+            results = szFilePathStr
+            print(f"Selected file path: {szFilePathStr}")
+        else:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), szFilePathStr)
 
-    szFilePath = resultItem.GetDisplayName(SIGDN.SIGDN_FILESYSPATH)
-    szFilePathStr = str(szFilePath)
-    if szFilePathStr and szFilePathStr.strip():
-        results = szFilePathStr
-        print(f"Selected file path: {szFilePath}")
-    else:
-        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(szFilePath))
-
-    attributes: c_ulong = resultItem.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
-    print(f"Selected item attributes: {attributes}")
-
-    parentItem: IShellItem | comtypes.IUnknown = resultItem.GetParent()
-    if isinstance(parentItem, IShellItem) or hasattr(parentItem, "GetDisplayName"):
-        szParentName: LPWSTR | str = parentItem.GetDisplayName(SIGDN.SIGDN_NORMALDISPLAY)
-        print(f"Selected item parent: {szParentName}")
-        comFuncs.pCoTaskMemFree(szParentName)
-        parentItem.Release()
+        attributes: c_ulong = resultItem.GetAttributes(SFGAO_FILESYSTEM | SFGAO_FOLDER)
+        print(f"Selected item attributes: {attributes}")
 
-    resultItem.Release()
+        parentName = getParentDisplayName(resultItem, SIGDN.SIGDN_NORMALDISPLAY)
+        if parentName is not None:
+            print(f"Selected item parent: {parentName}")
+    finally:
+        resultItem.Release()
 
     return results
 